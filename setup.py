@@ -38,12 +38,13 @@ PROJECT_URLS = {
 }
 
 INSTALL_REQUIRES = [
-    'pandas<=0.23.*',
+    'pandas>=0.24',
     'sortedcontainers<=1.6.*'
 ]
 
 EXTRAS_REQUIRE = {
     'dev': ['check-manifest'],
+    'pyarrow': ['pyarrow'],
     'test': [
         'tox',
         'pylint',
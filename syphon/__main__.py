@@ -23,13 +23,19 @@ def _main(args: list) -> int:
     Returns:
         int: An integer exit code. `0` for success or `1` for failure.
     """
+    from os import devnull, dup2, open as open_fd, O_WRONLY
     from os.path import abspath, join
+    from sys import stderr, stdout
     from sortedcontainers import SortedDict
 
     from syphon.archive import archive
     from syphon.build_ import build
+    from syphon.build_._sample import parse as parse_sample
+    from syphon.build_.build import STDOUT
+    from syphon.build_._where import parse as parse_where
+    from syphon.catalog import catalog
     from syphon.init import init
-    from syphon.schema import load
+    from syphon.schema import load, parse_dtypes
 
     from . import Context, get_parser, __version__
 
@@ -51,18 +57,70 @@ def _main(args: list) -> int:
 
     this_context = Context()
 
+    this_context.check_catalog = getattr(args, 'check_catalog', False)
+    this_context.distinct = getattr(args, 'distinct', False)
+    this_context.incremental = getattr(args, 'incremental', False)
     this_context.overwrite = args.force
+    this_context.raw = getattr(args, 'raw', False)
+    this_context.update = getattr(args, 'update', False)
     this_context.verbose = args.verbose
 
+    if getattr(args, 'agg', None) is not None:
+        this_context.agg = args.agg
+
+    if getattr(args, 'chunksize', False):
+        this_context.chunksize = args.chunksize
+
+    if getattr(args, 'columns', None) is not None:
+        this_context.columns = args.columns.split(',')
+
+    if getattr(args, 'combine', False):
+        this_context.combine = args.combine
+
     if getattr(args, 'data', False):
         this_context.data = abspath(args.data)
 
+    if getattr(args, 'distinct_buffer', False):
+        this_context.distinct_buffer = args.distinct_buffer
+
+    if getattr(args, 'distinct_key', None) is not None:
+        this_context.distinct_key = args.distinct_key.split(',')
+
     if getattr(args, 'destination', False):
-        if getattr(args, 'build', False):
+        if getattr(args, 'build', False) and args.destination == STDOUT:
+            this_context.cache = STDOUT
+        elif getattr(args, 'build', False):
             this_context.cache = abspath(args.destination)
         else:
             this_context.archive = abspath(args.destination)
 
+    if getattr(args, 'engine', False):
+        this_context.engine = args.engine
+
+    if getattr(args, 'filter', None) is not None:
+        this_context.filter = args.filter
+
+    if getattr(args, 'format', None) is not None:
+        this_context.format = args.format
+
+    if getattr(args, 'group_by', None) is not None:
+        this_context.group_by = args.group_by.split(',')
+
+    if getattr(args, 'jobs', False):
+        this_context.jobs = args.jobs
+
+    if getattr(args, 'limit', None) is not None:
+        this_context.limit = args.limit
+
+    if getattr(args, 'max_rows', None) is not None:
+        this_context.max_rows = args.max_rows
+
+    if getattr(args, 'provenance', False):
+        this_context.provenance = args.provenance
+
+    if getattr(args, 'queue_depth', False):
+        this_context.queue_depth = args.queue_depth
+
     if getattr(args, 'headers', False):
         this_context.schema = SortedDict()
         index = 0
@@ -70,9 +128,40 @@ def _main(args: list) -> int:
             this_context.schema['{}'.format(index)] = header
             index += 1
 
+    if getattr(args, 'seed', None) is not None:
+        this_context.seed = args.seed
+
+    if getattr(args, 'shards', None) is not None:
+        this_context.shards = args.shards
+
+    if getattr(args, 'sort_buffer', False):
+        this_context.sort_buffer = args.sort_buffer
+
+    if getattr(args, 'sort_by', None) is not None:
+        this_context.sort_by = args.sort_by.split(',')
+
+    if getattr(args, 'split_by', None) is not None:
+        this_context.split_by = args.split_by
+
     if getattr(args, 'source', False):
         this_context.archive = abspath(args.source)
 
+    if getattr(args, 'typed', False):
+        this_context.typed = args.typed
+
+    try:
+        if getattr(args, 'dtype', None) is not None:
+            this_context.dtypes = parse_dtypes(args.dtype)
+
+        if getattr(args, 'sample', None) is not None:
+            this_context.sample = parse_sample(args.sample)
+
+        if getattr(args, 'where', None) is not None:
+            this_context.where = parse_where(args.where)
+    except ValueError as err:
+        print(str(err), file=stderr)
+        return 1
+
     if getattr(args, 'metadata', False):
         if args.metadata is not None:
             this_context.meta = abspath(args.metadata)
@@ -86,10 +175,17 @@ def _main(args: list) -> int:
         if getattr(args, 'init', False):
             init(this_context)
 
+        if getattr(args, 'catalog', False):
+            catalog(this_context)
+
         if getattr(args, 'build', False):
             build(this_context)
-    except OSError as err:
-        print(str(err))
+    except BrokenPipeError:
+        # the reader of the output went away, so stop writing to it
+        dup2(open_fd(devnull, O_WRONLY), stdout.fileno())
+        return 1
+    except (OSError, ValueError) as err:
+        print(str(err), file=stderr)
         return 1
 
     return 0
@@ -10,6 +10,8 @@ import argparse
 def get_parser() -> argparse.ArgumentParser:
     """Return `ArgumentParser` used to parse `syphon` arguments."""
     from . import __url__
+    from ._csvengine import ENGINES, PANDAS
+    from .build_._arrowwriter import FORMATS
 
     epilog_last_line = 'Syphon home page: <{}>'.format(__url__)
 
@@ -97,6 +99,54 @@ def get_parser() -> argparse.ArgumentParser:
         default=None,
         help='metadata file or glob pattern',
         required=False)
+    # optional write-combining
+    archive_parser.add_argument(
+        '-c',
+        '--combine',
+        default=None,
+        help='write all data in a single file per archive directory',
+        metavar='FILENAME',
+        required=False)
+    # optional csv engine
+    archive_parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default=PANDAS,
+        help='csv reader and writer (default: %(default)s)',
+        required=False)
+    # optional number of writer threads
+    archive_parser.add_argument(
+        '-j',
+        '--jobs',
+        default=1,
+        help='number of threads writing archive files (default: '
+             '%(default)s)',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional provenance column
+    archive_parser.add_argument(
+        '--provenance',
+        default=None,
+        help='add a column containing the name of each data file',
+        metavar='COLUMN',
+        required=False)
+    # optional maximum pipeline queue length
+    archive_parser.add_argument(
+        '--queue-depth',
+        default=2,
+        help='number of files read ahead of the writers (default: '
+             '%(default)s)',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional raw mode
+    archive_parser.add_argument(
+        '--raw',
+        action='store_true',
+        default=False,
+        help='copy data file lines without parsing non-schema columns',
+        required=False)
 
     # build command
     # create build subcommand parser
@@ -118,7 +168,242 @@ def get_parser() -> argparse.ArgumentParser:
     # required destination file
     build_parser.add_argument(
         'destination',
-        help='filename of the output file')
+        help='filename of the output file, or - to write csv to standard '
+             'output')
+    # optional streaming
+    build_parser.add_argument(
+        '--chunksize',
+        default=None,
+        help='stream archive files N rows at a time',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional csv engine
+    build_parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default=PANDAS,
+        help='csv reader and writer (default: %(default)s)',
+        required=False)
+    # optional catalog check
+    build_parser.add_argument(
+        '--check-catalog',
+        action='store_true',
+        default=False,
+        help='warn about archive files that are missing from the '
+             'catalog, which lists each cataloged archive directory',
+        required=False)
+    # optional column projection
+    build_parser.add_argument(
+        '--columns',
+        default=None,
+        help='only build the given columns, in the given order',
+        metavar='COLUMN[,...]',
+        required=False)
+    # optional row filter
+    build_parser.add_argument(
+        '--filter',
+        default=None,
+        help='only build rows that match EXPRESSION, '
+             'e.g. "temperature > 85 and status == FAIL"',
+        metavar='EXPRESSION',
+        required=False)
+    # optional output format
+    build_parser.add_argument(
+        '--format',
+        choices=FORMATS,
+        default=None,
+        help='output file format (default: by extension, ".arrow", '
+             '".feather" and ".ipc" are feather, anything else is csv)',
+        required=False)
+    # optional typed columns
+    build_parser.add_argument(
+        '--typed',
+        action='store_true',
+        default=False,
+        help='read columns as the types saved by init and archive '
+             'instead of as strings',
+        required=False)
+    # optional incremental build
+    build_parser.add_argument(
+        '-i',
+        '--incremental',
+        action='store_true',
+        default=False,
+        help='append new archive files to an existing output file',
+        required=False)
+    # optional up to date check
+    build_parser.add_argument(
+        '-u',
+        '--update',
+        action='store_true',
+        default=False,
+        help='only build if the archive or the options changed since the '
+             'output file was built',
+        required=False)
+    # optional partition pruning
+    build_parser.add_argument(
+        '-w',
+        '--where',
+        action='append',
+        default=None,
+        help='only build archive directories where each schema COLUMN '
+             'has one of the given values',
+        metavar='COLUMN=VALUE[,...]',
+        required=False)
+    # optional number of reader threads
+    build_parser.add_argument(
+        '-j',
+        '--jobs',
+        default=1,
+        help='number of threads reading archive files (default: '
+             '%(default)s)',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional sharded output
+    shard_group = build_parser.add_mutually_exclusive_group()
+    shard_group.add_argument(
+        '--shards',
+        default=None,
+        help='split the output into N files of roughly equal size, '
+             'cannot be used with --distinct',
+        metavar='N',
+        required=False,
+        type=int)
+    shard_group.add_argument(
+        '--max-rows-per-file',
+        default=None,
+        dest='max_rows',
+        help='split the output into files of at most N rows',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional sorted output
+    build_parser.add_argument(
+        '--sort-by',
+        default=None,
+        help='sort the output by the given columns',
+        metavar='COLUMN[,...]',
+        required=False)
+    # optional sort memory budget
+    build_parser.add_argument(
+        '--sort-buffer',
+        default=1000000,
+        help='number of rows sorted in memory before spilling to a '
+             'temporary file (default: %(default)s)',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional deduplication
+    build_parser.add_argument(
+        '--distinct',
+        action='store_true',
+        default=False,
+        help='drop duplicate rows',
+        required=False)
+    # optional deduplication key
+    build_parser.add_argument(
+        '--key',
+        default=None,
+        dest='distinct_key',
+        help='with --distinct, rows are duplicates if the given columns '
+             'are equal (default: all columns)',
+        metavar='COLUMN[,...]',
+        required=False)
+    # optional deduplication memory budget
+    build_parser.add_argument(
+        '--distinct-buffer',
+        default=1000000,
+        help='number of distinct rows remembered in memory before '
+             'spilling to temporary files (default: %(default)s)',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional aggregate groups
+    build_parser.add_argument(
+        '--group-by',
+        default=None,
+        help='build one row per distinct value of the given columns',
+        metavar='COLUMN[,...]',
+        required=False)
+    # optional aggregate functions
+    build_parser.add_argument(
+        '--agg',
+        action='append',
+        default=None,
+        help='aggregate of each group, one of count, count(COLUMN), '
+             'sum(COLUMN), mean(COLUMN), min(COLUMN) or max(COLUMN) '
+             '(default: count)',
+        metavar='FUNCTION(COLUMN)',
+        required=False)
+    # optional split by column value
+    build_parser.add_argument(
+        '--split-by',
+        default=None,
+        help='write one file per value of COLUMN into the destination '
+             'directory',
+        metavar='COLUMN',
+        required=False)
+    # optional row sample
+    sample_group = build_parser.add_mutually_exclusive_group()
+    sample_group.add_argument(
+        '--sample',
+        default=None,
+        help='build a random sample of N rows, or of a FRACTION of the '
+             'rows',
+        metavar='N|FRACTION',
+        required=False)
+    sample_group.add_argument(
+        '--limit',
+        default=None,
+        help='build the first N rows and stop reading',
+        metavar='N',
+        required=False,
+        type=int)
+    # optional sample seed
+    build_parser.add_argument(
+        '--seed',
+        default=None,
+        help='seed of the random sample, for the same sample every time',
+        metavar='N',
+        required=False,
+        type=int)
+
+    # catalog command
+    # create catalog subcommand parser
+    catalog_parser = subparsers.add_parser(
+        'catalog',
+        epilog=epilog_last_line,
+        help='rebuild the catalog of an archive directory')
+    # optional, hidden argument that is true when using this subparser
+    catalog_parser.add_argument(
+        '--catalog',
+        action='store_true',
+        default=True,
+        help=argparse.SUPPRESS,
+        required=False)
+    # required source directory
+    catalog_parser.add_argument(
+        'source',
+        help='directory where data is stored')
+    # optional csv engine
+    catalog_parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default=PANDAS,
+        help='csv reader (default: %(default)s)',
+        required=False)
+    # optional number of reader threads
+    catalog_parser.add_argument(
+        '-j',
+        '--jobs',
+        default=1,
+        help='number of threads reading archive files (default: '
+             '%(default)s)',
+        metavar='N',
+        required=False,
+        type=int)
 
     # init command
     # create init subcommand parser
@@ -143,5 +428,21 @@ def get_parser() -> argparse.ArgumentParser:
         metavar='header',
         help='column header(s) to use for the archive hierarchy',
         nargs='+')
+    # optional typed archive
+    init_parser.add_argument(
+        '--typed',
+        action='store_true',
+        default=False,
+        help='infer the type of each archived column',
+        required=False)
+    # optional declared column types
+    init_parser.add_argument(
+        '--dtype',
+        action='append',
+        default=None,
+        help='declare the type of a column, one of int64, float64 or str '
+             '(implies --typed)',
+        metavar='COLUMN=TYPE[,...]',
+        required=False)
 
     return parser
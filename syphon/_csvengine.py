@@ -0,0 +1,459 @@
+"""syphon._csvengine.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+PANDAS = 'pandas'
+PYARROW = 'pyarrow'
+
+ENGINES = [PANDAS, PYARROW]
+
+# values that pandas.read_csv reads as missing by default
+MISSING = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'n/a', 'nan',
+    'null',
+])
+
+
+def _pyarrow():
+    """Return the `pyarrow` package or `None` if it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.csv
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _use_pyarrow(engine: str) -> bool:
+    """Return `True` if the `pyarrow` engine is requested and installed."""
+    return engine == PYARROW and _pyarrow() is not None
+
+
+def _arrow_type(dtype: str):
+    """Return the `pyarrow` type of a column type."""
+    from syphon.schema.dtypes import FLOAT, INT
+
+    pyarrow = _pyarrow()
+
+    if dtype == INT:
+        return pyarrow.int64()
+    if dtype == FLOAT:
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _arrow_convert_options(filepath: str, columns: list, dtypes: dict):
+    """Return `pyarrow.csv.ConvertOptions` that read strings, or the
+    given column types.
+
+    Returns `None` if none of the given columns are in the file.
+
+    Raises:
+        EmptyDataError: The file does not have a header.
+    """
+    from pandas.errors import EmptyDataError
+
+    pyarrow = _pyarrow()
+    dtypes = dtypes or dict()
+
+    header = read_header(filepath)
+    if len(header) == 0:
+        raise EmptyDataError('No columns to parse from file')
+
+    include_columns = list()
+    if columns is not None:
+        include_columns = [name for name in header if name in columns]
+        if len(include_columns) == 0:
+            return None
+
+    return pyarrow.csv.ConvertOptions(
+        column_types={
+            name: _arrow_type(dtypes.get(name)) for name in header},
+        include_columns=include_columns,
+        null_values=sorted(MISSING),
+        strings_can_be_null=True)
+
+
+def _arrow_to_pandas(data) -> DataFrame:
+    """Convert a `pyarrow` table or record batch to a `DataFrame`.
+
+    Null values are converted to `numpy.nan` to match
+    `pandas.read_csv(..., dtype=str)`, and integer columns are nullable.
+    """
+    from numpy import nan
+    from pandas import Int64Dtype
+
+    pyarrow = _pyarrow()
+
+    frame = data.to_pandas()
+    for field in data.schema:
+        if field.type == pyarrow.int64():
+            frame[field.name] = frame[field.name].astype(Int64Dtype())
+    strings = [
+        name for name in frame.columns if frame[name].dtype == object]
+    if len(strings) != 0:
+        frame[strings] = frame[strings].where(frame[strings].notnull(), nan)
+    return frame
+
+
+def _arrow_read_csv(
+        filepath: str, columns: list, dtypes: dict) -> DataFrame:
+    """Read a csv file using the multithreaded `pyarrow` reader.
+
+    Returns `None` if `pyarrow` cannot parse the file, e.g. because a
+    row is shorter than the header, which `pandas` fills with missing
+    values.
+    """
+    pyarrow = _pyarrow()
+
+    convert_options = _arrow_convert_options(filepath, columns, dtypes)
+    if convert_options is None:
+        return DataFrame()
+
+    read_options = pyarrow.csv.ReadOptions(use_threads=True)
+
+    try:
+        table = pyarrow.csv.read_csv(
+            filepath,
+            convert_options=convert_options,
+            read_options=read_options)
+    except pyarrow.ArrowInvalid:
+        return None
+
+    return _arrow_to_pandas(table)
+
+
+def _arrow_read_csv_chunks(
+        filepath: str, chunksize: int, columns: list, dtypes: dict):
+    """Yield the blocks of a csv file read by the `pyarrow` reader.
+
+    If `pyarrow` cannot parse the file, the rest of it is read by
+    `pandas`.
+    """
+    pyarrow = _pyarrow()
+
+    convert_options = _arrow_convert_options(filepath, columns, dtypes)
+    if convert_options is None:
+        return
+
+    read_options = pyarrow.csv.ReadOptions(use_threads=True)
+
+    rows = 0
+    try:
+        reader = pyarrow.csv.open_csv(
+            filepath,
+            convert_options=convert_options,
+            read_options=read_options)
+        for batch in reader:
+            rows += batch.num_rows
+            yield _arrow_to_pandas(batch)
+    except pyarrow.ArrowInvalid:
+        # skip the rows that were already read
+        for chunk in _pandas_read_csv_chunks(
+                filepath, chunksize, columns, dtypes):
+            if rows >= len(chunk):
+                rows -= len(chunk)
+                continue
+            yield chunk.iloc[rows:]
+            rows = 0
+
+
+def _arrow_csv(frame: DataFrame) -> bytes:
+    """Format the rows of a `DataFrame` using the `pyarrow` writer.
+
+    `pyarrow` quotes every string value, so values are written unquoted
+    and `None` is returned if any of them would need quoting. `None` is
+    also returned for float columns, which `pyarrow` formats differently,
+    e.g. "3" instead of "3.0".
+    """
+    from io import BytesIO
+
+    pyarrow = _pyarrow()
+
+    # pandas quotes a lone empty value so it is not read as a blank line
+    if len(frame.columns) == 1 and frame.isnull().values.any():
+        return None
+
+    if any(dtype.kind == 'f' for dtype in frame.dtypes):
+        return None
+
+    try:
+        table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return None
+
+    # older pyarrow versions cannot write unquoted values
+    try:
+        options = pyarrow.csv.WriteOptions(
+            include_header=False, quoting_style='none')
+    except TypeError:
+        return None
+
+    buffer = BytesIO()
+    try:
+        pyarrow.csv.write_csv(table, buffer, write_options=options)
+    except pyarrow.ArrowInvalid:
+        return None
+
+    return buffer.getvalue()
+
+
+def _header(columns: list) -> bytes:
+    """Format a csv header the same way as `DataFrame.to_csv`."""
+    from csv import writer
+    from io import StringIO
+
+    buffer = StringIO()
+    writer(buffer, lineterminator='\n').writerow(columns)
+    return buffer.getvalue().encode('utf-8')
+
+
+def read_header(filepath: str) -> list:
+    """Return the column names found on the first line of a csv file.
+
+    Args:
+        filepath (str): Absolute filepath of the csv file.
+
+    Returns:
+        list: Column names. The list is empty if the file is empty.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from csv import reader
+
+    with open(filepath, 'r', newline='', encoding='utf-8') as file:
+        for row in reader(file):
+            return row
+    return list()
+
+
+def _dtype(filepath: str, dtypes: dict):
+    """Return a `dtype` argument for `pandas.read_csv` that reads strings,
+    or the given column types.
+
+    Integers are parsed as floats, which is several times faster than
+    parsing nullable integers and exact for the integers that are
+    inferred, and converted by `_integers`.
+    """
+    from syphon.schema.dtypes import FLOAT, INT, pandas_dtype
+
+    if dtypes is None:
+        return str
+    return {
+        name: pandas_dtype(
+            FLOAT if dtypes.get(name) == INT else dtypes.get(name))
+        for name in read_header(filepath)
+    }
+
+
+def _integers(frame: DataFrame, dtypes: dict) -> DataFrame:
+    """Convert the integer columns read by `_dtype` to nullable integers.
+
+    Raises:
+        ValueError: An integer column has a fractional value.
+    """
+    from syphon.schema.dtypes import INT, pandas_dtype
+
+    if dtypes is None:
+        return frame
+
+    for name in frame.columns:
+        if dtypes.get(name) == INT:
+            try:
+                frame[name] = frame[name].astype(pandas_dtype(INT))
+            except TypeError:
+                raise ValueError(
+                    'Expected integers in column "{}"'.format(name))
+    return frame
+
+
+def _usecols(columns: list):
+    """Return a `usecols` argument for `pandas.read_csv`."""
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return lambda name: name in wanted
+
+
+def _pandas_read_csv_chunks(
+        filepath: str, chunksize: int, columns: list, dtypes: dict):
+    """Yield the chunks of a csv file read by `pandas.read_csv`."""
+    from pandas import read_csv as pandas_read_csv
+
+    reader = pandas_read_csv(
+        filepath, dtype=_dtype(filepath, dtypes), chunksize=chunksize,
+        usecols=_usecols(columns))
+    for chunk in reader:
+        yield _integers(DataFrame(chunk), dtypes)
+
+
+def read_csv(
+        filepath: str, engine: str = PANDAS, columns: list = None,
+        dtypes: dict = None) -> DataFrame:
+    """Read a csv file where every column is a string.
+
+    Args:
+        filepath (str): Absolute filepath of the csv file.
+        engine (str): Either "pandas" or "pyarrow". The `pandas` engine
+            is used if `pyarrow` is not installed or cannot parse the
+            file.
+        columns (list): Names of the columns to read, or `None` to read
+            every column. Other columns are skipped while parsing.
+            Requested columns that are not in the file are ignored.
+        dtypes (dict): Column types, e.g. "float64", indexed by column
+            name, or `None`. Columns without a type are strings.
+
+    Returns:
+        DataFrame: The file contents.
+
+    Raises:
+        EmptyDataError: Error raised by pandas.read_csv.
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+        ParserError: Error raised by pandas.read_csv.
+    """
+    from pandas import read_csv as pandas_read_csv
+
+    if _use_pyarrow(engine):
+        frame = _arrow_read_csv(filepath, columns, dtypes)
+        if frame is not None:
+            return frame
+
+    return _integers(DataFrame(pandas_read_csv(
+        filepath, dtype=_dtype(filepath, dtypes), usecols=_usecols(columns))),
+        dtypes)
+
+
+def read_csv_chunks(
+        filepath: str, chunksize: int, engine: str = PANDAS,
+        columns: list = None, dtypes: dict = None):
+    """Read a csv file where every column is a string, a chunk at a time.
+
+    Args:
+        filepath (str): Absolute filepath of the csv file.
+        chunksize (int): Number of rows in each chunk. The `pyarrow`
+            engine reads blocks of bytes instead, so the number of rows
+            in each of its chunks varies.
+        engine (str): Either "pandas" or "pyarrow". The `pandas` engine
+            is used if `pyarrow` is not installed or cannot parse the
+            file.
+        columns (list): Names of the columns to read, or `None` to read
+            every column. Other columns are skipped while parsing.
+            Requested columns that are not in the file are ignored.
+        dtypes (dict): Column types, e.g. "float64", indexed by column
+            name, or `None`. Columns without a type are strings.
+
+    Yields:
+        DataFrame: The next chunk of the file contents.
+
+    Raises:
+        EmptyDataError: Error raised by pandas.read_csv.
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+        ParserError: Error raised by pandas.read_csv.
+    """
+    if _use_pyarrow(engine):
+        for chunk in _arrow_read_csv_chunks(
+                filepath, chunksize, columns, dtypes):
+            yield chunk
+        return
+
+    for chunk in _pandas_read_csv_chunks(
+            filepath, chunksize, columns, dtypes):
+        yield chunk
+
+
+class CsvWriter:
+    """Incremental csv writer.
+
+    The header is written on creation. Each written `DataFrame` is
+    reindexed to the header, so missing columns are left empty.
+    """
+    def __init__(
+            self, file, columns: list, engine: str = PANDAS,
+            header: bool = True):
+        """
+        Args:
+            file: Binary file object to write to.
+            columns (list): Column names of the header.
+            engine (str): Either "pandas" or "pyarrow". The `pandas`
+                engine is used if `pyarrow` is not installed, if a
+                value needs to be quoted or for float columns.
+            header (bool): `False` to skip writing the header, such as
+                when appending to an existing file.
+        """
+        from io import TextIOWrapper
+
+        self._columns = list(columns)
+        self._engine = engine
+        self._file = file
+        self._text = TextIOWrapper(
+            file, encoding='utf-8', newline='', write_through=True)
+
+        if header:
+            self._file.write(_header(self._columns))
+
+    @property
+    def columns(self) -> list:
+        """`list`: Column names of the header."""
+        return self._columns
+
+    def write(self, frame: DataFrame):
+        """Write the rows of a `DataFrame`.
+
+        Args:
+            frame (DataFrame): Data to write.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        if list(frame.columns) != self._columns:
+            frame = frame.reindex(columns=self._columns)
+
+        if len(frame) == 0:
+            return
+
+        if _use_pyarrow(self._engine):
+            data = _arrow_csv(frame)
+            if data is not None:
+                self._file.write(data)
+                return
+
+        frame.to_csv(self._text, header=False, index=False)
+
+    def detach(self):
+        """Release the file object without closing it."""
+        self._text.detach()
+
+
+def write_csv(frame: DataFrame, filepath: str, engine: str = PANDAS):
+    """Write a `DataFrame` to a csv file without its index.
+
+    Args:
+        frame (DataFrame): Data to write.
+        filepath (str): Absolute filepath of the csv file.
+        engine (str): Either "pandas" or "pyarrow". The `pandas` engine
+            is used if `pyarrow` is not installed, if a value needs to be
+            quoted or for float columns.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    if _use_pyarrow(engine):
+        data = _arrow_csv(frame)
+        if data is not None:
+            with open(filepath, 'wb') as file:
+                file.write(_header(list(frame.columns)))
+                file.write(data)
+            return
+
+    frame.to_csv(filepath, index=False)
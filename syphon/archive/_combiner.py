@@ -0,0 +1,104 @@
+"""syphon.archive._combiner.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from collections import OrderedDict
+from threading import Lock
+
+
+class Combiner:
+    """Write-combining buffer.
+
+    Collects every partition that targets the same archive file so
+    each target can be written once, no matter how many data files
+    contributed rows to it.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._targets = OrderedDict()
+
+    def add(self, task: tuple):
+        """Buffer a `(target_filename, data)` task.
+
+        Args:
+            task (tuple): A target filepath followed by either a
+                `DataFrame` or a `(header, lines)` tuple.
+        """
+        target_filename, data = task
+        with self._lock:
+            if target_filename not in self._targets:
+                self._targets[target_filename] = list()
+            self._targets[target_filename].append(data)
+
+    def tasks(self) -> list:
+        """Return one combined `(target_filename, data)` task per target.
+
+        Raw lines are combined as lines if every part of a target has the
+        same columns, and are parsed into a `DataFrame` otherwise.
+
+        Returns:
+            list: Tasks in order of first appearance.
+        """
+        from pandas import concat
+
+        result = list()
+        with self._lock:
+            for target_filename, buffered in self._targets.items():
+                data = _lines(buffered)
+                if data is None:
+                    data = concat(
+                        [_frame(part) for part in buffered],
+                        ignore_index=True, sort=False)
+                result.append((target_filename, data))
+        return result
+
+
+def _ending(line: bytes) -> bytes:
+    """Return the line ending of a line."""
+    return line[len(line.rstrip(b'\r\n')):]
+
+
+def _lines(buffered: list) -> tuple:
+    """Combine raw lines into a single `(header, lines)` tuple.
+
+    Lines are converted to the line ending of the first header. Returns
+    `None` if a part is a `DataFrame` or has different columns.
+    """
+    from ._rawrouter import _parse
+
+    if not all(isinstance(part, tuple) for part in buffered):
+        return None
+
+    header, _ = buffered[0]
+    columns = _parse(header)
+    ending = _ending(header)
+
+    lines = list()
+    for this_header, these_lines in buffered:
+        if _parse(this_header) != columns:
+            return None
+        if _ending(this_header) == ending:
+            lines.extend(these_lines)
+        else:
+            lines.extend(line.rstrip(b'\r\n') + ending for line in these_lines)
+    return (header, lines)
+
+
+def _frame(data):
+    """Parse raw lines into a `DataFrame` of strings."""
+    from io import BytesIO
+
+    from pandas import DataFrame, read_csv
+
+    from ._rawrouter import NEWLINE
+
+    if not isinstance(data, tuple):
+        return data
+
+    header, lines = data
+    content = b''.join(
+        line if line.endswith(NEWLINE) else line + NEWLINE
+        for line in [header] + lines)
+    return DataFrame(read_csv(BytesIO(content), dtype=str))
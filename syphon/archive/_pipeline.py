@@ -0,0 +1,128 @@
+"""syphon.archive._pipeline.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from queue import Empty, Full, Queue
+from threading import Event
+
+# polling interval (in seconds) used to notice a failed stage
+_POLL = 0.1
+
+_DONE = object()
+
+
+def _get(queue: Queue, stop: Event):
+    """Get the next item from a queue.
+
+    Returns `_DONE` if any stage failed.
+    """
+    while not stop.is_set():
+        try:
+            return queue.get(timeout=_POLL)
+        except Empty:
+            continue
+    return _DONE
+
+
+def _put(queue: Queue, item, stop: Event) -> bool:
+    """Put an item on a queue.
+
+    Returns `False` if any stage failed before there was room.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_POLL)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def pipeline(
+        items, read, partition, write, depth: int = 1, workers: int = 1):
+    """Run a reader, a partitioner, and a pool of writers concurrently.
+
+    The reader thread calls `read` on each item and passes the result to
+    the partitioner. The partitioner runs in the calling thread and turns
+    each result into zero or more tasks, each of which is passed to
+    `write` by one of the writer threads. Stages are connected by queues
+    that hold at most `depth` entries, so reading can only run `depth`
+    results ahead of partitioning, which can only run `depth` tasks
+    ahead of writing.
+
+    Args:
+        items (iterable): Input of the reader stage.
+        read (func): Function f(item) that returns a result, or `None`
+            if the item should be skipped.
+        partition (func): Function f(result) that returns an iterable
+            of tasks.
+        write (func): Function f(task) that handles a single task.
+        depth (int): Maximum number of entries between two stages.
+        workers (int): Number of writer threads.
+
+    Raises:
+        Exception: The first error raised by any stage. All stages are
+            stopped before it is raised.
+    """
+    from threading import Lock, Thread
+
+    errors = list()
+    errors_lock = Lock()
+    stop = Event()
+
+    read_queue = Queue(maxsize=max(1, depth))
+    write_queue = Queue(maxsize=max(1, depth))
+
+    def _fail(err: BaseException):
+        with errors_lock:
+            errors.append(err)
+        stop.set()
+
+    def _reader():
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                result = read(item)
+                if result is not None and not _put(read_queue, result, stop):
+                    return
+        except BaseException as err:  # pylint: disable=broad-except
+            _fail(err)
+        finally:
+            _put(read_queue, _DONE, stop)
+
+    def _writer():
+        try:
+            while True:
+                task = _get(write_queue, stop)
+                if task is _DONE:
+                    return
+                write(task)
+        except BaseException as err:  # pylint: disable=broad-except
+            _fail(err)
+
+    threads = [Thread(target=_reader)]
+    threads += [Thread(target=_writer) for _ in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            result = _get(read_queue, stop)
+            if result is _DONE:
+                break
+            for task in partition(result):
+                if not _put(write_queue, task, stop):
+                    break
+    except BaseException as err:  # pylint: disable=broad-except
+        _fail(err)
+    finally:
+        for _ in range(max(1, workers)):
+            _put(write_queue, _DONE, stop)
+        for thread in threads:
+            thread.join()
+
+    if len(errors) != 0:
+        raise errors[0]
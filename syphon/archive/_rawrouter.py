@@ -0,0 +1,164 @@
+"""syphon.archive._rawrouter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from collections import OrderedDict
+
+from sortedcontainers import SortedDict
+from syphon._csvengine import MISSING
+
+DELIMITER = b','
+QUOTE = b'"'
+NEWLINE = b'\n'
+
+
+def append(line: bytes, value: str) -> bytes:
+    """Add a value to the end of a line.
+
+    Args:
+        line (bytes): A header or record.
+        value (str): The value to add. It is quoted if necessary.
+
+    Returns:
+        bytes: The new line, which keeps the original line ending.
+    """
+    from csv import QUOTE_MINIMAL, writer
+    from io import StringIO
+
+    buffer = StringIO()
+    writer(buffer, lineterminator='', quoting=QUOTE_MINIMAL).writerow([value])
+
+    content = line.rstrip(b'\r\n')
+    ending = line[len(content):]
+    return content + DELIMITER + buffer.getvalue().encode('utf-8') + ending
+
+
+def _parse(record: bytes) -> list:
+    """Split a record containing quoted values into strings."""
+    from csv import reader
+
+    for row in reader([record.decode('utf-8')]):
+        return row
+    return list()
+
+
+def _records(file):
+    """Yield each record of a binary file as the original line bytes.
+
+    Lines are joined while a quoted value spans multiple lines. Blank
+    lines are skipped.
+    """
+    record = b''
+    for line in file:
+        record += line
+        if record.count(QUOTE) % 2 != 0:
+            continue
+        if len(record.strip()) != 0:
+            yield record
+        record = b''
+
+    if len(record.strip()) != 0:
+        yield record
+
+
+def _values(record: bytes, indices: list, last: int) -> tuple:
+    """Return the values found at the given column indices.
+
+    Only the leading columns up to `last` are split from an unquoted
+    record. Missing values are empty strings.
+    """
+    if QUOTE in record:
+        fields = _parse(record)
+    else:
+        fields = [
+            field.decode('utf-8')
+            for field in record.rstrip(b'\r\n').split(DELIMITER, last + 1)
+        ]
+
+    return tuple(fields[i] if i < len(fields) else '' for i in indices)
+
+
+def route(schema: SortedDict, filepath: str) -> (bytes, OrderedDict):
+    """Group the lines of a csv file by the value of the schema columns.
+
+    Only the schema columns are decoded. All other values are left
+    untouched, so each line can be written exactly as it was read.
+
+    Lines with a missing schema value, i.e. one of `MISSING`, are
+    dropped, the same as `datafilter` drops those rows of a
+    `DataFrame`, and the number of dropped lines is printed.
+
+    Args:
+        schema (SortedDict): Archive directory storage schema.
+        filepath (str): Absolute filepath of the csv file.
+
+    Returns:
+        tuple: The header line followed by an `OrderedDict` whose keys
+            are tuples of schema values and whose values are the list of
+            lines that contain those schema values. Keys are in order of
+            first appearance.
+
+    Raises:
+        IndexError: Schema value is not a column header of the
+            given file.
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    partitions = OrderedDict()
+
+    with open(filepath, 'rb') as file:
+        records = _records(file)
+
+        header = next(records, None)
+        if header is None:
+            return (b'', partitions)
+
+        columns = _parse(header)
+        indices = list()
+        for key in schema:
+            if schema[key] not in columns:
+                raise IndexError(
+                    'Cannot find column named "{}"'.format(schema[key]))
+            indices.append(columns.index(schema[key]))
+        last = max(indices) if len(indices) != 0 else 0
+
+        missing = [0] * len(indices)
+        for record in records:
+            values = _values(record, indices, last)
+            if any(value in MISSING for value in values):
+                for i, value in enumerate(values):
+                    missing[i] += value in MISSING
+                continue
+            partitions.setdefault(values, list()).append(record)
+
+    for index, count in zip(indices, missing):
+        if count != 0:
+            print('Skipping {0} rows with a missing {1} value in {2}'
+                  .format(count, columns[index], filepath))
+
+    return (header, partitions)
+
+
+def write(filepath: str, header: bytes, lines: list):
+    """Write the given header and lines to a file.
+
+    Args:
+        filepath (str): Absolute filepath of the new file.
+        header (bytes): First line of the file.
+        lines (list): Each line of the file as `bytes`.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    def _write_line(file, line: bytes):
+        file.write(line)
+        if not line.endswith(NEWLINE):
+            file.write(NEWLINE)
+
+    with open(filepath, 'wb') as file:
+        _write_line(file, header)
+        for line in lines:
+            _write_line(file, line)
@@ -7,9 +7,260 @@
 from syphon import Context
 
 
+def _read(context: Context, datafile: str, metafiles: list):
+    """Reader stage: load a data file and merge in its metadata.
+
+    The data file name is added as the `Context.provenance` column, if
+    one is given.
+
+    Returns a `(datafile, DataFrame)` tuple, a
+    `(datafile, (header, partitions))` tuple in raw mode, or `None` if
+    the data file is empty.
+    """
+    from os.path import split
+
+    from pandas import concat, DataFrame, Series
+    from pandas.errors import EmptyDataError
+    from syphon._csvengine import read_csv
+
+    from ._rawrouter import append, route
+
+    _, datafilename = split(datafile)
+
+    # route lines without parsing if there is no metadata to merge
+    if context.raw and len(metafiles) == 0:
+        header, partitions = route(context.schema, datafile)
+
+        if len(partitions) == 0:
+            print('Skipping empty data file @ {}'.format(datafile))
+            return None
+
+        if context.provenance is not None:
+            header = append(header, context.provenance)
+            for values in partitions:
+                partitions[values] = [
+                    append(line, datafilename) for line in partitions[values]
+                ]
+
+        return (datafile, (header, partitions))
+
+    data_frame = None
+    try:
+        data_frame = read_csv(datafile, context.engine)
+    except EmptyDataError:
+        # trigger the empty check below
+        data_frame = DataFrame()
+
+    if data_frame.empty:
+        print('Skipping empty data file @ {}'.format(datafile))
+        return None
+
+    # remove empty columns
+    data_frame.dropna(axis=1, how='all', inplace=True)
+
+    total_rows, _ = data_frame.shape
+
+    # merge all metadata files into a single DataFrame
+    meta_frame = None
+    for metafile in metafiles:
+        new_frame = read_csv(metafile, context.engine)
+
+        new_frame.dropna(axis=1, how='all', inplace=True)
+        for header in list(new_frame.columns.values):
+            # complain if there's more than one value in a column
+            if len(new_frame[header].drop_duplicates().values) > 1:
+                raise ValueError(
+                    'More than one value exists under the {} column.'
+                    .format(header))
+
+            if len(new_frame[header]) is total_rows:
+                if meta_frame is None:
+                    meta_frame = new_frame[header]
+                else:
+                    meta_frame = concat(
+                        [meta_frame, new_frame[header]], axis=1)
+            else:
+                meta_value = new_frame[header].iloc[0]
+                series = Series([meta_value] * total_rows, name=header)
+                if meta_frame is None:
+                    meta_frame = DataFrame(series)
+                else:
+                    meta_frame = concat([meta_frame, series], axis=1)
+
+    if meta_frame is not None:
+        data_frame = concat([data_frame, meta_frame], axis=1)
+
+    if context.provenance is not None:
+        data_frame[context.provenance] = datafilename
+
+    return (datafile, data_frame)
+
+
+def _partition(context: Context, result: tuple) -> list:
+    """Partitioner stage: split the result of `_read` by schema values.
+
+    Rows with a missing schema value are dropped and counted in a
+    message.
+
+    Returns a list of `(target_filename, data)` tuples, where `data` is
+    either a `DataFrame` or a `(header, lines)` tuple in raw mode.
+    """
+    from os.path import join, split
+
+    from syphon.schema import check_columns, resolve_path
+    from syphon.schema.resolvepath import _normalize
+
+    from . import datafilter
+
+    datafile, data_frame = result
+    _, datafilename = split(datafile)
+
+    # every data file shares the same target file when combining
+    if context.combine is not None:
+        datafilename = context.combine
+
+    tasks = list()
+
+    if isinstance(data_frame, tuple):
+        header, partitions = data_frame
+        for values in partitions:
+            path = join(context.archive, *[_normalize(v) for v in values])
+            tasks.append((join(path, datafilename),
+                          (header, partitions[values])))
+        return tasks
+
+    check_columns(context.schema, data_frame)
+
+    for key in context.schema:
+        column = context.schema[key]
+        count = data_frame[column].isnull().sum()
+        if count != 0:
+            print('Skipping {0} rows with a missing {1} value in {2}'
+                  .format(count, column, datafile))
+
+    filtered_data = datafilter(context.schema, data_frame)
+
+    for data in filtered_data:
+        path = resolve_path(context.archive, context.schema, data)
+        tasks.append((join(path, datafilename), data))
+
+    return tasks
+
+
+def _keys(context: Context, data) -> list:
+    """Return the `(column, value)` schema values of a partition."""
+    from ._rawrouter import _parse
+
+    headers = [context.schema[key] for key in context.schema]
+
+    if isinstance(data, tuple):
+        header, lines = data
+        columns = _parse(header)
+        values = _parse(lines[0]) if len(lines) != 0 else list()
+        return [
+            (column, values[columns.index(column)]
+             if column in columns and columns.index(column) < len(values)
+             else None)
+            for column in headers
+        ]
+
+    keys = list()
+    for column in headers:
+        present = list()
+        if column in data.columns:
+            present = data[column].dropna()
+        keys.append(
+            (column, str(present.iloc[0]) if len(present) != 0 else None))
+    return keys
+
+
+def _record(context: Context, target_filename: str, data) -> tuple:
+    """Describe a written partition for the archive catalog."""
+    from syphon.catalog.database import record
+
+    from ._rawrouter import _parse
+
+    if isinstance(data, tuple):
+        header, lines = data
+        rows, columns = len(lines), _parse(header)
+    else:
+        rows, columns = len(data), [str(c) for c in data.columns]
+
+    return record(context.archive, target_filename, rows, columns,
+                  _keys(context, data))
+
+
+def _dtypes(data) -> dict:
+    """Return the column types of a partition.
+
+    Raw lines are never parsed, so their columns are strings.
+    """
+    from syphon.schema import infer_dtypes
+    from syphon.schema.dtypes import STR
+
+    from ._rawrouter import _parse
+
+    if isinstance(data, tuple):
+        header, _ = data
+        return {column: STR for column in _parse(header)}
+    return infer_dtypes(data)
+
+
+def _write(context: Context, task: tuple, catalog: bool = False) -> tuple:
+    """Writer stage: write a single partition to the archive.
+
+    Returns a catalog record of the written file if `catalog` is `True`,
+    otherwise `None`.
+    """
+    from os import makedirs
+    from os.path import dirname, exists
+
+    from syphon._csvengine import write_csv
+
+    from ._rawrouter import write
+
+    target_filename, data = task
+
+    if exists(target_filename) and not context.overwrite:
+        raise FileExistsError('Archive error: file already exists @ '
+                              '{}'.format(target_filename))
+
+    makedirs(dirname(target_filename), exist_ok=True)
+    if isinstance(data, tuple):
+        header, lines = data
+        write(target_filename, header, lines)
+    else:
+        write_csv(data, target_filename, context.engine)
+
+    if context.verbose:
+        print('Archive: wrote {0}'.format(target_filename))
+
+    if catalog:
+        return _record(context, target_filename, data)
+    return None
+
+
 def archive(context: Context):
     """Store the files specified in the current context.
 
+    Reading, partitioning, and writing run concurrently. The number of
+    files read ahead and partitions waiting to be written are both
+    limited by `Context.queue_depth`. Partitions are written by
+    `Context.jobs` threads.
+
+    If `Context.combine` is set, the partitions of every data file are
+    buffered and each archive directory receives a single file with
+    that name once all data files have been read.
+
+    If the archive directory has a catalog, every written file is added
+    to it in a single transaction once writing stops, even if an error
+    occurred.
+
+    If the archive directory has a column types file, the type of each
+    column of every written file is inferred and the saved types are
+    widened to hold them once writing stops, even if an error occurred.
+    Columns of raw lines are strings.
+
     Args:
         context (Context): Runtime settings object.
 
@@ -24,18 +275,18 @@ def archive(context: Context):
         ValueError: More than one unique metadata value exists
             under a column header.
     """
+    from concurrent.futures import ThreadPoolExecutor
     from glob import glob
-    from os import makedirs
     from os.path import exists, join, split
 
-    from pandas import concat, DataFrame, read_csv, Series
-    from pandas.errors import EmptyDataError, ParserError
     from sortedcontainers import SortedList
-    from syphon.schema import check_columns, resolve_path
+    from syphon.catalog import Catalog
+    from syphon.schema import load_dtypes, save_dtypes, widen_dtypes
 
-    from . import datafilter
     from . import file_map
+    from ._combiner import Combiner
     from ._lockmanager import LockManager
+    from ._pipeline import pipeline
 
     lock_manager = LockManager()
     lock_list = list()
@@ -52,102 +303,48 @@ def archive(context: Context):
 
     fmap = file_map(data_list, meta_list)
 
-    for datafile in fmap:
-        _, datafilename = split(datafile)
+    combiner = None
+    if context.combine is not None:
+        combiner = Combiner()
 
-        data_frame = None
-        try:
-            data_frame = DataFrame(read_csv(datafile, dtype=str))
-        except EmptyDataError:
-            # trigger the empty check below
-            data_frame = DataFrame()
-        except ParserError:
-            lock_manager.release_all()
-            raise
+    catalog_path = join(context.archive, context.catalog_file)
+    catalog = exists(catalog_path)
+    records = list()
 
-        if data_frame.empty:
-            print('Skipping empty data file @ {}'.format(datafile))
-            continue
-
-        # remove empty columns
-        data_frame.dropna(axis=1, how='all', inplace=True)
-
-        total_rows, _ = data_frame.shape
-
-        # merge all metadata files into a single DataFrame
-        meta_frame = None
-        for metafile in fmap[datafile]:
-            try:
-                new_frame = DataFrame(read_csv(metafile, dtype=str))
-            except ParserError:
-                lock_manager.release_all()
-                raise
-
-            new_frame.dropna(axis=1, how='all', inplace=True)
-            for header in list(new_frame.columns.values):
-                # complain if there's more than one value in a column
-                if len(new_frame[header].drop_duplicates().values) > 1:
-                    lock_manager.release_all()
-                    raise ValueError(
-                        'More than one value exists under the {} column.'
-                        .format(header))
-
-                if len(new_frame[header]) is total_rows:
-                    if meta_frame is None:
-                        meta_frame = new_frame[header]
-                    else:
-                        meta_frame = concat(
-                            [meta_frame, new_frame[header]], axis=1)
-                else:
-                    meta_value = new_frame[header].iloc[0]
-                    series = Series([meta_value] * total_rows, name=header)
-                    if meta_frame is None:
-                        meta_frame = DataFrame(series)
-                    else:
-                        meta_frame = concat([meta_frame, series], axis=1)
-
-        if meta_frame is not None:
-            data_frame = concat([data_frame, meta_frame], axis=1)
-
-        try:
-            check_columns(context.schema, data_frame)
-        except IndexError:
-            lock_manager.release_all()
-            raise
-
-        filtered_data = None
-        filtered_data = datafilter(context.schema, data_frame)
-
-        if len(filtered_data) is 0:
-            filtered_data = [data_frame]
-
-        for data in filtered_data:
-            path = None
-            try:
-                path = resolve_path(context.archive, context.schema, data)
-            except IndexError:
-                lock_manager.release_all()
-                raise
-            except ValueError:
-                lock_manager.release_all()
-                raise
-
-            target_filename = join(path, datafilename)
-
-            if exists(target_filename) and not context.overwrite:
-                lock_manager.release_all()
-                raise FileExistsError('Archive error: file already exists @ '
-                                      '{}'.format(target_filename))
-
-            try:
-                makedirs(path, exist_ok=True)
-                data.to_csv(target_filename, index=False)
-            except OSError:
-                lock_manager.release_all()
-                raise
-
-            if context.verbose:
-                print('Archive: wrote {0}'.format(target_filename))
+    dtypes_path = join(context.archive, context.dtypes_file)
+    typed = exists(dtypes_path)
+    dtypes = list()
+
+    def write(task: tuple):
+        records.append(_write(context, task, catalog))
+        if typed:
+            dtypes.append(_dtypes(task[1]))
+
+    try:
+        pipeline(
+            fmap,
+            lambda datafile: _read(context, datafile, fmap[datafile]),
+            lambda result: _partition(context, result),
+            lambda task: (
+                write(task) if combiner is None else combiner.add(task)),
+            depth=context.queue_depth,
+            workers=context.jobs)
+
+        if combiner is not None:
+            with ThreadPoolExecutor(max(1, context.jobs)) as executor:
+                list(executor.map(write, combiner.tasks()))
+    except BaseException:
+        lock_manager.release_all()
+        raise
+    finally:
+        if catalog and len(records) != 0:
+            with Catalog(catalog_path) as database:
+                database.add(records)
+        if typed and len(dtypes) != 0:
+            result = load_dtypes(dtypes_path)
+            for other in dtypes:
+                result = widen_dtypes(result, other)
+            save_dtypes(result, dtypes_path)
 
     while lock_list:
         lock = lock_list.pop()
@@ -4,31 +4,44 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
+from numpy import ndarray
 from pandas import DataFrame
 from sortedcontainers import SortedDict
 
 
+def _codes(datapool: DataFrame, header: str) -> ndarray:
+    """Return the categorical codes of a column.
+
+    Missing values have a code of -1.
+    """
+    column = datapool.get(header)
+    if column.dtype.name != 'category':
+        column = column.astype('category')
+    return column.cat.codes.values
+
+
 def _datafilter(
-        schema: SortedDict, datapool: DataFrame, filtered=None) -> list:
+        codes: list, datapool: DataFrame, rows: ndarray,
+        filtered=None) -> list:
     """The `filtered` parameter should only be used internally."""
+    from pandas import unique
+
     # prevent mutable default parameter
     if filtered is None:
         filtered = []
 
-    this_schema = schema.copy()
-    header = None
-    try:
-        _, header = this_schema.popitem(last=False)
-    except KeyError:
-        filtered.append(datapool)
+    if len(codes) == 0:
+        filtered.append(datapool.iloc[rows])
         return filtered
 
-    if header not in datapool.columns:
-        return filtered
-
-    for value in datapool.get(header).drop_duplicates().values:
-        new_pool = datapool.loc[datapool.get(header) == value]
-        filtered = _datafilter(this_schema, new_pool, filtered=filtered)
+    these_codes = codes[0][rows]
+    for code in unique(these_codes):
+        # rows with a missing value are dropped
+        if code < 0:
+            continue
+        new_rows = rows[these_codes == code]
+        filtered = _datafilter(
+            codes[1:], datapool, new_rows, filtered=filtered)
     return filtered
 
 
@@ -39,6 +52,10 @@ def datafilter(schema: SortedDict, datapool: DataFrame) -> list:
     Each `DataFrame` object in the list will have a single value for all
     schema columns.
 
+    Schema columns are compared by their categorical codes, so each
+    comparison is between small integers instead of strings. Rows with
+    a missing schema value are dropped.
+
     Args:
         schema (SortedDict): Column names to use for filtering.
         datapool (DataFrame): Data to filter.
@@ -47,4 +64,13 @@ def datafilter(schema: SortedDict, datapool: DataFrame) -> list:
         list: The filtered DataFrame objects. An empty list is
             returned if no schema values could be found.
     """
-    return _datafilter(schema, datapool)
+    from numpy import arange
+
+    codes = list()
+    for key in schema:
+        header = schema[key]
+        if header not in datapool.columns:
+            return []
+        codes.append(_codes(datapool, header))
+
+    return _datafilter(codes, datapool, arange(len(datapool)))
@@ -4,8 +4,9 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
-from .build import build
+from .build import build, build_frame
 
 __all__ = [
     'build',
+    'build_frame',
 ]
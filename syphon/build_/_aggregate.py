@@ -0,0 +1,245 @@
+"""syphon.build_._aggregate.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import re
+
+from pandas import DataFrame
+
+COUNT = 'count'
+MAX = 'max'
+MEAN = 'mean'
+MIN = 'min'
+SUM = 'sum'
+
+FUNCTIONS = [COUNT, MAX, MEAN, MIN, SUM]
+
+# every partial state is merged with the same function it was made with
+_STATES = [
+    ('count', 'sum'),
+    ('n', 'sum'),
+    ('sum', 'sum'),
+    ('min', 'min'),
+    ('max', 'max'),
+]
+
+_ROWS = '\0rows'
+
+_ALL = '\0all'
+
+_SPEC = re.compile(r'^\s*(\w+)\s*(?:\((.+)\))?\s*$')
+
+
+def parse(expressions: list) -> list:
+    """Parse `FUNCTION(COLUMN)` aggregate expressions.
+
+    `count` without a column counts rows. `count(COLUMN)` counts the
+    values that are not empty. `sum`, `mean`, `min` and `max` only use
+    numeric values.
+
+    Args:
+        expressions (list): Expression strings.
+
+    Returns:
+        list: `(name, function, column)` tuples. `column` is `None` for
+            a row count.
+
+    Raises:
+        ValueError: An expression is malformed or uses an unknown
+            function.
+    """
+    result = list()
+    for expression in expressions:
+        match = _SPEC.match(expression)
+        if match is None:
+            raise ValueError(
+                'Expected FUNCTION(COLUMN), found "{}"'.format(expression))
+
+        function, column = match.group(1).lower(), match.group(2)
+        if function not in FUNCTIONS:
+            raise ValueError('Unknown aggregate function "{}", expected '
+                             'one of {}'.format(function, FUNCTIONS))
+        if column is None and function != COUNT:
+            raise ValueError(
+                'Expected {}(COLUMN), found "{}"'.format(function, expression))
+
+        if column is None:
+            name = function
+        else:
+            column = column.strip()
+            name = '{0}({1})'.format(function, column)
+        result.append((name, function, column))
+    return result
+
+
+def columns(keys: list, aggregates: list) -> list:
+    """Return the columns needed to compute an aggregate.
+
+    Args:
+        keys (list): Names of the group columns.
+        aggregates (list): Parsed aggregate expressions.
+
+    Returns:
+        list: Column names in order of appearance.
+    """
+    result = list(keys)
+    for _, _, column in aggregates:
+        if column is not None and column not in result:
+            result.append(column)
+    return result
+
+
+def _format(value) -> str:
+    """Format an aggregate value, dropping the fraction of whole
+    numbers."""
+    from math import isnan
+
+    if isinstance(value, float) and isnan(value):
+        return value
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Aggregator:
+    """Grouped aggregate with mergeable partial states.
+
+    Each added chunk is reduced to one row of partial states per group,
+    which is merged into the running state. Only the states are kept, so
+    memory use depends on the number of groups, not the number of rows.
+    """
+    def __init__(self, keys: list, aggregates: list):
+        """
+        Args:
+            keys (list): Names of the group columns.
+            aggregates (list): Parsed aggregate expressions.
+        """
+        self._aggregates = list(aggregates)
+        self._keys = list(keys)
+        self._columns = columns(list(), aggregates)
+        self._state = None
+
+        self._functions = {_ROWS: 'sum'}
+        for column in self._columns:
+            for state, function in _STATES:
+                self._functions[self._state_name(state, column)] = function
+
+    @staticmethod
+    def _state_name(state: str, column: str) -> str:
+        return '\0{0}\0{1}'.format(state, column)
+
+    @property
+    def state(self) -> DataFrame:
+        """`DataFrame`: Partial states indexed by group, or `None` if no
+        rows were added."""
+        return self._state
+
+    def _group_keys(self) -> list:
+        return self._keys if len(self._keys) != 0 else [_ALL]
+
+    def _reduce(self, data: DataFrame) -> DataFrame:
+        return data.groupby(self._group_keys(), sort=False).agg(
+            self._functions)
+
+    def _merge(self, state: DataFrame, disjoint: bool = False):
+        from pandas import concat
+
+        if self._state is None:
+            self._state = state
+        elif disjoint:
+            self._state = concat([self._state, state], sort=False)
+        else:
+            self._state = self._reduce(
+                concat([self._state, state], sort=False).reset_index())
+
+    def add(self, frame: DataFrame):
+        """Add the rows of a `DataFrame` to the aggregate.
+
+        Args:
+            frame (DataFrame): Data to aggregate.
+        """
+        from numpy import nan
+        from pandas import Series, to_numeric
+
+        if len(frame) == 0:
+            return
+
+        data = DataFrame(index=frame.index)
+        for key in self._group_keys():
+            data[key] = frame[key] if key in frame.columns else nan
+            # rows without a value are a group of their own
+            data[key] = data[key].fillna('')
+        data[_ROWS] = 1
+
+        for column in self._columns:
+            raw = Series(nan, index=frame.index, dtype=object)
+            if column in frame.columns:
+                raw = frame[column]
+            values = to_numeric(raw, errors='coerce')
+            present = raw.notnull()
+            data[self._state_name('count', column)] = present.astype(int)
+            data[self._state_name('n', column)] = values.notnull().astype(int)
+            data[self._state_name('sum', column)] = values.astype(float)
+            data[self._state_name('min', column)] = values.astype(float)
+            data[self._state_name('max', column)] = values.astype(float)
+
+        self._merge(self._reduce(data))
+
+    def merge(self, other, disjoint: bool = False):
+        """Merge the partial states of another `Aggregator`.
+
+        Args:
+            other (Aggregator): Aggregate of other rows with the same
+                keys and aggregate expressions.
+            disjoint (bool): `True` if the groups of `other` are not in
+                this aggregate, so the states only need to be appended.
+        """
+        if other.state is not None:
+            self._merge(other.state, disjoint)
+
+    def result(self) -> DataFrame:
+        """Return the aggregate values, one row per group.
+
+        Returns:
+            DataFrame: The group columns followed by one column per
+                aggregate expression, sorted by the group columns. Every
+                value is a string.
+        """
+        from numpy import nan
+
+        names = [name for name, _, _ in self._aggregates]
+        if self._state is None:
+            if len(self._keys) != 0:
+                return DataFrame(columns=self._keys + names)
+            state = DataFrame({_ROWS: [0]})
+            for column in self._columns:
+                for name, _ in _STATES:
+                    value = 0 if name in ['count', 'n'] else nan
+                    state[self._state_name(name, column)] = [value]
+        else:
+            state = self._state.sort_index().reset_index()
+
+        result = DataFrame(index=state.index)
+        for key in self._keys:
+            result[key] = state[key]
+
+        for name, function, column in self._aggregates:
+            if column is None:
+                values = state[_ROWS]
+            elif function == COUNT:
+                values = state[self._state_name('count', column)]
+            else:
+                n = state[self._state_name('n', column)]
+                if function == MEAN:
+                    values = state[self._state_name('sum', column)] / n
+                else:
+                    values = state[self._state_name(function, column)]
+                values = values.where(n > 0, nan)
+            result[name] = values.map(_format)
+
+        for key in self._keys:
+            result[key] = result[key].where(result[key] != '', nan)
+
+        return result
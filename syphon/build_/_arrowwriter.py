@@ -0,0 +1,134 @@
+"""syphon.build_._arrowwriter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+CSV = 'csv'
+FEATHER = 'feather'
+
+FORMATS = [CSV, FEATHER]
+
+FEATHER_EXTENSIONS = ['.arrow', '.feather', '.ipc']
+
+
+def output_format(filepath: str, value: str = None) -> str:
+    """Return the format of a build output file.
+
+    Args:
+        filepath (str): Filepath of the output file.
+        value (str): Requested format, or `None` to choose by the file
+            extension.
+
+    Returns:
+        str: Either "csv" or "feather".
+    """
+    from os.path import splitext
+
+    if value is not None:
+        return value
+
+    if splitext(filepath)[1].lower() in FEATHER_EXTENSIONS:
+        return FEATHER
+    return CSV
+
+
+def _pyarrow():
+    """Return the `pyarrow` package.
+
+    Raises:
+        ValueError: `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        raise ValueError('Feather output requires pyarrow')
+    return pyarrow
+
+
+class ArrowWriter:
+    """Incremental Arrow IPC (Feather version 2) writer.
+
+    Every column is stored as an uncompressed string column, or column
+    of its given type, so readers can memory-map the file. Each written
+    `DataFrame` is reindexed to the columns, so missing columns are left
+    empty.
+    """
+    def __init__(self, file, columns: list, dtypes: dict = None):
+        """
+        Args:
+            file: Binary file object to write to.
+            columns (list): Column names.
+            dtypes (dict): Column types, e.g. "float64", indexed by
+                column name, or `None`. Columns without a type are
+                strings.
+
+        Raises:
+            ValueError: `pyarrow` is not installed.
+        """
+        from syphon._csvengine import _arrow_type
+
+        pyarrow = _pyarrow()
+        dtypes = dtypes or dict()
+
+        self._columns = list(columns)
+        self._schema = pyarrow.schema(
+            [(name, _arrow_type(dtypes.get(name)))
+             for name in self._columns])
+        self._writer = pyarrow.ipc.new_file(file, self._schema)
+
+    @property
+    def columns(self) -> list:
+        """`list`: Column names."""
+        return self._columns
+
+    def write(self, frame: DataFrame):
+        """Write the rows of a `DataFrame` as a record batch.
+
+        Args:
+            frame (DataFrame): Data to write.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        import pyarrow
+
+        if list(frame.columns) != self._columns:
+            frame = frame.reindex(columns=self._columns)
+
+        if len(frame) == 0:
+            return
+
+        self._writer.write_batch(pyarrow.RecordBatch.from_pandas(
+            frame, schema=self._schema, preserve_index=False))
+
+    def detach(self):
+        """Write the file footer and release the file object without
+        closing it."""
+        self._writer.close()
+
+
+def write_arrow(frame: DataFrame, filepath: str, dtypes: dict = None):
+    """Write a `DataFrame` to an Arrow IPC (Feather version 2) file.
+
+    Args:
+        frame (DataFrame): Data to write.
+        filepath (str): Absolute filepath of the output file.
+        dtypes (dict): Column types, e.g. "float64", indexed by column
+            name, or `None`. Columns without a type are strings.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+        ValueError: `pyarrow` is not installed.
+    """
+    with open(filepath, 'wb') as file:
+        writer = ArrowWriter(file, list(frame.columns), dtypes)
+        try:
+            writer.write(frame)
+        finally:
+            writer.detach()
@@ -0,0 +1,226 @@
+"""syphon.build_._distinct.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+from syphon._csvengine import PANDAS
+
+DISTINCT_BUFFER_ROWS = 1000000
+
+PARTITIONS = 16
+
+# two independent 64 bit hashes make a collision practically impossible
+_HASH_KEYS = ['0123456789123456', 'syphon.distinct.']
+
+
+def _hashes(frame: DataFrame, key: list) -> list:
+    """Return a 128 bit hash of the key columns of each row."""
+    from pandas.util import hash_pandas_object
+
+    # missing columns are added as floats, which hash differently
+    frame = frame.reindex(columns=key).astype(object)
+    first, second = [
+        hash_pandas_object(frame, index=False, hash_key=hash_key).values
+        for hash_key in _HASH_KEYS
+    ]
+    return list(zip(first.tolist(), second.tolist()))
+
+
+class Deduplicator:
+    """Streaming duplicate row filter with a bounded memory hash set.
+
+    The first occurrence of each key is kept. Once more than
+    `buffer_rows` distinct keys have been seen, the keys and every later
+    row are spilled to hash partitions on disk. Each partition is then
+    deduplicated on its own, and a partition with too many keys is
+    spilled again on other bits of the hash, so at most about
+    `buffer_rows` keys are in memory at a time. Rows that arrive after
+    the spill lose their archive order.
+    """
+    def __init__(self, key: list, columns: list, buffer_rows: int,
+                 directory: str = None, engine: str = PANDAS,
+                 partitions: int = PARTITIONS):
+        """
+        Args:
+            key (list): Names of the columns that identify a row.
+            columns (list): Column names of the data. Key columns are
+                added if they are missing.
+            buffer_rows (int): Maximum number of keys kept in memory.
+            directory (str): Directory of the temporary partition files,
+                or `None` to use the default temporary directory.
+            engine (str): Either "pandas" or "pyarrow".
+            partitions (int): Number of partitions to spill to.
+        """
+        self._buffer_rows = buffer_rows
+        self._columns = list(columns) + [
+            name for name in key if name not in columns]
+        self._directory = directory
+        self._engine = engine
+        self._key = list(key)
+        # hash bits used by the partitions of earlier spills
+        self._level = 0
+        self._partitions = partitions
+        self._pool = None
+        self._seen = set()
+        self._tempdir = None
+
+    @property
+    def spilled(self) -> bool:
+        """`bool`: `True` if rows were spilled to disk."""
+        return self._tempdir is not None
+
+    def _divisor(self) -> int:
+        """Return the divisor that skips the hash bits of earlier spills."""
+        return self._partitions ** self._level
+
+    def _full(self) -> bool:
+        """Return `True` if the remembered keys should be spilled."""
+        # once every hash bit is used, the keys stay in memory
+        return (len(self._seen) > self._buffer_rows and
+                self._divisor() * self._partitions <= 2 ** 64)
+
+    def _unique(self, hashes: list) -> list:
+        """Return which rows are new and remember their keys."""
+        keep = list()
+        for value in hashes:
+            keep.append(value not in self._seen)
+            self._seen.add(value)
+        return keep
+
+    def _spill(self):
+        """Append the remembered keys to the key files of the partitions,
+        creating the partitions on the first spill."""
+        from os.path import join
+        from tempfile import mkdtemp
+
+        from ._split import WriterPool
+
+        if self._tempdir is None:
+            self._tempdir = mkdtemp(prefix='.syphon-distinct-',
+                                    dir=self._directory)
+            self._pool = WriterPool(
+                self._tempdir, self._columns, self._engine,
+                size=self._partitions)
+
+        divisor = self._divisor()
+        keys = [list() for _ in range(self._partitions)]
+        for value in self._seen:
+            keys[value[0] // divisor % self._partitions].append(value)
+        self._seen = set()
+
+        for number, values in enumerate(keys):
+            path = join(self._tempdir, '{0:05d}.keys'.format(number))
+            with open(path, 'a', encoding='utf-8') as file:
+                for first, second in values:
+                    file.write('{0} {1}\n'.format(first, second))
+
+    def _load(self, path: str):
+        """Remember the keys of a key file, spilling as needed."""
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                first, second = line.split()
+                self._seen.add((int(first), int(second)))
+                if self._full():
+                    self._spill()
+
+        # rows written after a spill are only compared on disk
+        if self._pool is not None and len(self._seen) != 0:
+            self._spill()
+
+    def add(self, frame: DataFrame) -> DataFrame:
+        """Drop the rows whose key was already seen.
+
+        Args:
+            frame (DataFrame): Data to deduplicate.
+
+        Returns:
+            DataFrame: Rows to write now. After a spill every row is
+                held back until `remaining()` is called.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from numpy import array, uint64
+
+        if len(frame) == 0:
+            return frame
+
+        hashes = _hashes(frame, self._key)
+
+        if self._pool is not None:
+            numbers = array([value[0] for value in hashes], dtype='uint64')
+            numbers = numbers // uint64(self._divisor()) % uint64(
+                self._partitions)
+            for number in sorted(set(numbers.tolist())):
+                self._pool.write(
+                    '{0:05d}'.format(number), frame[numbers == number])
+            return frame.iloc[0:0]
+
+        frame = frame[self._unique(hashes)]
+        if self._full():
+            self._spill()
+        return frame
+
+    def remaining(self, chunksize: int = DISTINCT_BUFFER_ROWS):
+        """Yield the deduplicated rows of every spilled partition.
+
+        Args:
+            chunksize (int): Number of rows read from a partition at a
+                time.
+
+        Yields:
+            DataFrame: The next deduplicated rows.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from os.path import exists, join
+
+        from syphon._csvengine import read_csv_chunks
+
+        if self._pool is None:
+            return
+
+        self._pool.close()
+
+        for number in range(self._partitions):
+            name = join(self._tempdir, '{0:05d}'.format(number))
+            if not exists(name + '.csv'):
+                continue
+
+            # each partition is deduplicated by its own, smaller filter
+            partition = Deduplicator(
+                self._key, self._columns, self._buffer_rows,
+                self._tempdir, self._engine, self._partitions)
+            partition._level = self._level + 1
+            try:
+                if exists(name + '.keys'):
+                    partition._load(name + '.keys')
+
+                for chunk in read_csv_chunks(name + '.csv', chunksize,
+                                             self._engine):
+                    chunk = partition.add(chunk.reindex(columns=self._columns))
+                    if len(chunk) != 0:
+                        yield chunk
+
+                for chunk in partition.remaining(chunksize):
+                    yield chunk
+            finally:
+                partition.close()
+
+    def close(self):
+        """Delete the temporary partition files."""
+        from shutil import rmtree
+
+        self._seen = set()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        if self._tempdir is not None:
+            rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
@@ -0,0 +1,242 @@
+"""syphon.build_._filter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import operator
+import re
+
+from pandas import DataFrame, Series
+
+_OPERATORS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+_KEYWORDS = ['and', 'not', 'or']
+
+_TOKEN = re.compile(r'''\s*(?:
+    (?P<op>==|!=|<=|>=|<|>|=)|
+    (?P<paren>[()])|
+    (?P<quoted>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|
+    (?P<word>[^\s()<>=!"']+)
+    )''', re.VERBOSE)
+
+_ESCAPE = re.compile(r'\\(.)')
+
+
+def _tokens(expression: str) -> list:
+    """Split an expression into `(kind, text)` tuples.
+
+    Raises:
+        ValueError: The expression contains an unexpected character.
+    """
+    result = list()
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise ValueError(
+                'Unexpected character in filter "{}" at {}'
+                .format(expression, position))
+        position = match.end()
+
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'quoted':
+            text = _ESCAPE.sub(r'\1', text[1:-1])
+        elif kind == 'word' and text.lower() in _KEYWORDS:
+            kind = 'keyword'
+            text = text.lower()
+        result.append((kind, text))
+    return result
+
+
+def _number(text: str):
+    """Return `text` as a `float`, or `None` if it is not a number."""
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+class _Parser:
+    """Recursive descent parser of filter expressions.
+
+    Nodes are tuples: `('or', left, right)`, `('and', left, right)`,
+    `('not', node)` or `('compare', column, operator, value)`.
+    """
+    def __init__(self, expression: str):
+        self._expression = expression
+        self._tokens = _tokens(expression)
+        self._index = 0
+
+    def _error(self, expected: str) -> ValueError:
+        found = 'end of filter'
+        if self._index < len(self._tokens):
+            found = '"{}"'.format(self._tokens[self._index][1])
+        return ValueError('Expected {} in filter "{}", found {}'.format(
+            expected, self._expression, found))
+
+    def _peek(self, kind: str, text: str = None) -> bool:
+        if self._index >= len(self._tokens):
+            return False
+        this_kind, this_text = self._tokens[self._index]
+        return this_kind == kind and (text is None or this_text == text)
+
+    def _take(self, *kinds) -> tuple:
+        if self._index >= len(self._tokens):
+            raise self._error(' or '.join(kinds))
+        token = self._tokens[self._index]
+        if token[0] not in kinds:
+            raise self._error(' or '.join(kinds))
+        self._index += 1
+        return token
+
+    def parse(self) -> tuple:
+        node = self._or()
+        if self._index != len(self._tokens):
+            raise self._error('"and" or "or"')
+        return node
+
+    def _or(self) -> tuple:
+        node = self._and()
+        while self._peek('keyword', 'or'):
+            self._index += 1
+            node = ('or', node, self._and())
+        return node
+
+    def _and(self) -> tuple:
+        node = self._not()
+        while self._peek('keyword', 'and'):
+            self._index += 1
+            node = ('and', node, self._not())
+        return node
+
+    def _not(self) -> tuple:
+        if self._peek('keyword', 'not'):
+            self._index += 1
+            return ('not', self._not())
+        return self._atom()
+
+    def _atom(self) -> tuple:
+        if self._peek('paren', '('):
+            self._index += 1
+            node = self._or()
+            if not self._peek('paren', ')'):
+                raise self._error('")"')
+            self._index += 1
+            return node
+
+        _, column = self._take('word', 'quoted')
+        _, op = self._take('op')
+        kind, value = self._take('word', 'quoted')
+
+        # unquoted numbers are compared numerically
+        if kind == 'word' and _number(value) is not None:
+            value = _number(value)
+
+        return ('compare', column, op, value)
+
+
+def _columns(node: tuple, columns: list):
+    """Append the columns referenced by a node to `columns`."""
+    if node[0] == 'compare':
+        if node[1] not in columns:
+            columns.append(node[1])
+    else:
+        for child in node[1:]:
+            _columns(child, columns)
+
+
+def _mask(node: tuple, frame: DataFrame) -> Series:
+    """Evaluate a node against every row of a `DataFrame`."""
+    from pandas import to_numeric
+
+    kind = node[0]
+    if kind == 'or':
+        return _mask(node[1], frame) | _mask(node[2], frame)
+    if kind == 'and':
+        return _mask(node[1], frame) & _mask(node[2], frame)
+    if kind == 'not':
+        return ~_mask(node[1], frame)
+
+    _, column, op, value = node
+    if column not in frame.columns:
+        return Series(False, index=frame.index, dtype=bool)
+
+    values = frame[column]
+    present = values.notnull()
+    if isinstance(value, float):
+        values = to_numeric(values, errors='coerce')
+        present = values.notnull()
+    else:
+        # typed columns are compared as text, like untyped ones
+        if values.dtype != object:
+            values = values.astype(str)
+        values = values.where(present, '')
+
+    return _OPERATORS[op](values, value) & present
+
+
+class RowFilter:
+    """Vectorized row predicate.
+
+    Expressions compare a column with a value, e.g. `status == FAIL` or
+    `temperature > 85`, and combine comparisons with `and`, `or`, `not`
+    and parentheses. Unquoted numbers are compared numerically, anything
+    else is compared as a string. Quote column names or values that
+    contain spaces or operators. Empty and missing values never match a
+    comparison.
+    """
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression (str): Filter expression.
+
+        Raises:
+            ValueError: The expression is malformed.
+        """
+        self._expression = expression
+        self._root = _Parser(expression).parse()
+        self._columns = list()
+        _columns(self._root, self._columns)
+
+    @property
+    def columns(self) -> list:
+        """`list`: Names of the columns the expression refers to."""
+        return self._columns
+
+    @property
+    def expression(self) -> str:
+        """`str`: The filter expression."""
+        return self._expression
+
+    def mask(self, frame: DataFrame) -> Series:
+        """Return which rows of a `DataFrame` match the expression.
+
+        Args:
+            frame (DataFrame): Data to evaluate.
+
+        Returns:
+            Series: Boolean values aligned with the rows of `frame`.
+        """
+        return _mask(self._root, frame)
+
+    def apply(self, frame: DataFrame) -> DataFrame:
+        """Return the rows of a `DataFrame` that match the expression.
+
+        Args:
+            frame (DataFrame): Data to filter.
+
+        Returns:
+            DataFrame: Matching rows.
+        """
+        return frame[self.mask(frame)]
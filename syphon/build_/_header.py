@@ -0,0 +1,111 @@
+"""syphon.build_._header.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+
+def union(headers) -> list:
+    """Return the union of several headers.
+
+    Args:
+        headers (iterable): Lists of column names.
+
+    Returns:
+        list: Every column name once, in order of first appearance.
+    """
+    columns = list()
+    seen = set()
+    for header in headers:
+        for column in header:
+            if column not in seen:
+                seen.add(column)
+                columns.append(column)
+    return columns
+
+
+def read_headers(file_list: list, jobs: int = 1) -> list:
+    """Read the header line of each csv file.
+
+    Args:
+        file_list (list): Absolute filepaths of csv files.
+        jobs (int): Number of files read at the same time.
+
+    Returns:
+        list: The column names of each file, in the order of
+            `file_list`.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from syphon._csvengine import read_header
+
+    from ._ordered import ordered_map
+
+    return list(ordered_map(read_header, file_list, jobs))
+
+
+def _stack_typed(frames: list, columns: list, dtypes: dict) -> DataFrame:
+    """Concatenate `DataFrame`s one column at a time, keeping the column
+    types."""
+    from pandas import concat, RangeIndex, Series
+    from syphon.schema.dtypes import pandas_dtype
+
+    data = dict()
+    for column in columns:
+        dtype = pandas_dtype(dtypes.get(column))
+        parts = [
+            frame[column] if column in frame.columns else Series(
+                index=RangeIndex(len(frame)), dtype=dtype)
+            for frame in frames
+        ]
+        if len(parts) == 0:
+            data[column] = Series(dtype=dtype)
+        else:
+            data[column] = concat(parts, ignore_index=True).astype(
+                dtype, copy=False)
+
+    return DataFrame(data, columns=columns)
+
+
+def stack(frames: list, columns: list, dtypes: dict = None) -> DataFrame:
+    """Concatenate `DataFrame`s with different headers.
+
+    The values of each frame are copied straight into their columns of
+    the result, so columns are aligned once per frame instead of once
+    per column block. Columns that are not in `columns` are dropped.
+
+    Args:
+        frames (list): `DataFrame`s to concatenate, in order.
+        columns (list): Header of the result.
+        dtypes (dict): Column types, e.g. "float64", indexed by column
+            name, or `None`. Columns without a type are strings.
+
+    Returns:
+        DataFrame: Every row of `frames` with a new index. Missing values
+            are `NaN`, or `NA` in integer columns. Every column has the
+            object dtype if `dtypes` is `None`.
+    """
+    from numpy import empty, nan
+
+    if dtypes is not None:
+        return _stack_typed(frames, columns, dtypes)
+
+    position = {column: index for index, column in enumerate(columns)}
+
+    values = empty(
+        (sum(len(frame) for frame in frames), len(columns)), dtype=object)
+    values.fill(nan)
+
+    start = 0
+    for frame in frames:
+        present = [column for column in frame.columns if column in position]
+        stop = start + len(frame)
+        values[start:stop, [position[column] for column in present]] = (
+            frame[present].values)
+        start = stop
+
+    return DataFrame(values, columns=columns)
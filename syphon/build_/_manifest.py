@@ -0,0 +1,168 @@
+"""syphon.build_._manifest.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+MANIFEST_SUFFIX = '.manifest.json'
+
+
+def manifest_path(cache: str) -> str:
+    """Return the filepath of the manifest that belongs to a cache file.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+
+    Returns:
+        str: Absolute filepath of the manifest file.
+    """
+    return cache + MANIFEST_SUFFIX
+
+
+def fingerprint(archive: str, file_list: list) -> dict:
+    """Return the size and modification time of each archive file.
+
+    Args:
+        archive (str): Absolute path to the archive directory.
+        file_list (list): Absolute filepaths of archive files.
+
+    Returns:
+        OrderedDict: `[size, mtime]` lists indexed by the filepath
+            relative to the archive directory, in the order of
+            `file_list`. Modification times are in nanoseconds.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from collections import OrderedDict
+    from os import stat
+    from os.path import relpath
+
+    sources = OrderedDict()
+    for file in file_list:
+        info = stat(file)
+        sources[relpath(file, archive)] = [info.st_size, info.st_mtime_ns]
+    return sources
+
+
+def load(cache: str) -> dict:
+    """Read the manifest of a cache file.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+
+    Returns:
+        dict: The manifest, or `None` if the cache file or its manifest
+            is missing or unreadable.
+    """
+    from json import loads
+    from os.path import exists
+
+    if not exists(cache):
+        return None
+
+    try:
+        with open(manifest_path(cache), 'r', encoding='utf-8') as file:
+            manifest = loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+    for key in ['archive', 'columns', 'options', 'sources']:
+        if key not in manifest:
+            return None
+
+    return manifest
+
+
+def remove(cache: str):
+    """Delete the manifest of a cache file, if there is one.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from os import remove as remove_file
+
+    try:
+        remove_file(manifest_path(cache))
+    except FileNotFoundError:
+        pass
+
+
+def save(cache: str, archive: str, sources: dict, columns: list,
+         options: dict):
+    """Write the manifest of a cache file.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+        archive (str): Absolute path to the archive directory.
+        sources (dict): Fingerprint of the archive files in the cache.
+        columns (list): Header of the cache file.
+        options (dict): Build options that change the cache contents.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from json import dumps
+
+    manifest = {
+        'archive': archive,
+        'columns': columns,
+        'options': options,
+        'sources': sources,
+    }
+
+    with open(manifest_path(cache), 'w', encoding='utf-8') as file:
+        file.write(dumps(manifest, indent=2, sort_keys=True))
+
+
+def current(
+        manifest: dict, archive: str, sources: dict, options: dict) -> bool:
+    """Return whether a cache file is up to date.
+
+    Args:
+        manifest (dict): Manifest of the existing cache file.
+        archive (str): Absolute path to the archive directory.
+        sources (dict): Fingerprint of the current archive files.
+        options (dict): Current build options that change the cache
+            contents.
+
+    Returns:
+        bool: `True` if the cache was built from the same archive files
+            with the same options.
+    """
+    return (manifest['archive'] == archive and
+            manifest['options'] == options and
+            manifest['sources'] == sources)
+
+
+def new_files(
+        manifest: dict, archive: str, sources: dict, options: dict) -> list:
+    """Return the archive files that are not in a manifest.
+
+    Args:
+        manifest (dict): Manifest of the existing cache file.
+        archive (str): Absolute path to the archive directory.
+        sources (dict): Fingerprint of the current archive files.
+        options (dict): Current build options that change the cache
+            contents.
+
+    Returns:
+        list: Paths of new archive files relative to the archive
+            directory, or `None` if any file in the manifest was
+            modified or deleted, or if the build options changed.
+    """
+    if manifest['archive'] != archive or manifest['options'] != options:
+        return None
+
+    old_sources = manifest['sources']
+    for path in old_sources:
+        if sources.get(path) != old_sources[path]:
+            return None
+
+    return [path for path in sources if path not in old_sources]
@@ -0,0 +1,47 @@
+"""syphon.build_._ordered.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+
+
+def ordered_map(function, items, jobs: int = 1):
+    """Apply a function to each item using a pool of threads.
+
+    Results are yielded in the same order as the items. At most `jobs`
+    results are computed ahead of the one being consumed, so memory use
+    stays bounded no matter how many items there are.
+
+    Args:
+        function (func): Function f(item) to apply.
+        items (iterable): Items to apply `function` to.
+        jobs (int): Number of threads. Items are handled one at a time
+            in the calling thread if this is less than 2.
+
+    Yields:
+        The result of `function` for the next item.
+
+    Raises:
+        Exception: The error raised by `function` for the next item.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    if jobs < 2:
+        for item in items:
+            yield function(item)
+        return
+
+    with ThreadPoolExecutor(jobs) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) > jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
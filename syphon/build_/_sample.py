@@ -0,0 +1,196 @@
+"""syphon.build_._sample.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+SAMPLE_CHUNKSIZE = 100000
+
+
+def parse(value: str):
+    """Parse a sample size.
+
+    Args:
+        value (str): A number of rows, e.g. "1000", or a fraction of the
+            rows, e.g. "0.01".
+
+    Returns:
+        An `int` number of rows or a `float` fraction.
+
+    Raises:
+        ValueError: The value is not a positive number of rows or a
+            fraction between 0 and 1.
+    """
+    try:
+        if '.' in value or 'e' in value.lower():
+            sample = float(value)
+        else:
+            sample = int(value)
+    except ValueError:
+        sample = None
+
+    if sample is None or sample <= 0 or (
+            isinstance(sample, float) and sample > 1):
+        raise ValueError('Expected a number of rows or a fraction between 0 '
+                         'and 1, found "{}"'.format(value))
+    return sample
+
+
+class Reservoir:
+    """Uniform random sample of a fixed number of rows.
+
+    Every row has the same chance to be in the sample, no matter how
+    many rows are added, and only `size` rows are kept in memory. The
+    sample keeps the order the rows were added in.
+    """
+    def __init__(self, size: int, columns: list, seed: int = None,
+                 dtypes: dict = None):
+        """
+        Args:
+            size (int): Number of rows in the sample.
+            columns (list): Column names of the sample. Other columns are
+                dropped.
+            seed (int): Seed of the random number generator, or `None`
+                for a different sample every time.
+            dtypes (dict): Column types of the sample, e.g. "float64",
+                indexed by column name, or `None`. Columns without a
+                type are strings.
+        """
+        from numpy.random import RandomState
+
+        self._columns = list(columns)
+        self._dtypes = dtypes
+        self._filling = list()
+        self._positions = None
+        self._random = RandomState(seed)
+        self._seen = 0
+        self._size = size
+        self._values = None
+
+    @property
+    def seen(self) -> int:
+        """`int`: Number of rows added so far."""
+        return self._seen
+
+    def _fill(self):
+        from numpy import arange, concatenate, empty
+
+        self._values = concatenate(self._filling) if len(
+            self._filling) != 0 else empty((0, len(self._columns)), object)
+        self._positions = arange(len(self._values))
+        self._filling = list()
+
+    def add(self, frame: DataFrame):
+        """Offer the rows of a `DataFrame` to the sample.
+
+        Args:
+            frame (DataFrame): Data to sample.
+        """
+        from numpy import arange, floor
+
+        from ._header import stack
+
+        if len(frame) == 0:
+            return
+
+        values = stack([frame], self._columns).values
+        start = self._seen
+        self._seen += len(values)
+
+        # the first rows fill the sample
+        room = max(0, self._size - start)
+        if room != 0:
+            self._filling.append(values[:room])
+            values = values[room:]
+            start += room
+        if len(values) == 0:
+            return
+        if self._values is None:
+            self._fill()
+
+        # row i replaces a random row of the sample with probability
+        # size / (i + 1), later rows winning ties like a sequential pass
+        positions = arange(start, start + len(values))
+        slots = floor(
+            self._random.random_sample(len(values)) * (positions + 1))
+        slots = slots.astype('int64')
+        keep = slots < self._size
+        self._values[slots[keep]] = values[keep]
+        self._positions[slots[keep]] = positions[keep]
+
+    def result(self) -> DataFrame:
+        """Return the sample.
+
+        Returns:
+            DataFrame: The sampled rows in the order they were added.
+        """
+        from ._header import stack
+
+        if self._values is None:
+            self._fill()
+
+        order = self._positions.argsort(kind='mergesort')
+        result = DataFrame(self._values[order], columns=self._columns)
+        if self._dtypes is not None:
+            result = stack([result], self._columns, self._dtypes)
+        return result
+
+
+class Bernoulli:
+    """Random sample of a fraction of the rows.
+
+    Each row is kept with the same probability on its own, so nothing
+    but the sample is kept in memory and the sample size varies
+    slightly around the expected fraction.
+    """
+    def __init__(self, fraction: float, columns: list, seed: int = None,
+                 dtypes: dict = None):
+        """
+        Args:
+            fraction (float): Probability of keeping each row.
+            columns (list): Column names of the sample. Other columns are
+                dropped.
+            seed (int): Seed of the random number generator, or `None`
+                for a different sample every time.
+            dtypes (dict): Column types of the sample, e.g. "float64",
+                indexed by column name, or `None`. Columns without a
+                type are strings.
+        """
+        from numpy.random import RandomState
+
+        self._columns = list(columns)
+        self._dtypes = dtypes
+        self._fraction = fraction
+        self._frames = list()
+        self._random = RandomState(seed)
+        self._seen = 0
+
+    @property
+    def seen(self) -> int:
+        """`int`: Number of rows added so far."""
+        return self._seen
+
+    def add(self, frame: DataFrame):
+        """Offer the rows of a `DataFrame` to the sample.
+
+        Args:
+            frame (DataFrame): Data to sample.
+        """
+        if len(frame) == 0:
+            return
+
+        self._seen += len(frame)
+        keep = self._random.random_sample(len(frame)) < self._fraction
+        self._frames.append(frame[keep])
+
+    def result(self) -> DataFrame:
+        """Return the sample.
+
+        Returns:
+            DataFrame: The sampled rows in the order they were added.
+        """
+        from ._header import stack
+
+        return stack(self._frames, self._columns, self._dtypes)
@@ -0,0 +1,195 @@
+"""syphon.build_._shards.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+INDEX_SUFFIX = '.shards.json'
+
+
+def index_path(cache: str) -> str:
+    """Return the filepath of the shard index of a sharded cache.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+
+    Returns:
+        str: Absolute filepath of the shard index.
+    """
+    return cache + INDEX_SUFFIX
+
+
+def shard_path(cache: str, number: int) -> str:
+    """Return the filepath of a shard, e.g. "all.00003.csv".
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+        number (int): Zero-based shard number.
+
+    Returns:
+        str: Absolute filepath of the shard.
+    """
+    from os.path import splitext
+
+    root, extension = splitext(cache)
+    return '{0}.{1:05d}{2}'.format(root, number, extension)
+
+
+def load(cache: str) -> dict:
+    """Read the shard index of a sharded cache.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+
+    Returns:
+        dict: The shard index, or `None` if it is missing or unreadable.
+    """
+    from json import loads
+
+    try:
+        with open(index_path(cache), 'r', encoding='utf-8') as file:
+            index = loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(index, dict) or 'shards' not in index:
+        return None
+
+    return index
+
+
+def remove(cache: str):
+    """Delete the shard index and every shard it lists, if there is one.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from os import remove as remove_file
+    from os.path import dirname, join
+
+    index = load(cache)
+    if index is None:
+        return
+
+    for shard in index['shards']:
+        try:
+            remove_file(join(dirname(cache), shard['path']))
+        except FileNotFoundError:
+            pass
+
+    remove_file(index_path(cache))
+
+
+def save(cache: str, columns: list, shards: list):
+    """Write the shard index of a sharded cache.
+
+    Args:
+        cache (str): Absolute filepath of the cache file.
+        columns (list): Header of every shard.
+        shards (list): `(filepath, rows)` tuples in order.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from json import dumps
+    from os.path import basename
+
+    index = {
+        'columns': columns,
+        'rows': sum(rows for _, rows in shards),
+        'shards': [
+            {'path': basename(filepath), 'rows': rows}
+            for filepath, rows in shards
+        ],
+    }
+
+    with open(index_path(cache), 'w', encoding='utf-8') as file:
+        file.write(dumps(index, indent=2, sort_keys=True))
+
+
+class ShardWriter:
+    """Rolling writer that starts a new shard every `max_rows` rows."""
+    def __init__(self, cache: str, columns: list, max_rows: int,
+                 open_writer):
+        """
+        Args:
+            cache (str): Absolute filepath of the cache file. Shards are
+                named after it.
+            columns (list): Column names of every shard.
+            max_rows (int): Maximum number of rows in each shard.
+            open_writer: Callable that takes a binary file object and a
+                column list and returns a writer with `write(frame)` and
+                `detach()` methods.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        self._cache = cache
+        self._columns = list(columns)
+        self._max_rows = max_rows
+        self._open_writer = open_writer
+        self._file = None
+        self._writer = None
+        self._shards = list()
+
+        self._open()
+
+    @property
+    def columns(self) -> list:
+        """`list`: Column names of every shard."""
+        return self._columns
+
+    @property
+    def shards(self) -> list:
+        """`list`: `(filepath, rows)` tuples of the shards written so
+        far."""
+        return [(filepath, rows) for filepath, rows in self._shards]
+
+    def _open(self):
+        filepath = shard_path(self._cache, len(self._shards))
+        self._file = open(filepath, 'wb')
+        self._writer = self._open_writer(self._file, self._columns)
+        self._shards.append([filepath, 0])
+
+    def _close(self):
+        try:
+            self._writer.detach()
+        finally:
+            self._file.close()
+
+    def write(self, frame: DataFrame):
+        """Write the rows of a `DataFrame`, starting new shards as needed.
+
+        Args:
+            frame (DataFrame): Data to write.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        while len(frame) != 0:
+            if self._shards[-1][1] >= self._max_rows:
+                self._close()
+                self._open()
+
+            room = self._max_rows - self._shards[-1][1]
+            self._writer.write(frame.iloc[:room])
+            self._shards[-1][1] += min(room, len(frame))
+            frame = frame.iloc[room:]
+
+    def close(self):
+        """Finish the current shard.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        self._close()
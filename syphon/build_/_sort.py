@@ -0,0 +1,176 @@
+"""syphon.build_._sort.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from pandas import DataFrame
+
+SORT_BUFFER_ROWS = 1000000
+
+MERGE_BATCH_ROWS = 10000
+
+
+def sort_frame(frame: DataFrame, keys: list) -> DataFrame:
+    """Stable sort of a `DataFrame` by string columns, empty values last.
+
+    Args:
+        frame (DataFrame): Data to sort.
+        keys (list): Names of the columns to sort by, in order.
+
+    Returns:
+        DataFrame: Sorted data.
+    """
+    return frame.sort_values(keys, kind='mergesort', na_position='last')
+
+
+class ExternalSorter:
+    """Bounded memory merge sort.
+
+    Frames are buffered until there are `buffer_rows` rows, which are
+    sorted and spilled to a temporary run file. The runs are then merged
+    a row at a time.
+    """
+    def __init__(self, keys: list, columns: list, buffer_rows: int,
+                 directory: str = None):
+        """
+        Args:
+            keys (list): Names of the columns to sort by, in order.
+            columns (list): Column names of the sorted data. Sort columns
+                are added if they are missing.
+            buffer_rows (int): Maximum number of rows kept in memory.
+            directory (str): Directory of the temporary run files, or
+                `None` to use the default temporary directory.
+        """
+        self._buffer = list()
+        self._buffer_rows = buffer_rows
+        self._columns = list(columns) + [
+            key for key in keys if key not in columns]
+        self._directory = directory
+        self._keys = list(keys)
+        self._rows = 0
+        self._runs = list()
+        self._tempdir = None
+
+    @property
+    def runs(self) -> int:
+        """`int`: Number of run files spilled so far."""
+        return len(self._runs)
+
+    def _sorted_buffer(self) -> DataFrame:
+        from pandas import concat
+
+        if len(self._buffer) == 0:
+            return DataFrame(columns=self._columns)
+
+        frame = concat(self._buffer, ignore_index=True, sort=False)
+        self._buffer = list()
+        self._rows = 0
+        return sort_frame(frame.reindex(columns=self._columns), self._keys)
+
+    def _spill(self):
+        from os.path import join
+        from tempfile import mkdtemp
+
+        from syphon._csvengine import CsvWriter
+
+        if self._tempdir is None:
+            self._tempdir = mkdtemp(prefix='.syphon-sort-',
+                                    dir=self._directory)
+
+        filepath = join(self._tempdir, '{0:05d}.csv'.format(len(self._runs)))
+        with open(filepath, 'wb') as file:
+            writer = CsvWriter(file, self._columns)
+            try:
+                writer.write(self._sorted_buffer())
+            finally:
+                writer.detach()
+        self._runs.append(filepath)
+
+    def add(self, frame: DataFrame):
+        """Buffer rows to be sorted, spilling a run if the buffer is full.
+
+        Args:
+            frame (DataFrame): Data to sort.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        if len(frame) == 0:
+            return
+
+        self._buffer.append(frame)
+        self._rows += len(frame)
+        if self._rows >= self._buffer_rows:
+            self._spill()
+
+    def _merge(self, files: list):
+        """Yield the rows of every run in sorted order."""
+        from csv import reader
+        from heapq import merge
+
+        indexes = [self._columns.index(key) for key in self._keys]
+
+        def key(row: list) -> tuple:
+            return tuple((row[i] == '', row[i]) for i in indexes)
+
+        runs = list()
+        for file in files:
+            rows = reader(file)
+            next(rows)
+            runs.append(rows)
+
+        return merge(*runs, key=key)
+
+    def sorted(self, batch_rows: int = MERGE_BATCH_ROWS):
+        """Yield every added row in sorted order.
+
+        Args:
+            batch_rows (int): Number of rows in each merged `DataFrame`.
+
+        Yields:
+            DataFrame: The next sorted rows.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from numpy import nan
+
+        if len(self._runs) == 0:
+            yield self._sorted_buffer()
+            return
+
+        if self._rows != 0:
+            self._spill()
+
+        files = [
+            open(run, 'r', newline='', encoding='utf-8')
+            for run in self._runs
+        ]
+        try:
+            batch = list()
+            for row in self._merge(files):
+                batch.append(row)
+                if len(batch) == batch_rows:
+                    frame = DataFrame(batch, columns=self._columns)
+                    yield frame.where(frame != '', nan)
+                    batch = list()
+            if len(batch) != 0:
+                frame = DataFrame(batch, columns=self._columns)
+                yield frame.where(frame != '', nan)
+        finally:
+            for file in files:
+                file.close()
+
+    def close(self):
+        """Delete the temporary run files."""
+        from shutil import rmtree
+
+        self._buffer = list()
+        self._rows = 0
+        self._runs = list()
+        if self._tempdir is not None:
+            rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
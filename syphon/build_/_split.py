@@ -0,0 +1,99 @@
+"""syphon.build_._split.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from collections import OrderedDict
+
+from pandas import DataFrame
+
+from syphon._csvengine import PANDAS
+
+MAX_OPEN_FILES = 64
+
+SPLIT_EXTENSION = '.csv'
+
+
+class WriterPool:
+    """Bounded pool of csv writers, one per output file.
+
+    The least recently used file is closed when the pool is full. It is
+    reopened in append mode if more rows arrive for it.
+    """
+    def __init__(self, directory: str, columns: list, engine: str = PANDAS,
+                 size: int = MAX_OPEN_FILES):
+        """
+        Args:
+            directory (str): Absolute path of the output directory.
+            columns (list): Column names of every output file.
+            engine (str): Either "pandas" or "pyarrow".
+            size (int): Maximum number of open files.
+        """
+        self._columns = list(columns)
+        self._directory = directory
+        self._engine = engine
+        self._files = list()
+        self._open = OrderedDict()
+        self._size = size
+
+    @property
+    def files(self) -> list:
+        """`list`: Absolute filepaths of the output files in order of
+        creation."""
+        return list(self._files)
+
+    def _writer(self, name: str):
+        """Return the writer of an output file, opening it if needed."""
+        from os.path import join
+
+        from syphon._csvengine import CsvWriter
+
+        if name in self._open:
+            self._open.move_to_end(name)
+            return self._open[name][1]
+
+        if len(self._open) >= self._size:
+            _, (file, writer) = self._open.popitem(last=False)
+            self._close(file, writer)
+
+        filepath = join(self._directory, name + SPLIT_EXTENSION)
+        created = filepath not in self._files
+        file = open(filepath, 'wb' if created else 'ab')
+        writer = CsvWriter(file, self._columns, self._engine, header=created)
+        if created:
+            self._files.append(filepath)
+
+        self._open[name] = (file, writer)
+        return writer
+
+    @staticmethod
+    def _close(file, writer):
+        try:
+            writer.detach()
+        finally:
+            file.close()
+
+    def write(self, name: str, frame: DataFrame):
+        """Write the rows of a `DataFrame` to an output file.
+
+        Args:
+            name (str): Output filename without its extension.
+            frame (DataFrame): Data to write.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        self._writer(name).write(frame)
+
+    def close(self):
+        """Close every open output file.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        while len(self._open) != 0:
+            _, (file, writer) = self._open.popitem(last=False)
+            self._close(file, writer)
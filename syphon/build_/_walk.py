@@ -0,0 +1,103 @@
+"""syphon.build_._walk.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+LINUX_HIDDEN_CHAR = '.'
+
+WALKERS = 16
+
+
+def _scan(path: str) -> tuple:
+    """Return the sorted subdirectory and file names of a directory.
+
+    Hidden files are skipped, but not hidden directories, which are
+    archive directories of values like ".5". Directory entry types are
+    used, so no entry is stat'ed on file systems that report them.
+    Directories that cannot be read are treated as empty, like
+    `os.walk`.
+    """
+    from os import scandir
+
+    directories = list()
+    files = list()
+    try:
+        # the iterator is only a context manager on Python 3.6+, and
+        # exhausting it closes the directory
+        for entry in scandir(path):
+            if entry.is_dir(follow_symlinks=False):
+                directories.append(entry.name)
+            elif entry.name[0] == LINUX_HIDDEN_CHAR:
+                continue
+            elif entry.is_file():
+                files.append(entry.name)
+    except OSError:
+        pass
+
+    return sorted(directories), sorted(files)
+
+
+def _scan_all(paths: list) -> list:
+    """Scan a batch of directories."""
+    return [_scan(path) for path in paths]
+
+
+def walk(root: str, depth: int = None, levels: list = None,
+         workers: int = WALKERS) -> list:
+    """Return the files of a directory tree in sorted path order.
+
+    The tree is scanned one level at a time, and the directories of
+    each level are scanned concurrently.
+
+    Args:
+        root (str): Absolute path of the directory tree.
+        depth (int): Only return the files of directories this many
+            levels below `root`, and never scan deeper. `None` returns
+            the files of every level.
+        levels (list): Allowed directory names of each level. `None`
+            entries allow every name. Other directories are not
+            scanned.
+        workers (int): Number of directories scanned at the same time.
+
+    Returns:
+        list: Absolute filepaths. Hidden files are skipped.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from os.path import join
+
+    if levels is None:
+        levels = list()
+
+    result = list()
+    current = [root]
+    level = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while len(current) != 0:
+            # batches keep the scheduling cost low on fast file systems
+            size = max(1, len(current) // (workers * 4))
+            batches = [
+                current[i:i + size] for i in range(0, len(current), size)]
+            scans = [
+                scan for batch in executor.map(_scan_all, batches)
+                for scan in batch
+            ]
+
+            following = list()
+            for path, (directories, files) in zip(current, scans):
+                if depth is None or level == depth:
+                    result.extend(join(path, name) for name in files)
+
+                if depth is not None and level >= depth:
+                    continue
+
+                if level < len(levels) and levels[level] is not None:
+                    directories = [
+                        name for name in directories if name in levels[level]
+                    ]
+                following.extend(join(path, name) for name in directories)
+
+            current = following
+            level += 1
+
+    return result
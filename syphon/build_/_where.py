@@ -0,0 +1,73 @@
+"""syphon.build_._where.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from sortedcontainers import SortedDict
+
+
+def parse(expressions: list) -> SortedDict:
+    """Parse `COLUMN=VALUE[,COLUMN=VALUE...]` expressions.
+
+    Values of the same column are alternatives. Different columns must
+    all match.
+
+    Args:
+        expressions (list): Expression strings.
+
+    Returns:
+        SortedDict: Sorted value lists indexed by column name.
+
+    Raises:
+        ValueError: An expression is not of the form COLUMN=VALUE.
+    """
+    result = SortedDict()
+    for expression in expressions:
+        for predicate in expression.split(','):
+            column, sep, value = predicate.partition('=')
+            if sep == '' or column == '' or value == '':
+                raise ValueError(
+                    'Expected COLUMN=VALUE, found "{}"'.format(predicate))
+            values = result.setdefault(column, list())
+            if value not in values:
+                values.append(value)
+
+    for column in result:
+        result[column] = sorted(result[column])
+
+    return result
+
+
+def levels(schema: SortedDict, where: SortedDict) -> list:
+    """Map column predicates onto the archive directory hierarchy.
+
+    Args:
+        schema (SortedDict): Archive directory storage schema.
+        where (SortedDict): Value lists indexed by column name.
+
+    Returns:
+        list: One entry per schema column. Each entry is either the set
+            of normalized directory names that match, or `None` if any
+            directory matches.
+
+    Raises:
+        ValueError: A column is not part of the schema.
+    """
+    from syphon.schema.resolvepath import _normalize
+
+    headers = [schema[key] for key in schema]
+
+    for column in where:
+        if column not in headers:
+            raise ValueError(
+                'Cannot prune by "{}", it is not a schema column'
+                .format(column))
+
+    result = list()
+    for header in headers:
+        if header in where:
+            result.append(set(_normalize(value) for value in where[header]))
+        else:
+            result.append(None)
+    return result
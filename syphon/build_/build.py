@@ -4,60 +4,1044 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
+from pandas import DataFrame
 from syphon import Context
 
+STDOUT = '-'
 
-LINUX_HIDDEN_CHAR = '.'
+
+def _schema(context: Context):
+    """Return the schema of the archive directory.
+
+    The schema file is loaded if `Context.schema` is not set. An empty
+    schema is returned if there is no schema file.
+    """
+    from os.path import exists, join
+
+    from sortedcontainers import SortedDict
+    from syphon.schema import load
+
+    if context.schema is not None:
+        return context.schema
+
+    schemafile = join(context.archive, context.schema_file)
+    if exists(schemafile):
+        return load(schemafile)
+
+    return SortedDict()
+
+
+def _catalog(context: Context) -> list:
+    """Return the files listed in the archive catalog, or `None` if the
+    archive does not have a catalog."""
+    from os.path import exists, join
+
+    from syphon.catalog import Catalog
+
+    catalog_path = join(context.archive, context.catalog_file)
+    if not exists(catalog_path):
+        return None
+
+    with Catalog(catalog_path) as catalog:
+        return catalog.files()
+
+
+def _uncataloged(file_list: list) -> list:
+    """Return the files of the directories of `file_list` that are not
+    in it, such as files copied into the archive without syphon."""
+    from concurrent.futures import ThreadPoolExecutor
+    from os.path import dirname, join
+
+    from ._walk import WALKERS, _scan
+
+    listed = set(file_list)
+    directories = sorted(set(dirname(file) for file in file_list))
+    with ThreadPoolExecutor(max_workers=WALKERS) as executor:
+        scans = list(executor.map(_scan, directories))
+
+    return [
+        join(directory, name)
+        for directory, (_, files) in zip(directories, scans)
+        for name in files if join(directory, name) not in listed
+    ]
+
+
+def _file_list(context: Context) -> list:
+    """Return the archive files in sorted path order.
+
+    If the archive has a schema, only the files of the directories at
+    the schema depth are archive files. Directories that cannot match
+    `Context.where` are never entered.
+
+    If the archive has a catalog, the files are listed from it instead
+    of walking the archive directory. Files that are not in the catalog
+    are skipped. If `Context.check_catalog` is set, a warning is printed
+    if any of them are next to the listed files.
+    """
+    from os import sep
+    from os.path import join
+
+    from . import _where
+    from ._walk import walk
+
+    schema = _schema(context)
+
+    levels = list()
+    if context.where:
+        levels = _where.levels(schema, context.where)
+
+    depth = None
+    if len(schema) != 0:
+        depth = len(schema)
+
+    records = _catalog(context)
+    if records is None:
+        return walk(context.archive, depth, levels)
+
+    file_list = list()
+    for path, _, _, _ in records:
+        directories = path.split(sep)[:-1]
+        if depth is not None and len(directories) != depth:
+            continue
+        if any(level is not None and name not in level
+               for name, level in zip(directories, levels)):
+            continue
+        file_list.append(join(context.archive, path))
+
+    uncataloged = list()
+    if context.check_catalog:
+        uncataloged = _uncataloged(file_list)
+    if len(uncataloged) != 0:
+        print('Build: skipping {0} files that are not in the catalog, e.g. '
+              '{1}. Run "syphon catalog" to add them.'.format(
+                  len(uncataloged), uncataloged[0]))
+    return file_list
+
+
+def _fingerprint(context: Context, file_list: list) -> dict:
+    """Return the manifest fingerprint of the archive files.
+
+    Sizes and modification times are taken from the archive catalog, if
+    there is one, so the archive files are not stat'ed.
+    """
+    from collections import OrderedDict
+    from os.path import join
+
+    from . import _manifest
+
+    records = _catalog(context)
+    if records is None:
+        return _manifest.fingerprint(context.archive, file_list)
+
+    known = {
+        join(context.archive, path): (path, [size, mtime_ns])
+        for path, size, mtime_ns, _ in records
+    }
+    return OrderedDict(known[file] for file in file_list)
+
+
+def _columns(context: Context, file_list: list) -> list:
+    """Return the header of the cache file.
+
+    This is either `Context.columns` or the union of all file headers in
+    order of appearance. Only the header line of each file is read, or
+    none at all if the archive has a catalog.
+    """
+    from os.path import exists, join
+
+    from syphon.catalog import Catalog
+
+    from ._header import read_headers, union
+
+    if context.columns is not None:
+        return list(context.columns)
+
+    catalog_path = join(context.archive, context.catalog_file)
+    if not exists(catalog_path):
+        return union(read_headers(file_list, context.jobs))
+
+    with Catalog(catalog_path) as catalog:
+        headers = {
+            join(context.archive, path): header
+            for path, header in catalog.headers().items()
+        }
+    return union(headers[file] for file in file_list)
+
+
+def _dtypes(context: Context) -> dict:
+    """Return the column types that archive files are read into, or
+    `None` if `Context.typed` is not set and every column is a string.
+
+    Raises:
+        ValueError: The archive does not have a column types file.
+    """
+    from os.path import exists, join
+
+    from syphon.schema import load_dtypes
+
+    if not context.typed:
+        return None
+
+    dtypes_path = join(context.archive, context.dtypes_file)
+    if not exists(dtypes_path):
+        raise ValueError('Archive has no column types @ {}, create one '
+                         'with "init --typed"'.format(dtypes_path))
+    return load_dtypes(dtypes_path)
+
+
+def _row_filter(context: Context):
+    """Return the parsed `Context.filter`, or `None` if it is not set."""
+    from ._filter import RowFilter
+
+    if context.filter is None:
+        return None
+    return RowFilter(context.filter)
+
+
+def _aggregates(context: Context) -> list:
+    """Return the parsed `Context.agg`, or `None` if the build is not an
+    aggregate."""
+    from . import _aggregate
+
+    if context.group_by is None and context.agg is None:
+        return None
+    return _aggregate.parse(context.agg or [_aggregate.COUNT])
+
+
+def _read_chunks(context: Context, file: str, row_filter=None):
+    """Return an iterable of the chunks of an archive file.
+
+    The whole file is a single chunk if `Context.chunksize` is not set.
+    Rows that do not match `row_filter` are dropped from each chunk.
+    Projected columns that are not in the file are left empty.
+    """
+    from syphon._csvengine import read_csv, read_csv_chunks, read_header
+
+    from . import _aggregate
+    from ._sample import SAMPLE_CHUNKSIZE
+
+    columns = context.columns
+    # aggregates only read the group and aggregate columns
+    aggregates = _aggregates(context)
+    if aggregates is not None:
+        columns = _aggregate.columns(context.group_by or [], aggregates)
+    # filtered and split columns are read even if they are not built
+    projection = None
+    if columns is not None:
+        extra = list()
+        if row_filter is not None:
+            extra.extend(row_filter.columns)
+        if context.split_by is not None:
+            extra.append(context.split_by)
+        if context.sort_by is not None:
+            extra.extend(context.sort_by)
+        if context.distinct and context.distinct_key is not None:
+            extra.extend(context.distinct_key)
+        columns = columns + [c for c in extra if c not in columns]
+
+        # the rows of a file without any of those columns are still built,
+        # so a single column is read to count them
+        header = read_header(file)
+        if not any(column in header for column in columns):
+            projection = columns
+            columns = columns + header[:1]
+
+    chunksize = context.chunksize
+    # sorted builds keep at most a sort buffer of rows in memory
+    if chunksize is None and context.sort_by is not None:
+        chunksize = context.sort_buffer
+    # limited builds stop reading a file part of the way through
+    if chunksize is None and context.limit is not None:
+        chunksize = min(context.limit, SAMPLE_CHUNKSIZE)
+    if chunksize is None and context.sample is not None:
+        chunksize = SAMPLE_CHUNKSIZE
+
+    dtypes = _dtypes(context)
+    if chunksize is None:
+        chunks = [read_csv(file, context.engine, columns, dtypes)]
+    else:
+        chunks = read_csv_chunks(
+            file, chunksize, context.engine, columns, dtypes)
+
+    if projection is not None and chunksize is None:
+        chunks = [chunk.reindex(columns=projection) for chunk in chunks]
+    elif projection is not None:
+        chunks = (chunk.reindex(columns=projection) for chunk in chunks)
+
+    if row_filter is not None and chunksize is None:
+        chunks = [row_filter.apply(chunk) for chunk in chunks]
+    elif row_filter is not None:
+        chunks = (row_filter.apply(chunk) for chunk in chunks)
+
+    return chunks
+
+
+def _chunks(context: Context, file: str, row_filter=None):
+    """Return the chunks of an archive file.
+
+    A single file is read ahead when reading in parallel.
+    """
+    chunks = _read_chunks(context, file, row_filter)
+    if not isinstance(chunks, list) and context.jobs > 1:
+        return list(chunks)
+    return chunks
+
+
+def _options(context: Context) -> dict:
+    """Return the build options that change the cache contents."""
+    from ._arrowwriter import CSV, output_format
+
+    options = dict()
+    if context.agg is not None:
+        options['agg'] = list(context.agg)
+    if context.distinct:
+        options['distinct'] = context.distinct_key or True
+    if output_format(context.cache, context.format) != CSV:
+        options['format'] = output_format(context.cache, context.format)
+    if context.group_by is not None:
+        options['group_by'] = list(context.group_by)
+    if context.columns is not None:
+        options['columns'] = list(context.columns)
+    if context.filter is not None:
+        options['filter'] = context.filter
+    if context.limit is not None:
+        options['limit'] = context.limit
+    if context.sample is not None:
+        options['sample'] = [context.sample, context.seed]
+    if context.sort_by is not None:
+        options['sort_by'] = list(context.sort_by)
+    if context.typed:
+        options['typed'] = dict(_dtypes(context))
+    if context.where:
+        options['where'] = dict(context.where)
+    return options
+
+
+def _write_cache(context: Context, cache):
+    """Write a `DataFrame` to the cache file in the output format.
+
+    The cache file is Arrow IPC (Feather version 2) if `Context.format`
+    is "feather", or if it is not set and the cache file extension is
+    ".arrow", ".feather" or ".ipc". Otherwise it is a csv file.
+    """
+    from syphon._csvengine import write_csv
+
+    from ._arrowwriter import FEATHER, output_format, write_arrow
+
+    if output_format(context.cache, context.format) == FEATHER:
+        write_arrow(cache, context.cache, _dtypes(context))
+    else:
+        write_csv(cache, context.cache, context.engine)
+
+
+def _writer(context: Context, file, columns: list, header: bool = True):
+    """Return a csv or Arrow IPC writer of the cache format."""
+    from syphon._csvengine import CsvWriter
+
+    from ._arrowwriter import ArrowWriter, FEATHER, output_format
+
+    if output_format(context.cache, context.format) == FEATHER:
+        return ArrowWriter(file, columns, _dtypes(context))
+    return CsvWriter(file, columns, context.engine, header=header)
+
+
+def _tempdir(context: Context) -> str:
+    """Return the directory of temporary build files, which is next to
+    the cache file unless it is written to standard output."""
+    from os.path import dirname
+
+    if context.cache == STDOUT:
+        return None
+    return dirname(context.cache)
+
+
+def _write_chunks(context: Context, writer, file_list: list, row_filter):
+    """Read each archive file a chunk at a time and write the chunks.
+
+    If `Context.distinct` is `True`, only the first row with each value
+    of the `Context.distinct_key` columns, or of every column, is kept.
+    Rows are compared by a 128 bit hash, and once more than
+    `Context.distinct_buffer` keys have been seen the remaining rows are
+    deduplicated in hash partitions on disk, out of archive order.
+
+    If `Context.sort_by` is set, runs of `Context.sort_buffer` rows are
+    sorted, spilled to temporary files and merged. Values are compared
+    as strings, empty values sort last, and rows with equal keys keep
+    their archive order.
+    """
+    from ._distinct import Deduplicator
+    from ._ordered import ordered_map
+    from ._sort import ExternalSorter
+
+    deduplicator = None
+    if context.distinct:
+        key = context.distinct_key
+        if key is None:
+            key = writer.columns
+        deduplicator = Deduplicator(
+            key, writer.columns, context.distinct_buffer,
+            _tempdir(context), context.engine)
+
+    sorter = None
+    if context.sort_by is not None:
+        sorter = ExternalSorter(context.sort_by, writer.columns,
+                                context.sort_buffer, _tempdir(context))
+
+    def emit(frame):
+        if sorter is None:
+            writer.write(frame)
+        else:
+            sorter.add(frame)
+
+    try:
+        chunk_lists = ordered_map(
+            lambda file: _chunks(context, file, row_filter), file_list,
+            context.jobs)
+        for file, chunks in zip(file_list, chunk_lists):
+            if context.verbose:
+                print('Build: from {0}'.format(file))
+
+            for chunk in chunks:
+                if deduplicator is not None:
+                    chunk = deduplicator.add(chunk)
+                emit(chunk)
+
+        if deduplicator is not None:
+            if context.verbose and deduplicator.spilled:
+                print('Build: deduplicating spilled partitions')
+
+            for frame in deduplicator.remaining():
+                emit(frame)
+
+        if sorter is not None:
+            if context.verbose:
+                print('Build: merging {0} sorted runs'.format(sorter.runs))
+
+            for frame in sorter.sorted():
+                writer.write(frame)
+    finally:
+        if deduplicator is not None:
+            deduplicator.close()
+        if sorter is not None:
+            sorter.close()
+
+
+def _stream(context: Context, file_list: list, columns: list, mode: str,
+            row_filter=None):
+    """Write each archive file to the cache a chunk at a time.
+
+    The header is only written if `mode` is "wb". Arrow IPC files are
+    always written from scratch.
+    """
+    with open(context.cache, mode) as cache:
+        writer = _writer(context, cache, columns, header=(mode == 'wb'))
+        try:
+            _write_chunks(context, writer, file_list, row_filter)
+        finally:
+            writer.detach()
+
+
+def _count(context: Context, file_list: list, row_filter) -> int:
+    """Return the number of rows that a build would write."""
+    from syphon._csvengine import read_csv_chunks, read_header
+
+    from ._ordered import ordered_map
+
+    def count(file: str) -> int:
+        # a single column is enough to count rows, and filter columns
+        # that are not in the file are empty, the same as when building
+        columns = read_header(file)[:1]
+        if row_filter is not None:
+            columns = columns + [
+                c for c in row_filter.columns if c not in columns]
+        chunks = read_csv_chunks(
+            file, context.chunksize or 100000, context.engine, columns)
+        if row_filter is not None:
+            return sum(
+                int(row_filter.mask(chunk.reindex(columns=columns)).sum())
+                for chunk in chunks)
+        return sum(len(chunk) for chunk in chunks)
+
+    return sum(ordered_map(count, file_list, context.jobs))
+
+
+def _shard(context: Context, file_list: list, columns: list,
+           row_filter=None):
+    """Write each archive file to rolling cache shards a chunk at a time.
+
+    Shards hold at most `Context.max_rows` rows, or the rows are counted
+    first and split into `Context.shards` shards of roughly equal size.
+    Shards are named after the cache file, e.g. "all.00000.csv".
+
+    Returns the `(filepath, rows)` tuples of the shards.
+    """
+    from ._shards import ShardWriter
+
+    max_rows = context.max_rows
+    if context.shards is not None:
+        total = _count(context, file_list, row_filter)
+        max_rows = max(1, -(-total // context.shards))
+
+    writer = ShardWriter(
+        context.cache, columns, max_rows,
+        lambda file, columns: _writer(context, file, columns))
+    try:
+        _write_chunks(context, writer, file_list, row_filter)
+    finally:
+        writer.close()
+
+    return writer.shards
+
+
+def _aggregate_files(context: Context, file_list: list, aggregates: list,
+                     row_filter=None):
+    """Return the aggregate of every archive file.
+
+    There is one row per distinct value of the `Context.group_by`
+    columns, sorted by them, followed by one column per `Context.agg`
+    expression, e.g. "mean(temperature)". Each chunk is reduced to
+    partial counts, sums, minimums and maximums that are merged into
+    the running aggregate, so the rows themselves are never combined.
+
+    Archive files are aggregated by `Context.jobs` threads. If a group
+    column is a schema column, each archive directory of that column
+    holds different groups and is aggregated on its own.
+    """
+    from collections import OrderedDict
+    from os import sep
+    from os.path import relpath
+
+    from ._aggregate import Aggregator
+    from ._ordered import ordered_map
+
+    keys = context.group_by or []
+
+    schema = _schema(context)
+    headers = [schema[key] for key in schema]
+    levels = [headers.index(key) for key in keys if key in headers]
+
+    disjoint = len(levels) != 0
+    partitions = OrderedDict()
+    for file in file_list:
+        directories = relpath(file, context.archive).split(sep)[:-1]
+        if disjoint and min(levels) < len(directories):
+            partition = tuple(directories[:min(levels) + 1])
+        else:
+            # files above the schema level may have any group
+            disjoint = False
+            partition = file
+        partitions.setdefault(partition, list()).append(file)
+
+    def aggregate(files: list) -> Aggregator:
+        aggregator = Aggregator(keys, aggregates)
+        for file in files:
+            if context.verbose:
+                print('Build: from {0}'.format(file))
+
+            for chunk in _read_chunks(context, file, row_filter):
+                aggregator.add(chunk)
+        return aggregator
+
+    result = Aggregator(keys, aggregates)
+    for partial in ordered_map(
+            aggregate, list(partitions.values()), context.jobs):
+        result.merge(partial, disjoint)
+
+    return result.result()
+
+
+def _sample_rows(context: Context, file_list: list, columns: list,
+                 row_filter=None):
+    """Return a random sample or the first rows of the archive files.
+
+    An `int` `Context.sample` is that many rows, kept in a reservoir,
+    and a `float` sample keeps each row with that probability. The same
+    `Context.seed` and archive always give the same sample, in archive
+    order. A limited build reads one file at a time and stops reading as soon
+    as it has `Context.limit` rows.
+    """
+    from ._header import stack
+    from ._ordered import ordered_map
+    from ._sample import Bernoulli, Reservoir
+
+    dtypes = _dtypes(context)
+
+    if context.limit is not None:
+        frames = list()
+        rows = 0
+        for file in file_list:
+            if rows >= context.limit:
+                break
+            if context.verbose:
+                print('Build: from {0}'.format(file))
+            for chunk in _read_chunks(context, file, row_filter):
+                frames.append(chunk.iloc[:context.limit - rows])
+                rows += len(frames[-1])
+                if rows >= context.limit:
+                    break
+        return stack(frames, columns, dtypes)
+
+    if isinstance(context.sample, float):
+        sampler = Bernoulli(context.sample, columns, context.seed, dtypes)
+    else:
+        sampler = Reservoir(context.sample, columns, context.seed, dtypes)
+
+    chunk_lists = ordered_map(
+        lambda file: _chunks(context, file, row_filter), file_list,
+        context.jobs)
+    for file, chunks in zip(file_list, chunk_lists):
+        if context.verbose:
+            print('Build: from {0}'.format(file))
+        for chunk in chunks:
+            sampler.add(chunk)
+
+    if context.verbose:
+        print('Build: sampled {0} rows'.format(sampler.seen))
+
+    return sampler.result()
+
+
+def _combine(context: Context, file_list: list, columns: list,
+             row_filter=None):
+    """Return the rows of every archive file in a single `DataFrame`.
+
+    Every frame is collected and copied into the cache layout once,
+    since appending one at a time copies the whole cache for each file.
+    """
+    from ._header import stack
+    from ._ordered import ordered_map
+
+    frames = list()
+    chunk_lists = ordered_map(
+        lambda file: _chunks(context, file, row_filter), file_list,
+        context.jobs)
+    for file, chunks in zip(file_list, chunk_lists):
+        if context.verbose:
+            print('Build: from {0}'.format(file))
+
+        for data in chunks:
+            if context.verbose:
+                print('Build: read data {0}'.format(data.shape))
+
+            frames.append(data)
+
+    cache = stack(frames, columns, _dtypes(context))
+
+    if context.verbose:
+        print('Build: combined {0} files => {1}'.format(
+            len(frames), cache.shape))
+
+    return cache
+
+
+def _update(context: Context, manifest: dict, sources: dict,
+            row_filter=None) -> bool:
+    """Append new archive files to an existing cache.
+
+    Returns `False` if the cache has to be rebuilt instead, i.e. if an
+    archive file was modified or deleted, if a new archive file has a
+    column that the cache does not, or if the cache is sorted,
+    deduplicated, aggregated, sampled, limited or an Arrow IPC file.
+    """
+    from os.path import join
+
+    from . import _manifest
+    from ._arrowwriter import FEATHER, output_format
+
+    # an Arrow IPC file cannot be appended to
+    if output_format(context.cache, context.format) == FEATHER:
+        return False
+
+    # appended rows would not be sorted, deduplicated, aggregated,
+    # sampled or limited
+    if (context.sort_by is not None or context.distinct or
+            _aggregates(context) is not None or
+            context.sample is not None or context.limit is not None):
+        return False
+
+    new_files = _manifest.new_files(
+        manifest, context.archive, sources, _options(context))
+    if new_files is None:
+        return False
+
+    file_list = [join(context.archive, path) for path in new_files]
+    columns = manifest['columns']
+
+    # new columns would change the header of the existing cache
+    if len(set(_columns(context, file_list)) - set(columns)) != 0:
+        return False
+
+    _manifest.remove(context.cache)
+    _stream(context, file_list, columns, 'ab', row_filter)
+    _manifest.save(context.cache, context.archive, sources, columns,
+                   _options(context))
+
+    if context.verbose:
+        print('Build: appended {0} files to {1}'.format(
+            len(file_list), context.cache))
+
+    return True
+
+
+def _split(context: Context, file_list: list, columns: list,
+           row_filter=None) -> list:
+    """Write each archive file to one cache file per split column value.
+
+    Values are normalized like archive directory names, and rows
+    without a value are skipped. If the column is a schema column,
+    archive files are routed by their directory instead of their rows.
+
+    Returns the filepaths of the cache files.
+    """
+    from os import sep
+    from os.path import relpath
+
+    from syphon.schema.resolvepath import _normalize
+
+    from ._ordered import ordered_map
+    from ._split import WriterPool
+
+    schema = _schema(context)
+    headers = [schema[key] for key in schema]
+    level = None
+    if context.split_by in headers:
+        level = headers.index(context.split_by)
+
+    pool = WriterPool(context.cache, columns, context.engine)
+    try:
+        chunk_lists = ordered_map(
+            lambda file: _chunks(context, file, row_filter), file_list,
+            context.jobs)
+        for file, chunks in zip(file_list, chunk_lists):
+            if context.verbose:
+                print('Build: from {0}'.format(file))
+
+            # every row under a schema directory has the same value
+            name = None
+            directories = relpath(file, context.archive).split(sep)[:-1]
+            if level is not None and level < len(directories):
+                name = directories[level]
+
+            for chunk in chunks:
+                if len(chunk) == 0:
+                    continue
+                if name is not None:
+                    pool.write(name, chunk)
+                elif context.split_by in chunk.columns:
+                    groups = chunk.groupby(context.split_by, sort=False)
+                    for value, group in groups:
+                        pool.write(_normalize(value), group)
+    finally:
+        pool.close()
+
+    return pool.files
+
+
+def _check(context: Context, aggregates: list):
+    """Raise a `ValueError` if the sample, limit, aggregate and column type
+    options cannot be combined with the other options."""
+    sampled = context.sample is not None or context.limit is not None
+    if sampled and (
+            context.split_by is not None or context.shards is not None or
+            context.max_rows is not None or context.sort_by is not None or
+            context.distinct or context.group_by is not None or
+            context.agg is not None):
+        raise ValueError('Cannot split, shard, sort, deduplicate or '
+                         'aggregate a sampled or limited build')
+    if context.sample is not None and context.limit is not None:
+        raise ValueError('Cannot both sample and limit a build')
+    if context.limit is not None and context.limit < 1:
+        raise ValueError('Expected a positive limit, found {}'.format(
+            context.limit))
+    if context.sample is not None and (context.sample <= 0 or (
+            isinstance(context.sample, float) and context.sample > 1)):
+        raise ValueError('Expected a positive sample size or a fraction '
+                         'between 0 and 1, found {}'.format(context.sample))
+
+    if aggregates is not None and (
+            context.split_by is not None or context.shards is not None or
+            context.max_rows is not None or context.sort_by is not None or
+            context.distinct):
+        raise ValueError('Cannot split, shard, sort or deduplicate an '
+                         'aggregate build')
+
+    if context.typed and (
+            context.split_by is not None or context.shards is not None or
+            context.max_rows is not None or context.sort_by is not None or
+            context.distinct or aggregates is not None):
+        raise ValueError('Cannot split, shard, sort, deduplicate or '
+                         'aggregate a typed build')
+    # fail before anything is written if there are no column types
+    _dtypes(context)
+
+
+def _build_split(context: Context, row_filter):
+    """Combine all archived data files into one file per column value.
+
+    Split builds are always complete rebuilds and do not save a manifest.
+    """
+    from os import listdir, makedirs
+    from os.path import isdir
+
+    from ._arrowwriter import CSV
+
+    if context.shards is not None or context.max_rows is not None:
+        raise ValueError('Cannot shard a split build')
+    if context.sort_by is not None:
+        raise ValueError('Cannot sort a split build')
+    if context.distinct:
+        raise ValueError('Cannot deduplicate a split build')
+    if context.format is not None and context.format != CSV:
+        raise ValueError('Split builds are always written as csv files')
+
+    if (isdir(context.cache) and len(listdir(context.cache)) != 0 and
+            not context.overwrite):
+        raise FileExistsError('Split directory is not empty')
+
+    makedirs(context.cache, exist_ok=True)
+
+    file_list = _file_list(context)
+    columns = _columns(context, file_list)
+    files = _split(context, file_list, columns, row_filter)
+
+    if context.verbose:
+        print('Build: wrote {0} files to {1}'.format(
+            len(files), context.cache))
+
+
+def _build_shards(context: Context, row_filter):
+    """Combine all archived data files into rolling cache shards.
+
+    The shards are listed in order in a shard index, e.g.
+    "all.csv.shards.json". Sharded builds are always complete rebuilds
+    and do not save a manifest.
+    """
+    from os.path import exists
+
+    from . import _shards
+
+    if context.shards is not None and context.max_rows is not None:
+        raise ValueError('Cannot set both the number of shards and the '
+                         'maximum rows per shard')
+    # shards are sized before duplicate rows are dropped
+    if context.shards is not None and context.distinct:
+        raise ValueError('Cannot deduplicate a build with a number of '
+                         'shards, set the maximum rows per shard instead')
+    for value in [context.shards, context.max_rows]:
+        if value is not None and value < 1:
+            raise ValueError(
+                'Expected a positive number of shards or rows, found {}'
+                .format(value))
+
+    index = _shards.index_path(context.cache)
+    if exists(index) and not context.overwrite:
+        raise FileExistsError('Shard index already exists')
+
+    _shards.remove(context.cache)
+
+    file_list = _file_list(context)
+    columns = _columns(context, file_list)
+    shards = _shard(context, file_list, columns, row_filter)
+    _shards.save(context.cache, columns, shards)
+
+    if context.verbose:
+        print('Build: wrote {0} shards listed in {1}'.format(
+            len(shards), index))
+
+
+def _build_stdout(context: Context, row_filter, aggregates: list):
+    """Stream the cache rows to standard output as they are built.
+
+    Messages are printed to standard error instead, so they do not mix
+    with the rows. No manifest is saved, so the build is always complete.
+    """
+    from contextlib import redirect_stdout
+    from sys import stderr, stdout
+
+    from ._arrowwriter import CSV, output_format
+
+    if (context.split_by is not None or context.shards is not None or
+            context.max_rows is not None):
+        raise ValueError('Cannot split or shard a build written to '
+                         'standard output')
+    if output_format(context.cache, context.format) != CSV:
+        raise ValueError('Only csv can be written to standard output')
+
+    output = stdout.buffer
+    with redirect_stdout(stderr):
+        file_list = _file_list(context)
+
+        cache = None
+        if aggregates is not None:
+            cache = _aggregate_files(
+                context, file_list, aggregates, row_filter)
+            columns = list(cache.columns)
+        else:
+            columns = _columns(context, file_list)
+            if context.sample is not None or context.limit is not None:
+                cache = _sample_rows(context, file_list, columns, row_filter)
+
+        writer = _writer(context, output, columns)
+        try:
+            if cache is not None:
+                writer.write(cache)
+            else:
+                _write_chunks(context, writer, file_list, row_filter)
+        finally:
+            writer.detach()
+        output.flush()
+
+        if context.verbose:
+            print('Build: wrote standard output')
 
 
 def build(context: Context):
     """Combine all archived data files into a single file.
 
+    The cache file has every column of the archive files, or
+    `Context.columns`, and is written as csv or Arrow IPC. The rows can
+    be filtered, sorted, deduplicated, aggregated, sampled, sharded or
+    split by the other `Context` options, as described in the README. A
+    manifest of the archive files is saved next to the cache file, so
+    `Context.incremental` and `Context.update` builds only redo what
+    changed.
+
     Args:
         context (Context): Runtime settings object.
 
     Raises:
         OSError: File operation error. Error type raised may be
             a subclass of OSError.
-        FileExistsError: Cache file exists and overwrite is
-            False.
+        FileExistsError: Cache file or shard index exists, or the split
+            directory is not empty, and overwrite is False.
+        ValueError: An option is malformed or cannot be combined with
+            the other options.
     """
-    from os import walk
-    from os.path import exists, join
+    from os.path import exists
 
-    from pandas import DataFrame, read_csv
+    from . import _manifest
 
-    file_list = list()
+    row_filter = _row_filter(context)
+    aggregates = _aggregates(context)
+    _check(context, aggregates)
+
+    sampled = context.sample is not None or context.limit is not None
+
+    if context.update and (
+            context.cache == STDOUT or context.split_by is not None or
+            context.shards is not None or context.max_rows is not None):
+        raise ValueError('Cannot tell whether standard output, a split or '
+                         'a sharded build is up to date')
+
+    if context.cache == STDOUT:
+        _build_stdout(context, row_filter, aggregates)
+        return
+
+    if context.split_by is not None:
+        _build_split(context, row_filter)
+        return
 
-    if exists(context.cache) and not context.overwrite:
+    if context.shards is not None or context.max_rows is not None:
+        _build_shards(context, row_filter)
+        return
+
+    manifest = None
+    if context.incremental or context.update:
+        manifest = _manifest.load(context.cache)
+
+    if exists(context.cache) and not context.overwrite and manifest is None:
         raise FileExistsError('Cache file already exists')
 
-    for root, _, files in walk(context.archive):
-        for file in files:
-            # skip linux-style hidden files
-            if file[0] is not LINUX_HIDDEN_CHAR:
-                file_list.append(join(root, file))
+    file_list = _file_list(context)
 
-    cache = DataFrame()
-    for file in file_list:
+    sources = _fingerprint(context, file_list)
+
+    if manifest is not None and _manifest.current(
+            manifest, context.archive, sources, _options(context)):
         if context.verbose:
-            print('Build: from {0}'.format(file))
+            print('Build: {0} is up to date'.format(context.cache))
+        return
+
+    if manifest is not None and context.incremental and _update(
+            context, manifest, sources, row_filter):
+        return
+
+    _manifest.remove(context.cache)
 
-        data = DataFrame(read_csv(file, dtype=str))
+    if aggregates is not None:
+        cache = _aggregate_files(context, file_list, aggregates, row_filter)
 
         if context.verbose:
-            data_shape = data.shape
-            cache_pre_shape = cache.shape
+            print('Build: aggregated {0} files => {1}'.format(
+                len(file_list), cache.shape))
 
-        cache = cache.append(data)
+        columns = list(cache.columns)
+        _write_cache(context, cache)
+    elif sampled:
+        columns = _columns(context, file_list)
+        cache = _sample_rows(context, file_list, columns, row_filter)
 
         if context.verbose:
-            print('Build: appending data {0} onto cache {1} => {2}'.format(
-                data_shape, cache_pre_shape, cache.shape))
+            print('Build: built {0} rows of {1} files => {2}'.format(
+                len(cache), len(file_list), cache.shape))
 
-        cache.reset_index(drop=True, inplace=True)
+        _write_cache(context, cache)
+    elif (context.chunksize is not None or context.sort_by is not None or
+            context.distinct):
+        columns = _columns(context, file_list)
+        _stream(context, file_list, columns, 'wb', row_filter)
+    else:
+        columns = _columns(context, file_list)
+        cache = _combine(context, file_list, columns, row_filter)
+        _write_cache(context, cache)
 
-    cache.to_csv(context.cache, index=False)
+    _manifest.save(context.cache, context.archive, sources, columns,
+                   _options(context))
 
     if context.verbose:
         print('Build: wrote {0}'.format(context.cache))
+
+
+def build_frame(context: Context) -> DataFrame:
+    """Combine all archived data files into a `DataFrame`.
+
+    The rows are chosen like those of `build`, by `Context.columns`,
+    `Context.filter`, `Context.where`, `Context.sample`, `Context.limit`,
+    `Context.group_by` and `Context.agg`, but no cache file is written.
+    If `Context.typed` is `True`, numeric columns are read straight into
+    integer and float columns, which take a fraction of the memory of
+    strings.
+
+    Args:
+        context (Context): Runtime settings object.
+
+    Returns:
+        DataFrame: The combined rows.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+        ValueError: An option is malformed or cannot be combined with
+            the other options, e.g. `Context.split_by`,
+            `Context.shards`, `Context.max_rows`, `Context.sort_by` or
+            `Context.distinct` is set.
+    """
+    if (context.split_by is not None or context.shards is not None or
+            context.max_rows is not None or context.sort_by is not None or
+            context.distinct):
+        raise ValueError('Cannot split, shard, sort or deduplicate a '
+                         'DataFrame build')
+
+    row_filter = _row_filter(context)
+    aggregates = _aggregates(context)
+    _check(context, aggregates)
+
+    file_list = _file_list(context)
+
+    if aggregates is not None:
+        return _aggregate_files(context, file_list, aggregates, row_filter)
+
+    columns = _columns(context, file_list)
+    if context.sample is not None or context.limit is not None:
+        return _sample_rows(context, file_list, columns, row_filter)
+    return _combine(context, file_list, columns, row_filter)
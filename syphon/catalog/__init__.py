@@ -0,0 +1,13 @@
+"""syphon.catalog.__init__.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from .catalog import catalog
+from .database import Catalog
+
+__all__ = [
+    'catalog',
+    'Catalog',
+]
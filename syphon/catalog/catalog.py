@@ -0,0 +1,82 @@
+"""syphon.catalog.catalog.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from syphon import Context
+
+CHUNKSIZE = 100000
+
+
+def _describe(context: Context, schema, filepath: str) -> tuple:
+    """Count the rows of an archive file and find its schema values."""
+    from syphon._csvengine import read_csv_chunks, read_header
+
+    from .database import record
+
+    header = read_header(filepath)
+    headers = [schema[key] for key in schema if schema[key] in header]
+    # a single column is enough to count rows
+    columns = headers if len(headers) != 0 else header[:1]
+
+    rows = 0
+    values = dict()
+    if len(columns) != 0:
+        for chunk in read_csv_chunks(
+                filepath, context.chunksize or CHUNKSIZE, context.engine,
+                columns):
+            rows += len(chunk)
+            for column in headers:
+                present = chunk[column].dropna()
+                if column not in values and len(present) != 0:
+                    values[column] = present.iloc[0]
+
+    keys = [
+        (schema[key], values.get(schema[key], None)) for key in schema]
+    return record(context.archive, filepath, rows, header, keys)
+
+
+def catalog(context: Context):
+    """Rebuild the catalog of an archive directory from its files.
+
+    Every archive file is read to count its rows and find the values of
+    its schema columns. Files are read by `Context.jobs` threads.
+
+    Args:
+        context (Context): Runtime settings object.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+        ParserError: Error raised by pandas.read_csv.
+    """
+    from os.path import exists, join
+
+    from sortedcontainers import SortedDict
+    from syphon.build_._ordered import ordered_map
+    from syphon.build_._walk import walk
+    from syphon.schema import load
+
+    from .database import Catalog
+
+    schema = context.schema
+    if schema is None:
+        schema = SortedDict()
+        schemafile = join(context.archive, context.schema_file)
+        if exists(schemafile):
+            schema = load(schemafile)
+
+    file_list = walk(context.archive, len(schema) or None)
+
+    records = list(ordered_map(
+        lambda file: _describe(context, schema, file), file_list,
+        context.jobs))
+
+    catalog_path = join(context.archive, context.catalog_file)
+    with Catalog(catalog_path) as database:
+        database.replace(records)
+
+    if context.verbose:
+        print('Catalog: wrote {0} files to {1}'.format(
+            len(records), catalog_path))
@@ -0,0 +1,198 @@
+"""syphon.catalog.database.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+# seconds a writer waits for another process to finish its transaction
+TIMEOUT = 30
+
+_TABLES = [
+    'CREATE TABLE IF NOT EXISTS files ('
+    ' path TEXT PRIMARY KEY,'
+    ' partition TEXT NOT NULL,'
+    ' size INTEGER NOT NULL,'
+    ' mtime_ns INTEGER NOT NULL,'
+    ' rows INTEGER NOT NULL,'
+    ' columns TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS files_partition ON files (partition)',
+    'CREATE TABLE IF NOT EXISTS partitions ('
+    ' path TEXT NOT NULL,'
+    ' column TEXT NOT NULL,'
+    ' value TEXT,'
+    ' PRIMARY KEY (path, column))',
+]
+
+
+def record(archive: str, filepath: str, rows: int, columns: list,
+           keys: list) -> tuple:
+    """Describe an archive file for the catalog.
+
+    Args:
+        archive (str): Absolute path to the archive directory.
+        filepath (str): Absolute filepath of the archive file.
+        rows (int): Number of rows in the file.
+        columns (list): Header of the file.
+        keys (list): `(column, value)` tuples of the schema columns of
+            the file's archive directory.
+
+    Returns:
+        tuple: `(path, size, mtime_ns, rows, columns, keys)`, where
+            `path` is relative to the archive directory.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from os import stat
+    from os.path import relpath
+
+    info = stat(filepath)
+    return (relpath(filepath, archive), info.st_size, info.st_mtime_ns,
+            rows, list(columns), list(keys))
+
+
+def _components(path: str) -> tuple:
+    """Order paths like the archive walker, one level at a time."""
+    from os import sep
+
+    parts = path.split(sep)
+    return (len(parts), parts)
+
+
+class Catalog:
+    """SQLite catalog of the files in an archive directory.
+
+    The database uses write-ahead logging, so builds can read the
+    catalog while an archive is being written.
+    """
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath (str): Absolute filepath of the catalog database.
+                It is created if it does not exist.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        import sqlite3
+
+        try:
+            self._connection = sqlite3.connect(filepath, timeout=TIMEOUT)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            with self._connection:
+                for statement in _TABLES:
+                    self._connection.execute(statement)
+        except sqlite3.Error as err:
+            raise OSError(
+                'Cannot open catalog @ {0}: {1}'.format(filepath, err))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def _insert(self, records: list):
+        from json import dumps
+        from os.path import dirname
+
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)',
+            [
+                (path, dirname(path), size, mtime_ns, rows, dumps(columns))
+                for path, size, mtime_ns, rows, columns, _ in records
+            ])
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO partitions VALUES (?, ?, ?)',
+            [
+                (dirname(path), column, value)
+                for path, _, _, _, _, keys in records
+                for column, value in keys
+            ])
+
+    def add(self, records: list):
+        """Add or replace files in a single transaction.
+
+        Args:
+            records (list): Files described by `record`.
+        """
+        with self._connection:
+            self._insert(records)
+
+    def replace(self, records: list):
+        """Replace every file in a single transaction.
+
+        Args:
+            records (list): Files described by `record`.
+        """
+        with self._connection:
+            self._connection.execute('DELETE FROM files')
+            self._connection.execute('DELETE FROM partitions')
+            self._insert(records)
+
+    def files(self) -> list:
+        """Return every file in the order the archive walker finds them.
+
+        Returns:
+            list: `(path, size, mtime_ns, rows)` tuples, where `path` is
+                relative to the archive directory.
+        """
+        rows = self._connection.execute(
+            'SELECT path, size, mtime_ns, rows FROM files').fetchall()
+        return sorted(rows, key=lambda item: _components(item[0]))
+
+    def columns(self, path: str) -> list:
+        """Return the header of a file.
+
+        Args:
+            path (str): Filepath relative to the archive directory.
+
+        Returns:
+            list: Column names, or `None` if the file is not cataloged.
+        """
+        from json import loads
+
+        row = self._connection.execute(
+            'SELECT columns FROM files WHERE path = ?', (path,)).fetchone()
+        return None if row is None else loads(row[0])
+
+    def headers(self) -> dict:
+        """Return the header of every file.
+
+        Returns:
+            dict: Lists of column names indexed by the filepath relative
+                to the archive directory.
+        """
+        from json import loads
+
+        parsed = dict()
+        result = dict()
+        for path, columns in self._connection.execute(
+                'SELECT path, columns FROM files'):
+            # archives usually share a handful of distinct headers
+            if columns not in parsed:
+                parsed[columns] = loads(columns)
+            result[path] = parsed[columns]
+        return result
+
+    def rows_by(self, column: str) -> list:
+        """Return the number of rows for each value of a schema column.
+
+        Args:
+            column (str): Name of a schema column.
+
+        Returns:
+            list: `(value, rows)` tuples sorted by value.
+        """
+        return self._connection.execute(
+            'SELECT partitions.value, SUM(files.rows) FROM files'
+            ' JOIN partitions ON partitions.path = files.partition'
+            ' WHERE partitions.column = ?'
+            ' GROUP BY partitions.value ORDER BY partitions.value',
+            (column,)).fetchall()
@@ -10,14 +10,55 @@ from sortedcontainers import SortedDict
 class Context:
     """Runtime settings container."""
     def __init__(self):
+        self._agg = None
         self._archive_dir = None
         self._cache = None
+        self._catalog_file = '.catalog.db'
+        self._check_catalog = False
+        self._chunksize = None
+        self._columns = None
+        self._combine = None
         self._data = None
+        self._distinct = False
+        self._distinct_buffer = 1000000
+        self._distinct_key = None
+        self._dtypes = None
+        self._dtypes_file = '.dtypes.json'
+        self._engine = 'pandas'
+        self._filter = None
+        self._format = None
+        self._group_by = None
+        self._incremental = False
+        self._jobs = 1
+        self._limit = None
+        self._max_rows = None
         self._meta = None
         self._overwrite = False
+        self._provenance = None
+        self._queue_depth = 2
+        self._raw = False
+        self._sample = None
         self._schema = None
         self._schema_file = '.schema.json'
+        self._seed = None
+        self._shards = None
+        self._sort_buffer = 1000000
+        self._sort_by = None
+        self._split_by = None
+        self._typed = False
+        self._update = False
         self._verbose = False
+        self._where = None
+
+    @property
+    def agg(self) -> list:
+        """`list`: Aggregate expressions of the build output, e.g.
+        "mean(temperature)", or `None` to build every row."""
+        return self._agg
+
+    @agg.setter
+    def agg(self, value: list):
+        self._agg = value
 
     @property
     def archive(self) -> str:
@@ -37,6 +78,52 @@ class Context:
     def cache(self, value: str):
         self._cache = value
 
+    @property
+    def catalog_file(self) -> str:
+        """`str`: Name of the file containing the archive catalog."""
+        return self._catalog_file
+
+    @property
+    def check_catalog(self) -> bool:
+        """`bool`: `True` to warn about archive files that are not in the
+        archive catalog when building from it, `False` otherwise."""
+        return self._check_catalog
+
+    @check_catalog.setter
+    def check_catalog(self, value: bool):
+        self._check_catalog = value
+
+    @property
+    def chunksize(self) -> int:
+        """`int`: Number of rows read at a time while streaming, or `None`
+        to read whole files."""
+        return self._chunksize
+
+    @chunksize.setter
+    def chunksize(self, value: int):
+        self._chunksize = value
+
+    @property
+    def columns(self) -> list:
+        """`list`: Names of the columns to build, or `None` to build every
+        column."""
+        return self._columns
+
+    @columns.setter
+    def columns(self, value: list):
+        self._columns = value
+
+    @property
+    def combine(self) -> str:
+        """`str`: Name of the single archive file written to each
+        archive directory, or `None` to keep one archive file per data
+        file."""
+        return self._combine
+
+    @combine.setter
+    def combine(self, value: str):
+        self._combine = value
+
     @property
     def data(self) -> str:
         """`str`: Absolute filepath or glob pattern of data file(s)."""
@@ -46,6 +133,129 @@ class Context:
     def data(self, value: str):
         self._data = value
 
+    @property
+    def distinct(self) -> bool:
+        """`bool`: `True` to drop duplicate rows from the build output,
+        `False` otherwise."""
+        return self._distinct
+
+    @distinct.setter
+    def distinct(self, value: bool):
+        self._distinct = value
+
+    @property
+    def distinct_buffer(self) -> int:
+        """`int`: Maximum number of distinct row keys kept in memory
+        before they are spilled to temporary files."""
+        return self._distinct_buffer
+
+    @distinct_buffer.setter
+    def distinct_buffer(self, value: int):
+        self._distinct_buffer = value
+
+    @property
+    def distinct_key(self) -> list:
+        """`list`: Names of the columns that identify duplicate rows, or
+        `None` to compare every column."""
+        return self._distinct_key
+
+    @distinct_key.setter
+    def distinct_key(self, value: list):
+        self._distinct_key = value
+
+    @property
+    def dtypes(self) -> SortedDict:
+        """`SortedDict`: Declared column types, e.g. "float64", indexed by
+        column name, or `None` to leave the archive untyped."""
+        return self._dtypes
+
+    @dtypes.setter
+    def dtypes(self, value: SortedDict):
+        self._dtypes = value
+
+    @property
+    def dtypes_file(self) -> str:
+        """`str`: Name of the file containing the archive column types."""
+        return self._dtypes_file
+
+    @property
+    def engine(self) -> str:
+        """`str`: Name of the csv engine, either "pandas" or "pyarrow"."""
+        return self._engine
+
+    @engine.setter
+    def engine(self, value: str):
+        self._engine = value
+
+    @property
+    def filter(self) -> str:
+        """`str`: Row filter expression, e.g. "temperature > 85". Only
+        matching rows are built."""
+        return self._filter
+
+    @filter.setter
+    def filter(self, value: str):
+        self._filter = value
+
+    @property
+    def format(self) -> str:
+        """`str`: Build output format, either "csv" or "feather", or `None`
+        to choose by the output file extension."""
+        return self._format
+
+    @format.setter
+    def format(self, value: str):
+        self._format = value
+
+    @property
+    def group_by(self) -> list:
+        """`list`: Names of the columns that group aggregated build
+        output, or `None` to build every row."""
+        return self._group_by
+
+    @group_by.setter
+    def group_by(self, value: list):
+        self._group_by = value
+
+    @property
+    def incremental(self) -> bool:
+        """`bool`: `True` to append new archive files to an existing cache
+        file, `False` otherwise."""
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, value: bool):
+        self._incremental = value
+
+    @property
+    def jobs(self) -> int:
+        """`int`: Number of worker threads."""
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, value: int):
+        self._jobs = value
+
+    @property
+    def limit(self) -> int:
+        """`int`: Maximum number of rows to build, or `None` to build every
+        row."""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int):
+        self._limit = value
+
+    @property
+    def max_rows(self) -> int:
+        """`int`: Maximum number of rows in each build output shard, or
+        `None` to build a single file."""
+        return self._max_rows
+
+    @max_rows.setter
+    def max_rows(self, value: int):
+        self._max_rows = value
+
     @property
     def meta(self) -> str:
         """`str`: Absolute filepath or glob pattern of metadata files(s)."""
@@ -64,6 +274,46 @@ class Context:
     def overwrite(self, value: bool):
         self._overwrite = value
 
+    @property
+    def provenance(self) -> str:
+        """`str`: Name of the column that records the data file of each
+        archived row, or `None` to omit it."""
+        return self._provenance
+
+    @provenance.setter
+    def provenance(self, value: str):
+        self._provenance = value
+
+    @property
+    def queue_depth(self) -> int:
+        """`int`: Maximum number of items waiting between two pipeline
+        stages."""
+        return self._queue_depth
+
+    @queue_depth.setter
+    def queue_depth(self, value: int):
+        self._queue_depth = value
+
+    @property
+    def raw(self) -> bool:
+        """`bool`: `True` to archive the original lines of each data file
+        without parsing non-schema columns, `False` otherwise."""
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: bool):
+        self._raw = value
+
+    @property
+    def sample(self):
+        """`int` or `float`: Number or fraction of randomly sampled rows to
+        build, or `None` to build every row."""
+        return self._sample
+
+    @sample.setter
+    def sample(self, value):
+        self._sample = value
+
     @property
     def schema(self) -> SortedDict:
         """`SortedDict`: Ordered archive directory storage schema."""
@@ -78,6 +328,76 @@ class Context:
         """`str`: Name of the file containing the archive storage schema."""
         return self._schema_file
 
+    @property
+    def seed(self) -> int:
+        """`int`: Seed of the random row sample, or `None` for a different
+        sample every time."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, value: int):
+        self._seed = value
+
+    @property
+    def shards(self) -> int:
+        """`int`: Number of roughly equal build output shards, or `None` to
+        build a single file."""
+        return self._shards
+
+    @shards.setter
+    def shards(self, value: int):
+        self._shards = value
+
+    @property
+    def sort_buffer(self) -> int:
+        """`int`: Maximum number of rows sorted in memory before they are
+        spilled to a temporary file."""
+        return self._sort_buffer
+
+    @sort_buffer.setter
+    def sort_buffer(self, value: int):
+        self._sort_buffer = value
+
+    @property
+    def sort_by(self) -> list:
+        """`list`: Names of the columns to sort the build output by, or
+        `None` to keep archive order."""
+        return self._sort_by
+
+    @sort_by.setter
+    def sort_by(self, value: list):
+        self._sort_by = value
+
+    @property
+    def split_by(self) -> str:
+        """`str`: Name of the column whose values each get their own build
+        output file, or `None` to build a single file."""
+        return self._split_by
+
+    @split_by.setter
+    def split_by(self, value: str):
+        self._split_by = value
+
+    @property
+    def typed(self) -> bool:
+        """`bool`: `True` to read archive files into the column types of
+        the archive, `False` to read every column as a string."""
+        return self._typed
+
+    @typed.setter
+    def typed(self, value: bool):
+        self._typed = value
+
+    @property
+    def update(self) -> bool:
+        """`bool`: `True` to skip a build whose cache file is up to date
+        with the archive, `False` otherwise."""
+        return self._update
+
+    @update.setter
+    def update(self, value: bool):
+        self._update = value
+
     @property
     def verbose(self) -> bool:
         """`bool`: `True` to output everything, `False` otherwise."""
@@ -86,3 +406,13 @@ class Context:
     @verbose.setter
     def verbose(self, value: bool):
         self._verbose = value
+
+    @property
+    def where(self) -> SortedDict:
+        """`SortedDict`: Schema value lists indexed by schema column. Only
+        matching archive directories are built."""
+        return self._where
+
+    @where.setter
+    def where(self, value: SortedDict):
+        self._where = value
@@ -10,6 +10,15 @@ from syphon import Context
 def init(context: Context):
     """Create a schema file in the given directory
 
+    An empty archive catalog is also created if the directory does not
+    contain any archive files yet. Use `syphon.catalog.catalog` to
+    catalog an existing archive.
+
+    If `Context.typed` is `True` or `Context.dtypes` is set, a column
+    types file is created next to the schema file with the declared
+    types. The types of any existing archive files are inferred and
+    the declared types are widened to hold them.
+
     Args:
         context (Context): Runtime settings object.
 
@@ -17,11 +26,38 @@ def init(context: Context):
         OSError: File operation error. Error type raised may be
             a subclass of OSError.
     """
-    from os.path import join
-    from syphon.schema import save
+    from os.path import exists, join
+
+    from sortedcontainers import SortedDict
+    from syphon._csvengine import read_csv
+    from syphon.build_._walk import walk
+    from syphon.catalog import Catalog
+    from syphon.schema import infer_dtypes, save, save_dtypes, widen_dtypes
 
     schema_path = join(context.archive, context.schema_file)
     save(context.schema, schema_path, context.overwrite)
 
     if context.verbose:
         print('Init: wrote {0}'.format(schema_path))
+
+    file_list = walk(context.archive)
+
+    if context.typed or context.dtypes is not None:
+        dtypes = SortedDict(context.dtypes or {})
+        for file in file_list:
+            dtypes = widen_dtypes(
+                dtypes, infer_dtypes(read_csv(file, context.engine)))
+
+        dtypes_path = join(context.archive, context.dtypes_file)
+        save_dtypes(dtypes, dtypes_path)
+
+        if context.verbose:
+            print('Init: wrote {0}'.format(dtypes_path))
+
+    # an empty catalog of an existing archive would hide its files
+    catalog_path = join(context.archive, context.catalog_file)
+    if not exists(catalog_path) and len(file_list) == 0:
+        Catalog(catalog_path).close()
+
+        if context.verbose:
+            print('Init: wrote {0}'.format(catalog_path))
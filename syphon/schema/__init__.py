@@ -5,13 +5,20 @@
 
 """
 from .checkcolumns import check_columns
+from .dtypes import (infer_dtypes, load_dtypes, parse_dtypes, save_dtypes,
+                     widen_dtypes)
 from .load import load
 from .resolvepath import resolve_path
 from .save import save
 
 __all__ = [
     'check_columns',
+    'infer_dtypes',
     'load',
+    'load_dtypes',
+    'parse_dtypes',
     'resolve_path',
     'save',
+    'save_dtypes',
+    'widen_dtypes',
 ]
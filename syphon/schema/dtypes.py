@@ -0,0 +1,186 @@
+"""syphon.schema.dtypes.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from re import match
+
+from pandas import DataFrame
+from sortedcontainers import SortedDict
+
+INT = 'int64'
+FLOAT = 'float64'
+STR = 'str'
+
+# from narrowest to widest, every value of a type is also a value of the
+# types after it
+DTYPES = [INT, FLOAT, STR]
+
+# integers are exact as floats up to this magnitude, larger ones are
+# usually identifiers anyway
+_MAX_INTEGER = 2 ** 53
+
+_POWERS = [10 ** exponent for exponent in range(1, 17)]
+
+_LONG_INTEGER = r'[-+]?[0-9]{19,}$'
+
+
+def pandas_dtype(dtype: str):
+    """Return the `pandas` dtype of a column type.
+
+    Integer columns are nullable, so they can hold missing values.
+
+    Args:
+        dtype (str): One of `DTYPES`.
+
+    Returns:
+        The `pandas` dtype.
+    """
+    return {INT: 'Int64', FLOAT: 'float64'}.get(dtype, object)
+
+
+def parse_dtypes(expressions: list) -> SortedDict:
+    """Parse `COLUMN=TYPE[,COLUMN=TYPE...]` expressions.
+
+    Args:
+        expressions (list): Expression strings.
+
+    Returns:
+        SortedDict: Column types indexed by column name.
+
+    Raises:
+        ValueError: An expression is not of the form COLUMN=TYPE, the
+            type is not one of `DTYPES`, or a column is given different
+            types.
+    """
+    result = SortedDict()
+    for expression in expressions:
+        for declaration in expression.split(','):
+            column, sep, dtype = declaration.partition('=')
+            if sep == '' or column == '' or dtype not in DTYPES:
+                raise ValueError(
+                    'Expected COLUMN=TYPE with a type of {0}, found "{1}"'
+                    .format(', '.join(DTYPES), declaration))
+            if result.get(column, dtype) != dtype:
+                raise ValueError(
+                    'Column "{}" is declared with different types'
+                    .format(column))
+            result[column] = dtype
+    return result
+
+
+def _infer(values) -> str:
+    """Return the type of a column of strings without missing values."""
+    from numpy import fromiter, searchsorted
+
+    # Python parses a few numbers that pandas does not, e.g. "1_000"
+    text = ''.join(values)
+    if '_' in text or len(text.encode('utf-8')) != len(text):
+        return STR
+
+    # numpy parses numbers several times faster than pandas.to_numeric
+    try:
+        numbers = values.astype('int64')
+    except (OverflowError, ValueError):
+        numbers = None
+
+    if numbers is not None:
+        if abs(numbers).max() >= _MAX_INTEGER:
+            return STR
+        # a value written any other way than "%d" is longer, e.g. "007"
+        # or "+7"
+        digits = searchsorted(_POWERS, abs(numbers), side='right') + 1
+        digits += numbers < 0
+        lengths = fromiter(map(len, values), 'int64', len(values))
+        return INT if (digits == lengths).all() else STR
+
+    try:
+        numbers = values.astype('float64')
+    except ValueError:
+        return STR
+
+    # integers too long for 64 bits would lose digits
+    if (abs(numbers) >= 1e18).any() and any(
+            match(_LONG_INTEGER, value) for value in values):
+        return STR
+    return FLOAT
+
+
+def infer_dtypes(frame: DataFrame) -> SortedDict:
+    """Return the narrowest type that holds every value of each column.
+
+    Integers are only inferred if every value is written the way it
+    would be written back and is below 2**53, so identifiers like "007"
+    stay strings. Columns without any values are left out.
+
+    Args:
+        frame (DataFrame): Data read as strings.
+
+    Returns:
+        SortedDict: Column types indexed by column name.
+    """
+    result = SortedDict()
+    for column in frame.columns:
+        values = frame[column].dropna()
+        if len(values) != 0:
+            result[str(column)] = _infer(values.astype(str).values)
+    return result
+
+
+def widen_dtypes(dtypes: dict, other: dict) -> SortedDict:
+    """Merge column types, keeping the wider type of a shared column.
+
+    Args:
+        dtypes (dict): Column types indexed by column name.
+        other (dict): More column types indexed by column name.
+
+    Returns:
+        SortedDict: Every column of both, indexed by column name.
+    """
+    result = SortedDict(dtypes)
+    for column, dtype in other.items():
+        if column not in result or (
+                DTYPES.index(dtype) > DTYPES.index(result[column])):
+            result[column] = dtype
+    return result
+
+
+def load_dtypes(filepath: str) -> SortedDict:
+    """Return the column types saved in a file.
+
+    Args:
+        filepath (str): Absolute filename of the column types file.
+
+    Returns:
+        SortedDict: Column types indexed by column name.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from json import loads
+
+    with open(filepath, 'r', encoding='utf-8') as file:
+        return SortedDict(loads(file.read()))
+
+
+def save_dtypes(dtypes: dict, filepath: str):
+    """Save column types, replacing the file in a single step so readers
+    never see a partial file.
+
+    Args:
+        dtypes (dict): Column types indexed by column name.
+        filepath (str): Absolute filename of the column types file.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+    """
+    from json import dumps
+    from os import replace
+
+    partial = '{}.partial'.format(filepath)
+    with open(partial, 'w', encoding='utf-8') as file:
+        file.write(dumps(dict(dtypes), indent=2, sort_keys=True))
+    replace(partial, filepath)
@@ -5,6 +5,7 @@
 
 """
 import os
+from json import loads
 
 import pytest
 from pandas import concat, DataFrame, read_csv
@@ -67,12 +68,14 @@ def _get_expected_paths(
     return path_list
 
 
-def test_archive(archive_params, archive_dir, overwrite):
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_archive(archive_params, archive_dir, overwrite, jobs):
     filename, schema = archive_params
 
     context = Context()
     context.archive = str(archive_dir)
     context.data = os.path.join(get_data_path(), filename)
+    context.jobs = jobs
     context.overwrite = overwrite
     context.schema = schema
 
@@ -192,3 +195,166 @@ def test_archive_fileexistserror(archive_params, archive_dir):
         archive(context)
 
     assert not os.path.exists(os.path.join(get_data_path(), '#lock'))
+
+
+def test_archive_pyarrow_engine(archive_params, tmpdir):
+    pytest.importorskip('pyarrow')
+
+    filename, schema = archive_params
+
+    contents = dict()
+    for engine in ['pandas', 'pyarrow']:
+        context = Context()
+        context.archive = str(tmpdir.mkdir(engine))
+        context.data = os.path.join(get_data_path(), filename)
+        context.engine = engine
+        context.schema = schema
+
+        archive(context)
+
+        contents[engine] = dict()
+        for root, _, files in os.walk(context.archive):
+            for f in files:
+                filepath = os.path.join(root, f)
+                with open(filepath, mode='r') as fd:
+                    relpath = os.path.relpath(filepath, context.archive)
+                    contents[engine][relpath] = fd.read()
+
+    assert contents['pandas'] == contents['pyarrow']
+
+
+def test_archive_raw(archive_params, tmpdir):
+    filename, schema = archive_params
+
+    frames = dict()
+    for raw in [False, True]:
+        context = Context()
+        context.archive = str(tmpdir.mkdir(str(raw)))
+        context.data = os.path.join(get_data_path(), filename)
+        context.raw = raw
+        context.schema = schema
+
+        archive(context)
+        assert not os.path.exists(os.path.join(get_data_path(), '#lock'))
+
+        frames[raw] = dict()
+        for root, _, files in os.walk(context.archive):
+            for f in files:
+                filepath = os.path.join(root, f)
+                relpath = os.path.relpath(filepath, context.archive)
+                frames[raw][relpath] = DataFrame(
+                    read_csv(filepath, dtype=str))
+
+    assert sorted(frames[False].keys()) == sorted(frames[True].keys())
+    for relpath in frames[False]:
+        assert_frame_equal(frames[False][relpath], frames[True][relpath])
+
+
+def test_archive_raw_missing_values(tmpdir, capsys):
+    datafile = tmpdir.join('data.csv')
+    datafile.write_binary(
+        b'a,b\n1,x\n2,\n3,NA\n4,null\n5,"nan"\n6,N/A\n7,y\n')
+
+    paths = dict()
+    for raw in [False, True]:
+        context = Context()
+        context.archive = str(tmpdir.mkdir(str(raw)))
+        context.data = str(datafile)
+        context.raw = raw
+        context.schema = SortedDict({'0': 'b'})
+
+        archive(context)
+
+        assert 'Skipping 5 rows with a missing b value in {}'.format(
+            datafile) in capsys.readouterr().out
+
+        paths[raw] = SortedList()
+        for root, _, files in os.walk(context.archive):
+            for f in files:
+                filepath = os.path.join(root, f)
+                paths[raw].add(os.path.relpath(filepath, context.archive))
+
+    assert paths[False] == SortedList([
+        os.path.join('x', 'data.csv'), os.path.join('y', 'data.csv')])
+    assert paths[True] == paths[False]
+
+
+@pytest.mark.parametrize('raw', [False, True])
+@pytest.mark.parametrize('provenance', [None, 'Source'])
+def test_archive_combine(archive_dir, import_dir, raw, provenance):
+    data = DataFrame(read_csv(
+        os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+    datafiles = list()
+    for i in range(3):
+        datafiles.append('iris-{}.csv'.format(i))
+        data.iloc[i::3].to_csv(str(import_dir.join(datafiles[i])),
+                               index=False)
+
+    context = Context()
+    context.archive = str(archive_dir)
+    context.combine = 'combined.csv'
+    context.data = os.path.join(str(import_dir), '*.csv')
+    context.provenance = provenance
+    context.raw = raw
+    context.schema = SortedDict({'0': 'Name'})
+
+    archive(context)
+    assert not os.path.exists(os.path.join(str(import_dir), '#lock'))
+
+    actual_frame = DataFrame()
+    actual_paths = SortedList()
+    for root, _, files in os.walk(context.archive):
+        for f in files:
+            filepath = os.path.join(root, f)
+            actual_paths.add(os.path.relpath(filepath, context.archive))
+            actual_frame = concat([
+                actual_frame,
+                DataFrame(read_csv(filepath, dtype=str))
+            ])
+
+    names = data['Name'].drop_duplicates().values
+    expected_paths = SortedList(
+        [os.path.join(n.lower(), 'combined.csv') for n in names])
+
+    if provenance is not None:
+        assert set(actual_frame[provenance]) == set(datafiles)
+        actual_frame = actual_frame.drop(provenance, axis=1)
+
+    actual_frame.sort_values('Index', inplace=True)
+    actual_frame.reset_index(drop=True, inplace=True)
+    expected_frame = data.sort_values('Index').reset_index(drop=True)
+
+    assert expected_paths == actual_paths
+    assert_frame_equal(expected_frame, actual_frame)
+
+
+@pytest.mark.parametrize('raw', [False, True])
+def test_archive_typed(archive_dir, raw):
+    context = Context()
+    context.archive = str(archive_dir)
+    context.data = os.path.join(get_data_path(), 'iris.csv')
+    context.dtypes = SortedDict({'SepalLength': 'str', 'Index': 'float64'})
+    context.raw = raw
+    context.schema = SortedDict({'0': 'Name'})
+    init(context)
+
+    archive(context)
+
+    dtypes_path = os.path.join(context.archive, context.dtypes_file)
+    with open(dtypes_path, mode='r') as f:
+        actual = loads(f.read())
+
+    if raw:
+        expected = dict.fromkeys(
+            ['Index', 'SepalLength', 'SepalWidth', 'PetalLength',
+             'PetalWidth', 'Name'], 'str')
+    else:
+        expected = {
+            'Index': 'float64',
+            'SepalLength': 'str',
+            'SepalWidth': 'float64',
+            'PetalLength': 'float64',
+            'PetalWidth': 'float64',
+            'Name': 'str',
+        }
+    assert actual == expected
@@ -0,0 +1,64 @@
+"""syphon.tests.archive.test_combiner.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from syphon.archive._combiner import Combiner
+
+
+def test_combiner_frames():
+    combiner = Combiner()
+    combiner.add(('b.csv', DataFrame({'x': ['1'], 'y': ['2']})))
+    combiner.add(('a.csv', DataFrame({'x': ['3']})))
+    combiner.add(('b.csv', DataFrame({'z': ['4'], 'x': ['5']})))
+
+    tasks = combiner.tasks()
+
+    assert [target for target, _ in tasks] == ['b.csv', 'a.csv']
+    assert_frame_equal(
+        tasks[0][1],
+        DataFrame({
+            'x': ['1', '5'],
+            'y': ['2', None],
+            'z': [None, '4']
+        }),
+        check_like=True)
+    assert_frame_equal(tasks[1][1], DataFrame({'x': ['3']}))
+
+
+def test_combiner_lines():
+    combiner = Combiner()
+    combiner.add(('a.csv', (b'x,y\n', [b'1,2\n'])))
+    combiner.add(('a.csv', (b'x,y\n', [b'3,4\n', b'5,6\n'])))
+
+    assert combiner.tasks() == [
+        ('a.csv', (b'x,y\n', [b'1,2\n', b'3,4\n', b'5,6\n']))]
+
+
+def test_combiner_line_endings():
+    combiner = Combiner()
+    combiner.add(('a.csv', (b'x,y\n', [b'1,2\n'])))
+    combiner.add(('a.csv', (b'"x",y\r\n', [b'3,4\r\n', b'5,6'])))
+
+    assert combiner.tasks() == [
+        ('a.csv', (b'x,y\n', [b'1,2\n', b'3,4\n', b'5,6\n']))]
+
+
+@pytest.mark.parametrize('data', [
+    (b'y,x\n', [b'4,3\n']),
+    DataFrame({'x': ['3'], 'y': ['4']})
+])
+def test_combiner_mixed(data):
+    combiner = Combiner()
+    combiner.add(('a.csv', (b'x,y\n', [b'1,2\n'])))
+    combiner.add(('a.csv', data))
+
+    tasks = combiner.tasks()
+
+    assert [target for target, _ in tasks] == ['a.csv']
+    assert_frame_equal(
+        tasks[0][1], DataFrame({'x': ['1', '3'], 'y': ['2', '4']}))
@@ -156,3 +156,25 @@ class TestDataFilter(object):
             else:
                 msg = 'Could not find a matching frame in the filtered list.'
                 pytest.fail(msg=msg)
+
+    def test_datafilter_categorical(self):
+        data = DataFrame({
+            'a': ['x', 'y', 'x', 'y', 'z'],
+            'b': ['1', '1', '2', '1', '1'],
+            'c': [str(i) for i in range(5)]
+        })
+        schema = SortedDict({'0': 'a', '1': 'b'})
+
+        expected = [data.iloc[[0]], data.iloc[[2]], data.iloc[[1, 3]],
+                    data.iloc[[4]]]
+
+        categorical = data.copy()
+        categorical['a'] = categorical['a'].astype('category')
+
+        for frame in [data, categorical]:
+            actual = datafilter(schema, frame)
+
+            assert len(expected) == len(actual)
+            for e, a in zip(expected, actual):
+                assert_frame_equal(e, a, check_categorical=False,
+                                   check_dtype=False)
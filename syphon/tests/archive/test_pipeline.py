@@ -0,0 +1,62 @@
+"""syphon.tests.archive.test_pipeline.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from threading import Lock
+
+import pytest
+from syphon.archive._pipeline import pipeline
+
+
+class _Sink(object):
+    def __init__(self):
+        self.lock = Lock()
+        self.tasks = list()
+
+    def write(self, task):
+        with self.lock:
+            self.tasks.append(task)
+
+
+@pytest.mark.parametrize('depth', [1, 2, 8])
+@pytest.mark.parametrize('workers', [1, 3])
+def test_pipeline(depth, workers):
+    sink = _Sink()
+
+    pipeline(
+        range(20),
+        lambda item: None if item % 5 == 0 else item * 10,
+        lambda result: [result, result + 1],
+        sink.write,
+        depth=depth,
+        workers=workers)
+
+    expected = list()
+    for item in range(20):
+        if item % 5 != 0:
+            expected += [item * 10, item * 10 + 1]
+
+    assert sorted(sink.tasks) == expected
+
+
+@pytest.mark.parametrize('stage', ['read', 'partition', 'write'])
+def test_pipeline_error(stage):
+    def _fail_on(name: str, value):
+        if name == stage and value == 7:
+            raise ValueError(name)
+        return value
+
+    sink = _Sink()
+
+    with pytest.raises(ValueError, match=stage):
+        pipeline(
+            range(100),
+            lambda item: _fail_on('read', item),
+            lambda result: [_fail_on('partition', result)],
+            lambda task: sink.write(_fail_on('write', task)),
+            depth=1,
+            workers=2)
+
+    assert 7 not in sink.tasks
@@ -0,0 +1,87 @@
+"""syphon.tests.archive.test_rawrouter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from sortedcontainers import SortedDict
+from syphon.archive._rawrouter import route, write
+
+
+class TestRoute(object):
+    content = (
+        b'a,b,c\n'
+        b'1,x,"quoted, value"\n'
+        b'2,y,plain\r\n'
+        b'\n'
+        b'3,x,"multi\nline"\n'
+        b'4,"y",last'
+    )
+
+    def test_route(self, tmpdir):
+        datafile = tmpdir.join('data.csv')
+        datafile.write_binary(TestRoute.content)
+
+        header, partitions = route(SortedDict({'0': 'b'}), str(datafile))
+
+        assert header == b'a,b,c\n'
+        assert list(partitions.keys()) == [('x',), ('y',)]
+        assert partitions[('x',)] == [
+            b'1,x,"quoted, value"\n', b'3,x,"multi\nline"\n']
+        assert partitions[('y',)] == [b'2,y,plain\r\n', b'4,"y",last']
+
+    def test_route_multiple_columns(self, tmpdir):
+        datafile = tmpdir.join('data.csv')
+        datafile.write_binary(TestRoute.content)
+
+        _, partitions = route(
+            SortedDict({'0': 'b', '1': 'a'}), str(datafile))
+
+        assert list(partitions.keys()) == [
+            ('x', '1'), ('y', '2'), ('x', '3'), ('y', '4')]
+
+    def test_route_no_schema(self, tmpdir):
+        datafile = tmpdir.join('data.csv')
+        datafile.write_binary(TestRoute.content)
+
+        _, partitions = route(SortedDict(), str(datafile))
+
+        assert list(partitions.keys()) == [()]
+        assert len(partitions[()]) == 4
+
+    def test_route_empty(self, tmpdir):
+        datafile = tmpdir.join('data.csv')
+        datafile.write_binary(b'')
+
+        header, partitions = route(SortedDict({'0': 'b'}), str(datafile))
+
+        assert header == b''
+        assert len(partitions) == 0
+
+    def test_route_indexerror(self, tmpdir):
+        datafile = tmpdir.join('data.csv')
+        datafile.write_binary(TestRoute.content)
+
+        with pytest.raises(IndexError):
+            route(SortedDict({'0': 'd'}), str(datafile))
+
+    def test_route_missing_values(self, tmpdir, capsys):
+        datafile = tmpdir.join('data.csv')
+        datafile.write_binary(
+            b'a,b\n1,\n2,NA\n3,"null"\n4,nan\n5,x\n6\n')
+
+        _, partitions = route(SortedDict({'0': 'b'}), str(datafile))
+
+        assert list(partitions.keys()) == [('x',)]
+        assert partitions[('x',)] == [b'5,x\n']
+        assert capsys.readouterr().out == (
+            'Skipping 5 rows with a missing b value in {}\n'.format(datafile))
+
+
+def test_write(tmpdir):
+    target = tmpdir.join('target.csv')
+
+    write(str(target), b'a,b\n', [b'1,x\r\n', b'2,y'])
+
+    assert target.read_binary() == b'a,b\n1,x\r\n2,y\n'
@@ -0,0 +1,104 @@
+"""syphon.tests.build_.test_aggregate.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from numpy import nan
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from syphon.build_._aggregate import Aggregator, columns, parse
+
+
+class TestParse(object):
+    def test_parse(self):
+        actual = parse(['count', 'MEAN( temp )', 'count(lot id)'])
+
+        assert actual == [
+            ('count', 'count', None),
+            ('mean(temp)', 'mean', 'temp'),
+            ('count(lot id)', 'count', 'lot id'),
+        ]
+
+    @pytest.mark.parametrize('expression', [
+        '', 'mean', 'median(temp)', 'sum()', 'max(a', '(a)'])
+    def test_parse_valueerror(self, expression):
+        with pytest.raises(ValueError):
+            parse([expression])
+
+    def test_columns(self):
+        actual = columns(['lot', 'temp'], parse(['count', 'min(temp)',
+                                                 'max(volts)']))
+
+        assert actual == ['lot', 'temp', 'volts']
+
+
+class TestAggregator(object):
+    frames = [
+        DataFrame({'lot': ['a', 'b', 'a'], 'temp': ['1', '2', '4']}),
+        DataFrame({'lot': ['b', nan, 'a'], 'temp': ['x', '8', nan]}),
+        DataFrame({'lot': ['c']}),
+    ]
+    aggregates = parse(['count', 'count(temp)', 'sum(temp)', 'mean(temp)',
+                        'min(temp)', 'max(temp)'])
+
+    def test_aggregator(self):
+        aggregator = Aggregator(['lot'], TestAggregator.aggregates)
+        for frame in TestAggregator.frames:
+            aggregator.add(frame)
+
+        expected = DataFrame({
+            'lot': [nan, 'a', 'b', 'c'],
+            'count': ['1', '3', '2', '1'],
+            'count(temp)': ['1', '2', '2', '0'],
+            'sum(temp)': ['8', '5', '2', nan],
+            'mean(temp)': ['8', '2.5', '2', nan],
+            'min(temp)': ['8', '1', '2', nan],
+            'max(temp)': ['8', '4', '2', nan],
+        }, columns=['lot', 'count', 'count(temp)', 'sum(temp)',
+                    'mean(temp)', 'min(temp)', 'max(temp)'])
+
+        assert_frame_equal(expected, aggregator.result())
+
+    def test_merge(self):
+        expected = Aggregator(['lot'], TestAggregator.aggregates)
+        actual = Aggregator(['lot'], TestAggregator.aggregates)
+        for frame in TestAggregator.frames:
+            expected.add(frame)
+            partial = Aggregator(['lot'], TestAggregator.aggregates)
+            partial.add(frame)
+            actual.merge(partial)
+
+        assert_frame_equal(expected.result(), actual.result())
+
+    def test_merge_disjoint(self):
+        expected = Aggregator(['lot'], TestAggregator.aggregates)
+        actual = Aggregator(['lot'], TestAggregator.aggregates)
+        frame = TestAggregator.frames[0]
+        for lot in ['b', 'a']:
+            expected.add(frame[frame['lot'] == lot])
+            partial = Aggregator(['lot'], TestAggregator.aggregates)
+            partial.add(frame[frame['lot'] == lot])
+            actual.merge(partial, disjoint=True)
+
+        assert_frame_equal(expected.result(), actual.result())
+
+    def test_no_keys(self):
+        aggregator = Aggregator([], parse(['count', 'sum(temp)']))
+        for frame in TestAggregator.frames:
+            aggregator.add(frame)
+
+        expected = DataFrame({'count': ['7'], 'sum(temp)': ['15']},
+                             columns=['count', 'sum(temp)'])
+
+        assert_frame_equal(expected, aggregator.result())
+
+    def test_empty(self):
+        aggregates = parse(['count', 'max(temp)'])
+
+        assert list(Aggregator(['lot'], aggregates).result().columns) == [
+            'lot', 'count', 'max(temp)']
+        row = Aggregator([], aggregates).result().iloc[0]
+        assert row['count'] == '0'
+        assert row.isnull()['max(temp)']
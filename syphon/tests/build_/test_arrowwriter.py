@@ -0,0 +1,59 @@
+"""syphon.tests.build_.test_arrowwriter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from numpy import nan
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from syphon.build_._arrowwriter import (
+    ArrowWriter, CSV, FEATHER, output_format, write_arrow)
+
+
+@pytest.mark.parametrize('filepath, value, expected', [
+    ('cache.csv', None, CSV),
+    ('cache', None, CSV),
+    ('cache.arrow', None, FEATHER),
+    ('cache.FEATHER', None, FEATHER),
+    ('cache.ipc', None, FEATHER),
+    ('cache.csv', FEATHER, FEATHER),
+    ('cache.feather', CSV, CSV),
+])
+def test_output_format(filepath, value, expected):
+    assert output_format(filepath, value) == expected
+
+
+def test_arrowwriter(tmpdir):
+    pyarrow = pytest.importorskip('pyarrow')
+    import pyarrow.ipc
+
+    target = str(tmpdir.join('cache.arrow'))
+
+    with open(target, 'wb') as file:
+        writer = ArrowWriter(file, ['a', 'b'])
+        writer.write(DataFrame({'b': ['1', nan], 'a': ['x', 'y']}))
+        writer.write(DataFrame({'a': ['z']}))
+        writer.write(DataFrame(columns=['a', 'b']))
+        writer.detach()
+
+    with pyarrow.memory_map(target) as source:
+        table = pyarrow.ipc.open_file(source).read_all()
+
+    assert table.num_rows == 3
+    assert table.column_names == ['a', 'b']
+    assert table.column('a').to_pylist() == ['x', 'y', 'z']
+    assert table.column('b').to_pylist() == ['1', None, None]
+
+
+def test_write_arrow(tmpdir):
+    pytest.importorskip('pyarrow')
+    from pandas import read_feather
+
+    expected = DataFrame({'a': ['x', nan], 'b': ['1', '2']})
+    target = str(tmpdir.join('cache.feather'))
+
+    write_arrow(expected, target)
+
+    assert_frame_equal(expected, read_feather(target))
@@ -7,13 +7,14 @@
 import os
 
 import pytest
-from pandas import DataFrame, read_csv
+from pandas import concat, DataFrame, read_csv
 from pandas.testing import assert_frame_equal
 from sortedcontainers import SortedDict
 from syphon import Context
 from syphon.archive import archive
+from syphon.catalog import catalog
 from syphon.init import init
-from syphon.build_ import build
+from syphon.build_ import build, build_frame
 
 from .. import get_data_path
 
@@ -157,3 +158,998 @@ class TestBuild(object):
 
         with pytest.raises(FileExistsError):
             build(context)
+
+    def test_build_column_union(self, archive_dir, cache_file):
+        os.makedirs(str(archive_dir.join('a')))
+        os.makedirs(str(archive_dir.join('b')))
+        DataFrame({'x': ['1', '2'], 'y': ['3', '4']}).to_csv(
+            str(archive_dir.join('a', 'data.csv')), index=False)
+        DataFrame({'z': ['5'], 'x': ['6']}).to_csv(
+            str(archive_dir.join('b', 'data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+
+        build(context)
+
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        actual_frame.sort_values('x', inplace=True)
+        actual_frame.reset_index(drop=True, inplace=True)
+
+        expected_frame = DataFrame({
+            'x': ['1', '2', '6'],
+            'y': ['3', '4', None],
+            'z': [None, None, '5']
+        })
+
+        assert_frame_equal(expected_frame, actual_frame, check_like=True)
+
+    @pytest.mark.parametrize('engine', ['pandas', 'pyarrow'])
+    @pytest.mark.parametrize('chunksize', [1, 7, 1000])
+    def test_build_chunksize(
+            self, archive_dir, cache_file, tmpdir, engine, chunksize):
+        if engine == 'pyarrow':
+            pytest.importorskip('pyarrow')
+
+        os.makedirs(str(archive_dir.join('a')))
+        os.makedirs(str(archive_dir.join('b')))
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:100].to_csv(
+            str(archive_dir.join('a', 'data.csv')), index=False)
+        iris.iloc[100:, ::-1].assign(Extra='x,y').to_csv(
+            str(archive_dir.join('b', 'data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(tmpdir.join('expected.csv'))
+
+        build(context)
+
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.engine = engine
+
+        build(context)
+
+        assert tmpdir.join('expected.csv').read() == cache_file.read()
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    def test_build_jobs(self, archive_dir, cache_file, tmpdir, chunksize):
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        for i in range(15):
+            path = archive_dir.mkdir(str(i))
+            iris.iloc[i::15].to_csv(str(path.join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(tmpdir.join('expected.csv'))
+        context.chunksize = chunksize
+
+        build(context)
+
+        context.cache = str(cache_file)
+        context.jobs = 4
+
+        build(context)
+
+        assert tmpdir.join('expected.csv').read() == cache_file.read()
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    def test_build_incremental(
+            self, archive_dir, cache_file, tmpdir, chunksize):
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:50].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.incremental = True
+
+        build(context)
+
+        # new file
+        iris.iloc[50:100].to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+        build(context)
+
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        assert_frame_equal(iris.iloc[:100], actual_frame)
+
+        # modified file
+        iris.iloc[:60].to_csv(
+            str(archive_dir.join('a', 'data.csv')), index=False)
+        build(context)
+
+        expected_cache = str(tmpdir.join('expected.csv'))
+        TestBuild._build_from_scratch(context, expected_cache)
+        assert tmpdir.join('expected.csv').read() == cache_file.read()
+
+        # new file with a new column
+        iris.iloc[100:].assign(Extra='x').to_csv(
+            str(archive_dir.mkdir('c').join('data.csv')), index=False)
+        build(context)
+
+        TestBuild._build_from_scratch(context, expected_cache)
+        assert tmpdir.join('expected.csv').read() == cache_file.read()
+
+    @staticmethod
+    def _build_from_scratch(context: Context, cache: str):
+        expected = Context()
+        expected.archive = context.archive
+        expected.cache = cache
+        expected.chunksize = context.chunksize
+        expected.overwrite = True
+        build(expected)
+
+    def test_build_update(self, archive_dir, cache_file, capsys):
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:50].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.update = True
+        context.verbose = True
+
+        build(context)
+        capsys.readouterr()
+
+        # nothing changed, so the cache file is left alone
+        cache_file.write('up to date')
+        build(context)
+        assert cache_file.read() == 'up to date'
+        assert 'is up to date' in capsys.readouterr().out
+
+        # a new file is built without overwrite
+        iris.iloc[50:].to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+        build(context)
+        assert_frame_equal(
+            iris, DataFrame(read_csv(context.cache, dtype=str)))
+
+        # different options are built
+        cache_file.write('up to date')
+        context.filter = 'Index < 10'
+        build(context)
+        assert_frame_equal(
+            iris.iloc[:10], DataFrame(read_csv(context.cache, dtype=str)))
+
+        # a cache file without a manifest is never replaced
+        cache_file.write('not built')
+        os.remove(str(cache_file) + '.manifest.json')
+        with pytest.raises(FileExistsError):
+            build(context)
+
+    @pytest.mark.parametrize('options', [
+        {'cache': '-'},
+        {'shards': 2},
+        {'split_by': 'Name'},
+    ])
+    def test_build_update_valueerror(self, archive_dir, cache_file,
+                                     options):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.update = True
+        for name, value in options.items():
+            setattr(context, name, value)
+
+        with pytest.raises(ValueError):
+            build(context)
+
+    @pytest.mark.parametrize('where', [
+        {'cylinders': ['8.']},
+        {'cylinders': ['4', '6']},
+        {'origin': ['1.', '3.'], 'model year': ['70.']},
+        {'model year': ['99']},
+    ])
+    def test_build_where(self, archive_dir, cache_file, where):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'auto-mpg.csv')
+        context.schema = SortedDict(
+            {'0': 'model year', '1': 'cylinders', '2': 'origin'})
+
+        init(context)
+        archive(context)
+
+        # stray files above the pruned levels are never read
+        archive_dir.join('stray.csv').write('cylinders\n8.\n')
+
+        context.schema = None
+        context.where = SortedDict(where)
+
+        build(context)
+
+        expected_frame = DataFrame(read_csv(context.data, dtype=str))
+        for column, values in where.items():
+            values = [v.rstrip('.') for v in values]
+            mask = expected_frame[column].str.rstrip('.').isin(values)
+            expected_frame = expected_frame[mask]
+        expected_frame = expected_frame.sort_values(
+            list(expected_frame.columns)).reset_index(drop=True)
+
+        actual_frame = DataFrame()
+        if os.path.getsize(context.cache) > 1:
+            actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        if len(actual_frame) != 0 or len(expected_frame) != 0:
+            actual_frame = actual_frame.sort_values(
+                list(actual_frame.columns)).reset_index(drop=True)
+            assert_frame_equal(expected_frame, actual_frame,
+                               check_like=True)
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    def test_build_columns(self, archive_dir, cache_file, chunksize):
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:100].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+        iris.iloc[100:].drop('PetalWidth', axis=1).to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.columns = ['PetalWidth', 'Index', 'Missing']
+
+        build(context)
+
+        expected_frame = iris.reindex(columns=context.columns)
+        expected_frame.loc[100:, 'PetalWidth'] = None
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        assert list(actual_frame.columns) == context.columns
+
+        actual_frame['Index'] = actual_frame['Index'].astype(int)
+        actual_frame = actual_frame.sort_values('Index')
+        actual_frame = actual_frame.reset_index(drop=True)
+        expected_frame['Index'] = expected_frame['Index'].astype(int)
+
+        assert_frame_equal(expected_frame, actual_frame, check_dtype=False)
+
+    @pytest.mark.parametrize('engine', ['pandas', 'pyarrow'])
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    def test_build_columns_missing_from_file(self, archive_dir, cache_file,
+                                             engine, chunksize):
+        if engine == 'pyarrow':
+            pytest.importorskip('pyarrow')
+
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:100].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+        iris.iloc[100:].drop('PetalWidth', axis=1).to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.columns = ['PetalWidth']
+        context.engine = engine
+
+        build(context)
+
+        expected_frame = iris.reindex(columns=context.columns)
+        expected_frame.loc[100:, 'PetalWidth'] = None
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+
+        assert_frame_equal(expected_frame, actual_frame)
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    @pytest.mark.parametrize('columns', [None, ['Index']])
+    def test_build_filter(self, archive_dir, cache_file, chunksize, columns):
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:100].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+        iris.iloc[100:].to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.columns = columns
+        context.filter = 'PetalWidth >= 1.8 and not Name == Iris-virginica'
+
+        build(context)
+
+        expected_frame = iris[(iris['PetalWidth'].astype(float) >= 1.8) &
+                              (iris['Name'] != 'Iris-virginica')]
+        if columns is not None:
+            expected_frame = expected_frame[columns]
+        expected_frame = expected_frame.reset_index(drop=True)
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+
+        assert len(expected_frame) == 1
+        assert_frame_equal(expected_frame, actual_frame)
+
+    def test_build_filter_valueerror(self, archive_dir, cache_file):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.filter = 'PetalWidth >='
+
+        with pytest.raises(ValueError):
+            build(context)
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    def test_build_feather(self, archive_dir, tmpdir, chunksize):
+        pytest.importorskip('pyarrow')
+        from pandas import read_feather
+
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.to_csv(str(archive_dir.join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(tmpdir.join('cache.feather'))
+        context.chunksize = chunksize
+
+        build(context)
+
+        assert_frame_equal(iris, read_feather(context.cache))
+
+    def test_build_feather_incremental(self, archive_dir, tmpdir):
+        pytest.importorskip('pyarrow')
+        from pandas import read_feather
+
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:100].to_csv(str(archive_dir.join('a.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(tmpdir.join('cache.csv'))
+        context.format = 'feather'
+        context.incremental = True
+
+        build(context)
+
+        iris.iloc[100:].to_csv(str(archive_dir.join('b.csv')), index=False)
+
+        build(context)
+
+        actual = read_feather(context.cache)
+        actual = actual.iloc[actual['Index'].astype(int).argsort()]
+        assert_frame_equal(iris, actual.reset_index(drop=True))
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    @pytest.mark.parametrize('shards, max_rows, expected', [
+        (None, 40, [40, 40, 40, 30]),
+        (None, 150, [150]),
+        (3, None, [50, 50, 50]),
+        (4, None, [38, 38, 38, 36]),
+    ])
+    def test_build_shards(self, archive_dir, cache_file, chunksize, shards,
+                          max_rows, expected):
+        from syphon.build_ import _shards
+
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.to_csv(str(archive_dir.join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.max_rows = max_rows
+        context.shards = shards
+
+        build(context)
+
+        index = _shards.load(context.cache)
+        assert [shard['rows'] for shard in index['shards']] == expected
+        assert index['rows'] == 150
+        assert not os.path.exists(context.cache)
+
+        frames = [
+            DataFrame(read_csv(
+                os.path.join(os.path.dirname(context.cache), shard['path']),
+                dtype=str))
+            for shard in index['shards']
+        ]
+        assert_frame_equal(iris, concat(frames, ignore_index=True))
+
+    def test_build_shards_overwrite(self, archive_dir, cache_file):
+        from syphon.build_ import _shards
+
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.to_csv(str(archive_dir.join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.max_rows = 10
+
+        build(context)
+
+        with pytest.raises(FileExistsError):
+            build(context)
+
+        context.max_rows = None
+        context.overwrite = True
+        context.shards = 2
+
+        build(context)
+
+        assert not os.path.exists(_shards.shard_path(context.cache, 2))
+        assert len(_shards.load(context.cache)['shards']) == 2
+
+    @pytest.mark.parametrize('engine', ['pandas', 'pyarrow'])
+    def test_build_shards_filter(self, archive_dir, cache_file, engine):
+        from syphon.build_ import _shards
+
+        if engine == 'pyarrow':
+            pytest.importorskip('pyarrow')
+
+        archive_dir.join('a.csv').write(
+            'x,extra\n' + ''.join('{},{}\n'.format(i, i % 2)
+                                  for i in range(8)))
+        archive_dir.join('b.csv').write(
+            'x\n' + ''.join('{}\n'.format(i) for i in range(8)))
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.engine = engine
+        context.filter = 'not extra == 1'
+        context.shards = 4
+
+        build(context)
+
+        index = _shards.load(context.cache)
+        assert [shard['rows'] for shard in index['shards']] == [3, 3, 3, 3]
+
+    @pytest.mark.parametrize('shards, max_rows, distinct', [
+        (2, 10, False),
+        (0, None, False),
+        (2, None, True),
+    ])
+    def test_build_shards_valueerror(self, archive_dir, cache_file, shards,
+                                     max_rows, distinct):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.distinct = distinct
+        context.max_rows = max_rows
+        context.shards = shards
+
+        with pytest.raises(ValueError):
+            build(context)
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    @pytest.mark.parametrize('split_by, columns', [
+        ('cylinders', None),
+        ('origin', None),
+        ('model year', ['mpg', 'cylinders']),
+    ])
+    def test_build_split_by(self, archive_dir, tmpdir, chunksize, split_by,
+                            columns):
+        from syphon.schema.resolvepath import _normalize
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(tmpdir.join('split'))
+        context.data = os.path.join(get_data_path(), 'auto-mpg.csv')
+        context.schema = SortedDict({'0': 'cylinders'})
+
+        init(context)
+        archive(context)
+
+        context.chunksize = chunksize
+        context.columns = columns
+        context.schema = None
+        context.split_by = split_by
+
+        build(context)
+
+        data = DataFrame(read_csv(context.data, dtype=str))
+        names = data[split_by].map(_normalize)
+
+        assert (sorted(os.listdir(context.cache)) ==
+                sorted(name + '.csv' for name in names.unique()))
+
+        for name in names.unique():
+            expected_frame = data[names == name]
+            if columns is not None:
+                expected_frame = expected_frame[columns]
+            expected_frame = expected_frame.sort_values(
+                list(expected_frame.columns)).reset_index(drop=True)
+
+            actual_frame = DataFrame(read_csv(
+                os.path.join(context.cache, name + '.csv'), dtype=str))
+            actual_frame = actual_frame.sort_values(
+                list(actual_frame.columns)).reset_index(drop=True)
+
+            assert_frame_equal(expected_frame, actual_frame, check_like=True)
+
+    def test_build_split_by_fileexistserror(self, archive_dir, tmpdir):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(tmpdir.mkdir('split'))
+        context.split_by = 'Name'
+        tmpdir.join('split', 'old.csv').write('Name\n')
+
+        with pytest.raises(FileExistsError):
+            build(context)
+
+        context.overwrite = True
+        build(context)
+
+    @pytest.mark.parametrize('chunksize', [None, 7])
+    @pytest.mark.parametrize('sort_buffer', [25, 1000])
+    @pytest.mark.parametrize('max_rows', [None, 40])
+    def test_build_sort_by(self, archive_dir, cache_file, chunksize,
+                           sort_buffer, max_rows):
+        from syphon.build_ import _shards
+
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris.iloc[:75].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+        iris.iloc[75:].drop('SepalWidth', axis=1).to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.max_rows = max_rows
+        context.sort_buffer = sort_buffer
+        context.sort_by = ['SepalWidth', 'PetalLength']
+
+        build(context)
+
+        if max_rows is None:
+            actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        else:
+            actual_frame = concat([
+                DataFrame(read_csv(
+                    os.path.join(os.path.dirname(context.cache),
+                                 shard['path']),
+                    dtype=str))
+                for shard in _shards.load(context.cache)['shards']
+            ], ignore_index=True)
+
+        keys = actual_frame[context.sort_by].fillna('\uffff')
+        assert list(keys.itertuples(index=False)) == sorted(
+            keys.itertuples(index=False))
+
+        actual_frame = actual_frame.sort_values('Index')
+        actual_frame = actual_frame.reset_index(drop=True)
+        expected_frame = iris.copy()
+        expected_frame.loc[75:, 'SepalWidth'] = None
+        expected_frame = expected_frame.sort_values('Index')
+        expected_frame = expected_frame.reset_index(drop=True)
+        assert_frame_equal(expected_frame, actual_frame, check_like=True)
+        assert not any(name.startswith('.syphon-sort-')
+                       for name in os.listdir(os.path.dirname(context.cache)))
+
+    @pytest.mark.parametrize('chunksize', [None, 7])
+    @pytest.mark.parametrize('distinct_buffer', [10, 1000])
+    @pytest.mark.parametrize('distinct_key', [None, ['Name', 'PetalWidth']])
+    def test_build_distinct(self, archive_dir, cache_file, chunksize,
+                            distinct_buffer, distinct_key):
+        iris = DataFrame(read_csv(
+            os.path.join(get_data_path(), 'iris.csv'), dtype=str))
+        iris = iris.drop('Index', axis=1)
+        iris.iloc[:100].to_csv(
+            str(archive_dir.mkdir('a').join('data.csv')), index=False)
+        iris.iloc[50:].to_csv(
+            str(archive_dir.mkdir('b').join('data.csv')), index=False)
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.chunksize = chunksize
+        context.distinct = True
+        context.distinct_buffer = distinct_buffer
+        context.distinct_key = distinct_key
+
+        build(context)
+
+        expected_frame = iris.drop_duplicates(distinct_key)
+        expected_frame = expected_frame.sort_values(
+            list(expected_frame.columns)).reset_index(drop=True)
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        actual_frame = actual_frame.sort_values(
+            list(actual_frame.columns)).reset_index(drop=True)
+
+        if distinct_key is None:
+            assert_frame_equal(expected_frame, actual_frame)
+        else:
+            assert len(actual_frame) == len(expected_frame)
+            assert not actual_frame.duplicated(distinct_key).any()
+        assert not any(name.startswith('.syphon-distinct-')
+                       for name in os.listdir(os.path.dirname(context.cache)))
+
+    @pytest.mark.parametrize('chunksize', [None, 10])
+    @pytest.mark.parametrize('jobs', [1, 3])
+    @pytest.mark.parametrize('group_by', [
+        ['cylinders'], ['origin'], ['origin', 'cylinders'], None])
+    def test_build_aggregate(self, archive_dir, cache_file, chunksize, jobs,
+                             group_by):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'auto-mpg.csv')
+        context.schema = SortedDict({'0': 'cylinders'})
+
+        init(context)
+        archive(context)
+
+        context.agg = ['count', 'mean(mpg)', 'max(horsepower)',
+                       'count(horsepower)']
+        context.chunksize = chunksize
+        context.group_by = group_by
+        context.jobs = jobs
+        context.schema = None
+
+        build(context)
+
+        data = DataFrame(read_csv(context.data, dtype=str))
+        data['all'] = ''
+        groups = data.groupby(group_by or ['all'])
+        expected_frame = DataFrame({
+            'count': groups.size(),
+            'mean(mpg)': groups['mpg'].apply(
+                lambda values: values.astype(float).mean()),
+            'max(horsepower)': groups['horsepower'].apply(
+                lambda values: values.astype(float).max()),
+            'count(horsepower)': groups['horsepower'].count(),
+        }, columns=context.agg)
+        expected_frame = expected_frame.reset_index(drop=group_by is None)
+
+        actual_frame = DataFrame(read_csv(context.cache))
+        if group_by is not None:
+            for column in group_by:
+                actual_frame[column] = DataFrame(read_csv(
+                    context.cache, dtype=str))[column]
+
+        assert_frame_equal(expected_frame, actual_frame, check_dtype=False)
+
+    @pytest.mark.parametrize('group_by', [None, ['missing']])
+    def test_build_aggregate_count(self, archive_dir, cache_file, group_by):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+
+        init(context)
+        archive(context)
+
+        context.agg = ['count']
+        context.group_by = group_by
+
+        build(context)
+
+        actual_frame = DataFrame(read_csv(context.cache))
+        assert list(actual_frame['count']) == [150]
+
+    def test_build_schema_depth(self, archive_dir, cache_file):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+
+        init(context)
+        archive(context)
+
+        # stray files outside the schema depth are never read
+        archive_dir.join('stray.csv').write('Name\nstray\n')
+        archive_dir.join('iris-setosa', 'deep', 'stray.csv').write(
+            'Name\nstray\n', ensure=True)
+
+        context.schema = None
+
+        build(context)
+
+        expected_frame = DataFrame(read_csv(context.data, dtype=str))
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+
+        assert_frame_equal(expected_frame, actual_frame)
+
+    def test_build_hidden_partition(self, archive_dir, import_dir,
+                                    cache_file):
+        data_file = import_dir.join('data.csv')
+        data_file.write('x,y\n.5,a\n1.5,b\n')
+
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = str(data_file)
+        context.overwrite = True
+        context.schema = SortedDict({'0': 'x'})
+
+        archive(context)
+        assert archive_dir.join('.5', 'data.csv').check()
+
+        build(context)
+
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        assert sorted(actual_frame['x']) == ['.5', '1.5']
+
+        catalog(context)
+        build(context)
+
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        assert sorted(actual_frame['x']) == ['.5', '1.5']
+
+    def test_build_catalog(self, archive_dir, cache_file, capsys):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.overwrite = True
+        context.schema = SortedDict({'0': 'Name'})
+
+        init(context)
+        archive(context)
+
+        # files copied into the archive are not cataloged
+        archive_dir.join('iris-setosa', 'copied.csv').write(
+            'Index,Name\n150,Iris-setosa\n')
+
+        capsys.readouterr()
+        build(context)
+
+        assert 'copied.csv' not in capsys.readouterr().out
+
+        context.check_catalog = True
+        build(context)
+
+        assert 'copied.csv' in capsys.readouterr().out
+        expected_frame = DataFrame(read_csv(context.data, dtype=str))
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        assert_frame_equal(expected_frame, actual_frame)
+
+        catalog(context)
+        build(context)
+
+        assert 'catalog' not in capsys.readouterr().out
+
+        actual_frame = DataFrame(read_csv(context.cache, dtype=str))
+        assert len(actual_frame) == len(expected_frame) + 1
+        assert '150' in actual_frame['Index'].values
+
+    @pytest.mark.parametrize('jobs', [1, 4])
+    @pytest.mark.parametrize('cataloged', [False, True])
+    def test_build_header_union(self, archive_dir, cache_file, jobs,
+                                cataloged):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.jobs = jobs
+        context.schema = SortedDict({'0': 'lot'})
+
+        files = [
+            ('a', 'lot,x\na,1\n'),
+            ('b', 'lot,y,x\nb,2,3\n'),
+            ('c', 'z,lot\n4,c\n'),
+        ]
+        for lot, content in files:
+            archive_dir.join(lot, 'data.csv').write(content, ensure=True)
+        if cataloged:
+            catalog(context)
+
+        build(context)
+
+        expected = DataFrame({
+            'lot': ['a', 'b', 'c'],
+            'x': ['1', '3', None],
+            'y': [None, '2', None],
+            'z': [None, None, '4'],
+        }, columns=['lot', 'x', 'y', 'z'])
+        actual = DataFrame(read_csv(context.cache, dtype=str))
+        assert_frame_equal(expected, actual)
+
+    @pytest.mark.parametrize('jobs', [1, 4])
+    @pytest.mark.parametrize('sample', [25, 0.2])
+    def test_build_sample(self, archive_dir, cache_file, jobs, sample):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+
+        init(context)
+        archive(context)
+
+        context.jobs = jobs
+        context.overwrite = True
+        context.sample = sample
+        context.seed = 7
+
+        build(context)
+        first = DataFrame(read_csv(context.cache, dtype=str))
+        build(context)
+        second = DataFrame(read_csv(context.cache, dtype=str))
+
+        expected = DataFrame(read_csv(context.data, dtype=str))
+        assert_frame_equal(first, second)
+        assert list(first.columns) == list(expected.columns)
+        if isinstance(sample, int):
+            assert len(first) == sample
+        else:
+            assert 10 < len(first) < 50
+        assert first['Index'].is_unique
+        assert set(first['Index']) <= set(expected['Index'])
+        # every row is a complete archive row
+        merged = first.merge(expected, how='inner')
+        assert len(merged) == len(first)
+
+    @pytest.mark.parametrize('limit', [1, 60, 1000])
+    def test_build_limit(self, archive_dir, cache_file, limit):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+
+        init(context)
+        archive(context)
+
+        context.limit = limit
+        context.filter = 'SepalLength > 5'
+
+        build(context)
+
+        expected = DataFrame(read_csv(context.data, dtype=str))
+        expected = expected[expected['SepalLength'].astype(float) > 5]
+        # archive files are read in sorted path order
+        expected = expected.sort_values('Name', kind='mergesort')
+        expected = expected.iloc[:limit].reset_index(drop=True)
+        actual = DataFrame(read_csv(context.cache, dtype=str))
+        assert_frame_equal(expected, actual)
+
+    @pytest.mark.parametrize('options', [
+        {'sample': 10, 'limit': 10},
+        {'sample': 10, 'sort_by': ['Name']},
+        {'sample': 0.5, 'distinct': True},
+        {'limit': 10, 'shards': 2},
+        {'limit': 10, 'group_by': ['Name']},
+        {'limit': 0},
+        {'sample': 0},
+        {'sample': 1.5},
+    ])
+    def test_build_sample_valueerror(self, archive_dir, cache_file, options):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        for name, value in options.items():
+            setattr(context, name, value)
+
+        with pytest.raises(ValueError):
+            build(context)
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'chunksize': 7, 'jobs': 4},
+        {'sort_by': ['SepalLength'], 'sort_buffer': 20},
+        {'group_by': ['Name']},
+        {'limit': 5},
+    ])
+    def test_build_stdout(self, archive_dir, cache_file, capsysbinary,
+                          options):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+
+        init(context)
+        archive(context)
+        for name, value in options.items():
+            setattr(context, name, value)
+
+        build(context)
+        capsysbinary.readouterr()
+
+        context.cache = '-'
+        context.verbose = True
+        build(context)
+
+        out, err = capsysbinary.readouterr()
+        assert out == cache_file.read_binary()
+        assert b'Build: ' in err
+        assert not os.path.exists(os.path.join(os.getcwd(), '-'))
+
+    @pytest.mark.parametrize('options', [
+        {'shards': 2},
+        {'split_by': 'Name'},
+        {'format': 'feather'},
+    ])
+    def test_build_stdout_valueerror(self, archive_dir, options):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = '-'
+        for name, value in options.items():
+            setattr(context, name, value)
+
+        with pytest.raises(ValueError):
+            build(context)
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'chunksize': 40},
+        {'filter': 'SepalLength > 5 and Name != Iris-setosa'},
+        {'limit': 60},
+    ])
+    def test_build_typed(self, archive_dir, cache_file, options):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+        context.typed = True
+
+        init(context)
+        archive(context)
+
+        for name, value in options.items():
+            setattr(context, name, value)
+
+        build(context)
+        frame = build_frame(context)
+
+        context.typed = False
+        context.cache = str(cache_file) + '.str'
+        build(context)
+
+        expected = DataFrame(read_csv(context.cache))
+        assert_frame_equal(expected, DataFrame(read_csv(str(cache_file))))
+        assert_frame_equal(expected, frame, check_dtype=False)
+        assert frame['Index'].dtype == 'Int64'
+        assert frame['SepalLength'].dtype == 'float64'
+        assert frame['Name'].dtype == object
+
+    @pytest.mark.parametrize('options', [
+        {'sort_by': ['Name']},
+        {'distinct': True},
+        {'agg': ['mean(SepalLength)']},
+        {'split_by': 'Name'},
+        {'max_rows': 10},
+    ])
+    def test_build_typed_valueerror(self, archive_dir, cache_file, options):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.schema = SortedDict({'0': 'Name'})
+        context.typed = True
+        init(context)
+
+        for name, value in options.items():
+            setattr(context, name, value)
+
+        with pytest.raises(ValueError):
+            build(context)
+
+    def test_build_typed_no_dtypes(self, archive_dir, cache_file):
+        context = Context()
+        context.archive = str(archive_dir)
+        context.cache = str(cache_file)
+        context.data = os.path.join(get_data_path(), 'iris.csv')
+        context.schema = SortedDict({'0': 'Name'})
+        init(context)
+        archive(context)
+
+        context.typed = True
+
+        with pytest.raises(ValueError):
+            build(context)
+        assert not os.path.exists(context.cache)
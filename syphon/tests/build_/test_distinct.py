@@ -0,0 +1,72 @@
+"""syphon.tests.build_.test_distinct.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from numpy import nan
+from pandas import concat, DataFrame
+from syphon.build_._distinct import Deduplicator
+
+
+@pytest.mark.parametrize('buffer_rows', [1, 4, 100])
+@pytest.mark.parametrize('key, expected', [
+    (['a', 'b'], ['0', '1', '2', '4', '6', '8']),
+    (['a'], ['0', '1', '4']),
+    (['missing'], ['0']),
+])
+def test_deduplicator(tmpdir, buffer_rows, key, expected):
+    frames = [
+        DataFrame({'a': ['x', 'y', 'x'], 'b': ['1', '1', nan],
+                   'c': ['0', '1', '2']}),
+        DataFrame({'a': ['x', nan, 'y'], 'b': ['1', '1', '1'],
+                   'c': ['3', '4', '5']}),
+        DataFrame({'c': ['6']}),
+        DataFrame({'a': [nan, 'x', 'y'], 'b': [nan, '2', '2'],
+                   'c': ['7', '8', '9']}),
+    ]
+    frames[3].loc[2, 'a'] = 'y'
+    frames[3].loc[2, 'b'] = '1'
+
+    deduplicator = Deduplicator(key, ['a', 'b', 'c'], buffer_rows,
+                                str(tmpdir), partitions=3)
+    try:
+        parts = [deduplicator.add(frame) for frame in frames]
+        parts.extend(deduplicator.remaining())
+    finally:
+        deduplicator.close()
+
+    actual = concat(parts, sort=False)
+    assert sorted(actual['c']) == expected
+    assert os.listdir(str(tmpdir)) == []
+    if buffer_rows == 100:
+        assert list(actual['c']) == expected
+
+
+def test_deduplicator_buffer_rows(tmpdir, monkeypatch):
+    sizes = list()
+    full = Deduplicator._full
+
+    def track(self):
+        sizes.append(len(self._seen))
+        return full(self)
+
+    monkeypatch.setattr(Deduplicator, '_full', track)
+
+    frame = DataFrame({'a': [str(i % 100) for i in range(300)]})
+    deduplicator = Deduplicator(['a'], ['a'], 8, str(tmpdir), partitions=2)
+    try:
+        parts = [deduplicator.add(frame.iloc[i:i + 10])
+                 for i in range(0, 300, 10)]
+        parts.extend(deduplicator.remaining(10))
+    finally:
+        deduplicator.close()
+
+    actual = concat(parts, sort=False)
+    assert sorted(actual['a']) == sorted(str(i) for i in range(100))
+    assert os.listdir(str(tmpdir)) == []
+    # at most one chunk of keys is added before spilling
+    assert max(sizes) <= 8 + 10
@@ -0,0 +1,63 @@
+"""syphon.tests.build_.test_filter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from numpy import nan
+from pandas import DataFrame
+from syphon.build_._filter import RowFilter
+
+
+class TestRowFilter(object):
+    frame = DataFrame({
+        'status': ['PASS', 'FAIL', 'FAIL', nan, 'PASS'],
+        'temp': ['80', '90', '85.0', '100', 'hot'],
+        'lot id': ['A', 'B', 'A', 'B', 'A'],
+    })
+
+    @pytest.mark.parametrize('expression, expected', [
+        ('status == FAIL', [False, True, True, False, False]),
+        ('status = FAIL', [False, True, True, False, False]),
+        ('status != FAIL', [True, False, False, False, True]),
+        ('temp > 85', [False, True, False, True, False]),
+        ('temp >= 85', [False, True, True, True, False]),
+        ('temp == 85', [False, False, True, False, False]),
+        ('temp < "9"', [True, False, True, True, False]),
+        ('"lot id" == \'A\'', [True, False, True, False, True]),
+        ('temp > 85 and status == FAIL', [False, True, False, False, False]),
+        ('temp > 85 or status == PASS', [True, True, False, True, True]),
+        ('NOT (status == PASS or status == FAIL)',
+         [False, False, False, True, False]),
+        ('not status == PASS and temp <= 85',
+         [False, False, True, False, False]),
+        ('missing == 1', [False, False, False, False, False]),
+    ])
+    def test_mask(self, expression, expected):
+        actual = RowFilter(expression).mask(TestRowFilter.frame)
+
+        assert list(actual) == expected
+
+    def test_apply(self):
+        actual = RowFilter('status == FAIL').apply(TestRowFilter.frame)
+
+        assert list(actual.index) == [1, 2]
+
+    def test_apply_empty(self):
+        actual = RowFilter('status == FAIL').apply(DataFrame())
+
+        assert len(actual) == 0
+
+    def test_columns(self):
+        actual = RowFilter('(b > 1 or a < 2) and not b == "x y"')
+
+        assert actual.columns == ['b', 'a']
+
+    @pytest.mark.parametrize('expression', [
+        '', 'status', 'status ==', '== FAIL', 'a == 1 b == 2',
+        '(a == 1', 'a == 1)', 'a == 1 and', 'a ! 1', 'a == "1',
+    ])
+    def test_valueerror(self, expression):
+        with pytest.raises(ValueError):
+            RowFilter(expression)
@@ -0,0 +1,77 @@
+"""syphon.tests.build_.test_header.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from numpy import nan
+from pandas import DataFrame, Series
+from pandas.testing import assert_frame_equal
+from syphon.build_._header import read_headers, stack, union
+
+
+def test_union():
+    headers = [['a', 'b'], [], ['c', 'a'], ['b', 'd', 'c']]
+
+    assert union(headers) == ['a', 'b', 'c', 'd']
+    assert union(iter(headers)) == ['a', 'b', 'c', 'd']
+    assert union([]) == []
+
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_read_headers(tmpdir, jobs):
+    file_list = list()
+    for number, header in enumerate(['a,b', 'c', '"d,e",a', '']):
+        file = tmpdir.join('{}.csv'.format(number))
+        file.write(header + '\n1,2\n' if header else '')
+        file_list.append(str(file))
+
+    assert read_headers(file_list, jobs) == [
+        ['a', 'b'], ['c'], ['d,e', 'a'], []]
+
+
+def test_stack():
+    frames = [
+        DataFrame({'a': ['1', '2'], 'b': ['3', nan]}, columns=['a', 'b']),
+        DataFrame(columns=['c']),
+        DataFrame({'c': ['4'], 'a': ['5'], 'x': ['6']},
+                  columns=['c', 'a', 'x']),
+    ]
+
+    actual = stack(frames, ['c', 'a', 'b'])
+
+    expected = DataFrame({
+        'c': [nan, nan, '4'],
+        'a': ['1', '2', '5'],
+        'b': ['3', nan, nan],
+    }, columns=['c', 'a', 'b'], dtype=object)
+    assert_frame_equal(expected, actual)
+
+
+def test_stack_empty():
+    actual = stack([], ['a', 'b'])
+
+    assert list(actual.columns) == ['a', 'b']
+    assert len(actual) == 0
+
+
+def test_stack_dtypes():
+    frames = [
+        DataFrame({'a': Series([1, None], dtype='Int64'), 'b': ['x', nan]},
+                  columns=['a', 'b']),
+        DataFrame({'c': [1.5]}),
+    ]
+    dtypes = {'a': 'int64', 'c': 'float64'}
+
+    actual = stack(frames, ['c', 'a', 'b'], dtypes)
+
+    expected = DataFrame({
+        'c': [nan, nan, 1.5],
+        'a': Series([1, None, None], dtype='Int64'),
+        'b': ['x', nan, nan],
+    }, columns=['c', 'a', 'b'])
+    assert_frame_equal(expected, actual)
+    assert_frame_equal(
+        expected.iloc[:0], stack([], ['c', 'a', 'b'], dtypes),
+        check_index_type=False)
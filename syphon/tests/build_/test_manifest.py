@@ -0,0 +1,106 @@
+"""syphon.tests.build_.test_manifest.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+from syphon.build_._manifest import (
+    current, fingerprint, load, manifest_path, new_files, remove, save)
+
+
+def _make_files(archive_dir, names: list) -> list:
+    files = list()
+    for name in names:
+        archive_dir.join(name).write('a,b\n1,2\n', ensure=True)
+        files.append(str(archive_dir.join(name)))
+    return files
+
+
+def test_fingerprint(archive_dir):
+    files = _make_files(archive_dir, ['x/1.csv', 'y/2.csv'])
+
+    sources = fingerprint(str(archive_dir), files)
+
+    assert list(sources.keys()) == [
+        os.path.join('x', '1.csv'), os.path.join('y', '2.csv')]
+    for size, mtime in sources.values():
+        assert size == 8
+        assert isinstance(mtime, int)
+
+
+def test_current(archive_dir):
+    files = _make_files(archive_dir, ['x/1.csv', 'y/2.csv'])
+    archive = str(archive_dir)
+    manifest = {
+        'archive': archive,
+        'columns': ['a', 'b'],
+        'options': {'filter': 'a > 1'},
+        'sources': fingerprint(archive, files),
+    }
+
+    sources = fingerprint(archive, files)
+    assert current(manifest, archive, sources, {'filter': 'a > 1'})
+
+    assert not current(manifest, archive, sources, {})
+    assert not current(manifest, 'elsewhere', sources, {'filter': 'a > 1'})
+    # new
+    files += _make_files(archive_dir, ['z/3.csv'])
+    sources = fingerprint(archive, files)
+    assert not current(manifest, archive, sources, {'filter': 'a > 1'})
+    # deleted
+    sources = fingerprint(archive, files[1:2])
+    assert not current(manifest, archive, sources, {'filter': 'a > 1'})
+
+
+def test_load_save_remove(archive_dir, cache_file):
+    files = _make_files(archive_dir, ['x/1.csv'])
+    sources = fingerprint(str(archive_dir), files)
+
+    assert load(str(cache_file)) is None
+
+    cache_file.write('a,b\n1,2\n')
+    assert load(str(cache_file)) is None
+
+    save(str(cache_file), str(archive_dir), sources, ['a', 'b'], {})
+    assert os.path.exists(manifest_path(str(cache_file)))
+
+    manifest = load(str(cache_file))
+    assert manifest['archive'] == str(archive_dir)
+    assert manifest['columns'] == ['a', 'b']
+    assert manifest['options'] == {}
+    assert manifest['sources'] == sources
+
+    remove(str(cache_file))
+    assert not os.path.exists(manifest_path(str(cache_file)))
+    assert load(str(cache_file)) is None
+
+    remove(str(cache_file))
+
+
+def test_new_files(archive_dir):
+    files = _make_files(archive_dir, ['x/1.csv', 'y/2.csv'])
+    archive = str(archive_dir)
+    manifest = {
+        'archive': archive,
+        'columns': ['a', 'b'],
+        'options': {},
+        'sources': fingerprint(archive, files[:1]),
+    }
+
+    sources = fingerprint(archive, files)
+    assert new_files(manifest, archive, sources, {}) == [
+        os.path.join('y', '2.csv')]
+
+    assert new_files(manifest, archive, sources, {'x': 1}) is None
+    assert new_files(manifest, 'elsewhere', sources, {}) is None
+
+    # modified
+    archive_dir.join('x', '1.csv').write('a,b\n1,2\n3,4\n')
+    sources = fingerprint(archive, files)
+    assert new_files(manifest, archive, sources, {}) is None
+
+    # deleted
+    sources = fingerprint(archive, files[1:])
+    assert new_files(manifest, archive, sources, {}) is None
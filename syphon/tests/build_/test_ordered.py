@@ -0,0 +1,40 @@
+"""syphon.tests.build_.test_ordered.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import random
+import time
+
+import pytest
+from syphon.build_._ordered import ordered_map
+
+
+def _sleepy_square(value: int) -> int:
+    time.sleep(random.random() / 1000)
+    return value * value
+
+
+@pytest.mark.parametrize('jobs', [0, 1, 2, 8])
+def test_ordered_map(jobs):
+    expected = [x * x for x in range(50)]
+
+    actual = list(ordered_map(_sleepy_square, range(50), jobs))
+
+    assert expected == actual
+
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_ordered_map_error(jobs):
+    def _fail(value: int) -> int:
+        if value == 3:
+            raise ValueError()
+        return value
+
+    actual = list()
+    with pytest.raises(ValueError):
+        for value in ordered_map(_fail, range(10), jobs):
+            actual.append(value)
+
+    assert actual == [0, 1, 2]
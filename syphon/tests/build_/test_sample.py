@@ -0,0 +1,99 @@
+"""syphon.tests.build_.test_sample.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from pandas import DataFrame
+from syphon.build_._sample import Bernoulli, parse, Reservoir
+
+
+def _frames(rows: int, chunksize: int) -> list:
+    values = [str(i) for i in range(rows)]
+    return [
+        DataFrame({'n': values[i:i + chunksize]})
+        for i in range(0, rows, chunksize)
+    ]
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('1000', 1000),
+    ('1', 1),
+    ('0.25', 0.25),
+    ('1.0', 1.0),
+    ('1e-3', 0.001),
+])
+def test_parse(value, expected):
+    actual = parse(value)
+
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+@pytest.mark.parametrize('value', ['0', '-5', '0.0', '1.5', 'half', ''])
+def test_parse_valueerror(value):
+    with pytest.raises(ValueError):
+        parse(value)
+
+
+@pytest.mark.parametrize('chunksize', [1, 7, 1000])
+def test_reservoir(chunksize):
+    reservoir = Reservoir(10, ['n', 'missing'], seed=3)
+    for frame in _frames(100, chunksize):
+        reservoir.add(frame)
+
+    actual = reservoir.result()
+
+    assert reservoir.seen == 100
+    assert list(actual.columns) == ['n', 'missing']
+    assert len(actual) == 10
+    assert actual['n'].is_unique
+    # rows keep the order they were added in
+    assert list(actual['n'].astype(int)) == sorted(actual['n'].astype(int))
+    assert actual['missing'].isnull().all()
+
+
+def test_reservoir_small():
+    reservoir = Reservoir(10, ['n'], seed=3)
+    for frame in _frames(4, 3):
+        reservoir.add(frame)
+
+    assert list(reservoir.result()['n']) == ['0', '1', '2', '3']
+    assert len(Reservoir(10, ['n']).result()) == 0
+
+
+def test_reservoir_seed():
+    def sample(seed: int) -> list:
+        reservoir = Reservoir(5, ['n'], seed=seed)
+        for frame in _frames(1000, 64):
+            reservoir.add(frame)
+        return list(reservoir.result()['n'])
+
+    assert sample(1) == sample(1)
+    assert sample(1) != sample(2)
+
+
+def test_reservoir_uniform():
+    # each of 20 rows should be picked about a quarter of the time
+    counts = [0] * 20
+    for seed in range(500):
+        reservoir = Reservoir(5, ['n'], seed=seed)
+        for frame in _frames(20, 3):
+            reservoir.add(frame)
+        for value in reservoir.result()['n']:
+            counts[int(value)] += 1
+
+    assert all(90 < count < 160 for count in counts)
+
+
+def test_bernoulli():
+    sampler = Bernoulli(0.1, ['n'], seed=3)
+    for frame in _frames(10000, 999):
+        sampler.add(frame)
+
+    actual = sampler.result()
+
+    assert sampler.seen == 10000
+    assert 800 < len(actual) < 1200
+    assert list(actual['n'].astype(int)) == sorted(actual['n'].astype(int))
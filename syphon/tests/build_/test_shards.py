@@ -0,0 +1,71 @@
+"""syphon.tests.build_.test_shards.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+from pandas import DataFrame, read_csv
+from syphon._csvengine import CsvWriter
+from syphon.build_ import _shards
+
+
+def test_shard_path():
+    assert _shards.shard_path('/a/all.csv', 3) == '/a/all.00003.csv'
+    assert _shards.shard_path('/a/all', 12) == '/a/all.00012'
+
+
+def test_shardwriter(tmpdir):
+    cache = str(tmpdir.join('all.csv'))
+    frame = DataFrame({'a': [str(i) for i in range(7)]})
+
+    writer = _shards.ShardWriter(cache, ['a'], 3, CsvWriter)
+    writer.write(frame.iloc[:2])
+    writer.write(frame.iloc[2:2])
+    writer.write(frame.iloc[2:])
+    writer.close()
+
+    assert writer.shards == [
+        (_shards.shard_path(cache, 0), 3),
+        (_shards.shard_path(cache, 1), 3),
+        (_shards.shard_path(cache, 2), 1),
+    ]
+    actual = [
+        list(read_csv(filepath, dtype=str)['a'])
+        for filepath, _ in writer.shards
+    ]
+    assert actual == [['0', '1', '2'], ['3', '4', '5'], ['6']]
+
+
+def test_shardwriter_empty(tmpdir):
+    cache = str(tmpdir.join('all.csv'))
+
+    writer = _shards.ShardWriter(cache, ['a', 'b'], 3, CsvWriter)
+    writer.close()
+
+    assert writer.shards == [(_shards.shard_path(cache, 0), 0)]
+    assert list(read_csv(writer.shards[0][0]).columns) == ['a', 'b']
+
+
+def test_save_load_remove(tmpdir):
+    cache = str(tmpdir.join('all.csv'))
+    shards = [(_shards.shard_path(cache, i), 2) for i in range(2)]
+    for filepath, _ in shards:
+        tmpdir.join(os.path.basename(filepath)).write('a\n1\n2\n')
+
+    _shards.save(cache, ['a'], shards)
+
+    assert _shards.load(cache) == {
+        'columns': ['a'],
+        'rows': 4,
+        'shards': [
+            {'path': 'all.00000.csv', 'rows': 2},
+            {'path': 'all.00001.csv', 'rows': 2},
+        ],
+    }
+
+    _shards.remove(cache)
+
+    assert os.listdir(str(tmpdir)) == []
+    assert _shards.load(cache) is None
@@ -0,0 +1,51 @@
+"""syphon.tests.build_.test_sort.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from numpy import nan
+from pandas import concat, DataFrame
+from pandas.testing import assert_frame_equal
+from syphon.build_._sort import ExternalSorter, sort_frame
+
+
+def test_sort_frame():
+    frame = DataFrame({
+        'a': ['b', nan, 'a', 'b', 'a'],
+        'b': ['2', '1', '2', '1', nan],
+        'c': ['0', '1', '2', '3', '4'],
+    })
+
+    actual = sort_frame(frame, ['a', 'b'])
+
+    assert list(actual['c']) == ['2', '4', '3', '0', '1']
+
+
+@pytest.mark.parametrize('buffer_rows', [1, 3, 100])
+def test_externalsorter(tmpdir, buffer_rows):
+    frames = [
+        DataFrame({'key': ['c', nan, 'a'], 'value': ['0', '1', '2']}),
+        DataFrame({'key': ['b', 'a'], 'value': ['3', '4']}),
+        DataFrame({'value': ['5']}),
+        DataFrame({'key': ['a,"x"', 'c'], 'value': ['6', '7']}),
+    ]
+    expected = sort_frame(
+        concat(frames, ignore_index=True, sort=False), ['key'])
+    expected = expected.reset_index(drop=True)
+
+    sorter = ExternalSorter(['key'], ['value'], buffer_rows, str(tmpdir))
+    try:
+        for frame in frames:
+            sorter.add(frame)
+        actual = concat(list(sorter.sorted(batch_rows=2)),
+                        ignore_index=True)
+    finally:
+        sorter.close()
+
+    assert list(actual['value']) == ['2', '4', '6', '3', '0', '7', '1', '5']
+    assert_frame_equal(expected[['value', 'key']], actual)
+    assert os.listdir(str(tmpdir)) == []
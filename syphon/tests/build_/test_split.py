@@ -0,0 +1,33 @@
+"""syphon.tests.build_.test_split.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+from pandas import DataFrame, read_csv
+from syphon.build_._split import WriterPool
+
+
+def test_writerpool(tmpdir):
+    pool = WriterPool(str(tmpdir), ['a', 'b'], size=2)
+    for name, value in [('x', '1'), ('y', '2'), ('x', '3'), ('z', '4'),
+                        ('y', '5'), ('x', '6')]:
+        pool.write(name, DataFrame({'a': [value]}))
+    pool.close()
+
+    assert pool.files == [
+        os.path.join(str(tmpdir), name + '.csv') for name in 'xyz']
+
+    actual = dict()
+    for filepath in pool.files:
+        frame = DataFrame(read_csv(filepath, dtype=str))
+        assert list(frame.columns) == ['a', 'b']
+        actual[os.path.basename(filepath)] = list(frame['a'])
+
+    assert actual == {
+        'x.csv': ['1', '3', '6'],
+        'y.csv': ['2', '5'],
+        'z.csv': ['4'],
+    }
@@ -0,0 +1,56 @@
+"""syphon.tests.build_.test_walk.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from syphon.build_._walk import walk
+
+
+@pytest.fixture
+def tree(tmpdir):
+    for path in ['root.csv', 'b/stray.csv', 'b/y/2.csv', 'b/x/1.csv',
+                 'b/x/3.csv', 'a/x/0.csv', 'a/x/deep/4.csv', 'a/x/.hidden',
+                 'a/.5/5.csv', 'c/z/.keep']:
+        tmpdir.join(*path.split('/')).ensure()
+    return tmpdir
+
+
+def relative(root, files):
+    return [
+        os.path.relpath(file, str(root)).replace(os.sep, '/')
+        for file in files
+    ]
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_walk_depth(tree, workers):
+    actual = walk(str(tree), 2, workers=workers)
+
+    assert relative(tree, actual) == [
+        'a/.5/5.csv', 'a/x/0.csv', 'b/x/1.csv', 'b/x/3.csv', 'b/y/2.csv']
+
+
+def test_walk_levels(tree):
+    actual = walk(str(tree), 2, [None, {'x'}])
+
+    assert relative(tree, actual) == ['a/x/0.csv', 'b/x/1.csv', 'b/x/3.csv']
+
+    actual = walk(str(tree), 2, [{'b', 'c'}, None])
+
+    assert relative(tree, actual) == ['b/x/1.csv', 'b/x/3.csv', 'b/y/2.csv']
+
+
+def test_walk_all(tree):
+    actual = walk(str(tree))
+
+    assert relative(tree, actual) == [
+        'root.csv', 'b/stray.csv', 'a/.5/5.csv', 'a/x/0.csv', 'b/x/1.csv', 'b/x/3.csv',
+        'b/y/2.csv', 'a/x/deep/4.csv']
+
+
+def test_walk_missing(tmpdir):
+    assert walk(str(tmpdir.join('missing'))) == list()
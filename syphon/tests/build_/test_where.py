@@ -0,0 +1,40 @@
+"""syphon.tests.build_.test_where.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import pytest
+from sortedcontainers import SortedDict
+from syphon.build_._where import levels, parse
+
+
+class TestParse(object):
+    def test_parse(self):
+        actual = parse(['b=2,a=1', 'b=1,b=2', 'c=x=y'])
+
+        assert actual == SortedDict({
+            'a': ['1'],
+            'b': ['1', '2'],
+            'c': ['x=y'],
+        })
+
+    @pytest.mark.parametrize('expression', ['a', 'a=', '=1', 'a=1,,b=2'])
+    def test_parse_valueerror(self, expression):
+        with pytest.raises(ValueError):
+            parse([expression])
+
+
+class TestLevels(object):
+    schema = SortedDict({'0': 'Lot', '1': 'Wafer', '2': 'Station'})
+
+    def test_levels(self):
+        where = SortedDict({'Station': ['Probe A.'], 'Lot': ['L1', 'l2']})
+
+        actual = levels(TestLevels.schema, where)
+
+        assert actual == [{'l1', 'l2'}, None, {'probe_a'}]
+
+    def test_levels_valueerror(self):
+        with pytest.raises(ValueError):
+            levels(TestLevels.schema, SortedDict({'Serial': ['1']}))
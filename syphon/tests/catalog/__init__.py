@@ -0,0 +1,6 @@
+"""syphon.tests.catalog.__init__.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
@@ -0,0 +1,87 @@
+"""syphon.tests.catalog.test_catalog.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from pandas import read_csv
+from sortedcontainers import SortedDict
+from syphon import Context
+from syphon.archive import archive
+from syphon.catalog import catalog, Catalog
+from syphon.init import init
+
+from .. import get_data_path
+
+
+def _catalog(context: Context) -> tuple:
+    with Catalog(os.path.join(context.archive, context.catalog_file)) as db:
+        files = db.files()
+        columns = [db.columns(path) for path, _, _, _ in files]
+        return files, columns, db.rows_by('Species'), db.rows_by('PetalColor')
+
+
+@pytest.mark.parametrize('raw', [False, True])
+def test_archive_catalog(archive_dir, raw):
+    context = Context()
+    context.archive = str(archive_dir)
+    context.data = os.path.join(get_data_path(), 'iris_plus.csv')
+    context.raw = raw
+    context.schema = SortedDict({'0': 'Species', '1': 'PetalColor'})
+
+    init(context)
+    archive(context)
+
+    files, columns, species, colors = _catalog(context)
+
+    data = read_csv(context.data, dtype=str)
+    assert species == sorted(data.groupby('Species').size().items())
+    assert colors == sorted(data.groupby('PetalColor').size().items())
+    assert sum(rows for _, _, _, rows in files) == len(data)
+    assert columns == [list(data.columns)] * len(files)
+
+
+def test_archive_without_catalog(archive_dir):
+    context = Context()
+    context.archive = str(archive_dir)
+    context.data = os.path.join(get_data_path(), 'iris.csv')
+    context.schema = SortedDict({'0': 'Name'})
+
+    archive(context)
+
+    assert not archive_dir.join(context.catalog_file).exists()
+
+
+def test_init_existing_archive(archive_dir):
+    archive_dir.join('a', 'data.csv').write('Name\na\n', ensure=True)
+
+    context = Context()
+    context.archive = str(archive_dir)
+    context.schema = SortedDict({'0': 'Name'})
+
+    init(context)
+
+    assert not archive_dir.join(context.catalog_file).exists()
+
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_catalog(archive_dir, jobs):
+    context = Context()
+    context.archive = str(archive_dir)
+    context.data = os.path.join(get_data_path(), 'iris_plus.csv')
+    context.schema = SortedDict({'0': 'Species', '1': 'PetalColor'})
+
+    init(context)
+    archive(context)
+    expected = _catalog(context)
+
+    archive_dir.join(context.catalog_file).remove()
+    context.jobs = jobs
+    context.schema = None
+
+    catalog(context)
+
+    assert _catalog(context) == expected
@@ -0,0 +1,91 @@
+"""syphon.tests.catalog.test_database.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+from syphon.catalog import Catalog
+from syphon.catalog.database import record
+
+
+def _record(root, path: str, rows: int, keys: list) -> tuple:
+    file = root.join(*path.split('/'))
+    file.write('a,b\n' + '1,2\n' * rows, ensure=True)
+    return record(str(root), str(file), rows, ['a', 'b'], keys)
+
+
+def test_catalog_wal(tmpdir):
+    filepath = str(tmpdir.join('.catalog.db'))
+    with Catalog(filepath) as catalog:
+        mode = catalog._connection.execute('PRAGMA journal_mode').fetchone()
+
+    assert mode == ('wal',)
+
+
+def test_catalog_files(tmpdir):
+    records = [
+        _record(tmpdir, 'b/1.csv', 3, [('lot', 'b')]),
+        _record(tmpdir, 'a/2.csv', 2, [('lot', 'a')]),
+        _record(tmpdir, 'a-b/3.csv', 1, [('lot', 'a-b')]),
+    ]
+
+    with Catalog(str(tmpdir.join('.catalog.db'))) as catalog:
+        catalog.add(records)
+        actual = catalog.files()
+        assert catalog.columns(os.path.join('a', '2.csv')) == ['a', 'b']
+        assert catalog.columns('missing.csv') is None
+
+    # paths are ordered one directory level at a time, like the walker
+    assert [path.replace(os.sep, '/') for path, _, _, _ in actual] == [
+        'a/2.csv', 'a-b/3.csv', 'b/1.csv']
+    _, size, mtime_ns, rows = actual[0]
+    info = os.stat(str(tmpdir.join('a', '2.csv')))
+    assert (size, mtime_ns, rows) == (info.st_size, info.st_mtime_ns, 2)
+
+
+def test_catalog_add_replaces_files(tmpdir):
+    filepath = str(tmpdir.join('.catalog.db'))
+    with Catalog(filepath) as catalog:
+        catalog.add([_record(tmpdir, 'a/1.csv', 3, [('lot', 'a')])])
+        catalog.add([_record(tmpdir, 'a/1.csv', 5, [('lot', 'a')]),
+                     _record(tmpdir, 'b/1.csv', 1, [('lot', 'b')])])
+
+    with Catalog(filepath) as catalog:
+        assert [rows for _, _, _, rows in catalog.files()] == [5, 1]
+
+        catalog.replace([_record(tmpdir, 'c/1.csv', 4, [('lot', 'c')])])
+        assert [rows for _, _, _, rows in catalog.files()] == [4]
+        assert catalog.rows_by('lot') == [('c', 4)]
+
+
+def test_catalog_headers(tmpdir):
+    first = _record(tmpdir, 'a/1.csv', 1, [('lot', 'a')])
+    second = _record(tmpdir, 'b/1.csv', 1, [('lot', 'b')])
+    second = second[:4] + (['b', 'c'],) + second[5:]
+
+    with Catalog(str(tmpdir.join('.catalog.db'))) as catalog:
+        catalog.add([first, second])
+        actual = catalog.headers()
+
+    assert actual == {
+        os.path.join('a', '1.csv'): ['a', 'b'],
+        os.path.join('b', '1.csv'): ['b', 'c'],
+    }
+
+
+def test_catalog_rows_by(tmpdir):
+    records = [
+        _record(tmpdir, 'a/x/1.csv', 3, [('lot', 'a'), ('tool', 'x')]),
+        _record(tmpdir, 'a/x/2.csv', 2, [('lot', 'a'), ('tool', 'x')]),
+        _record(tmpdir, 'a/y/1.csv', 4, [('lot', 'a'), ('tool', 'y')]),
+        _record(tmpdir, 'b/x/1.csv', 1, [('lot', 'b'), ('tool', 'x')]),
+    ]
+
+    with Catalog(str(tmpdir.join('.catalog.db'))) as catalog:
+        catalog.add(records)
+
+        assert catalog.rows_by('lot') == [('a', 9), ('b', 1)]
+        assert catalog.rows_by('tool') == [('x', 6), ('y', 4)]
+        assert catalog.rows_by('missing') == []
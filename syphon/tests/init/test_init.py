@@ -57,3 +57,22 @@ def test_init_fileexistserror(archive_dir, init_schema_fixture):
 
     with pytest.raises(FileExistsError):
         init(context)
+
+
+def test_init_typed(archive_dir, init_schema_fixture):
+    archive_dir.mkdir('a').join('data.csv').write(
+        'column1,column2\n1,x\n2,3.5\n')
+
+    context = Context()
+    context.archive = str(archive_dir)
+    context.dtypes = SortedDict({'column1': 'float64', 'column3': 'int64'})
+    context.schema = init_schema_fixture
+
+    init(context)
+
+    dtypes_path = join(context.archive, context.dtypes_file)
+    with open(dtypes_path, 'r') as f:
+        actual = loads(f.read())
+
+    assert actual == {
+        'column1': 'float64', 'column2': 'str', 'column3': 'int64'}
@@ -0,0 +1,83 @@
+"""syphon.tests.schema.test_dtypes.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from json import loads
+
+import pytest
+from numpy import nan
+from pandas import DataFrame
+from sortedcontainers import SortedDict
+
+from syphon.schema import (infer_dtypes, load_dtypes, parse_dtypes,
+                           save_dtypes, widen_dtypes)
+
+
+def test_parse_dtypes():
+    actual = parse_dtypes(['a=int64,b=str', 'c=float64', 'a=int64'])
+
+    assert actual == SortedDict({'a': 'int64', 'b': 'str', 'c': 'float64'})
+
+
+@pytest.mark.parametrize('expressions', [
+    ['a'],
+    ['=str'],
+    ['a=int'],
+    ['a=str,'],
+    ['a=str', 'a=int64'],
+])
+def test_parse_dtypes_valueerror(expressions):
+    with pytest.raises(ValueError):
+        parse_dtypes(expressions)
+
+
+@pytest.mark.parametrize('values, expected', [
+    (['1', '-20', nan, '0'], 'int64'),
+    (['9007199254740991', '1'], 'int64'),
+    (['1.5', '2', '-3e2'], 'float64'),
+    (['007', '8'], 'str'),
+    (['+7', '8'], 'str'),
+    (['-0', '8'], 'str'),
+    ([' 7', '8'], 'str'),
+    (['1_000', '8'], 'str'),
+    (['9007199254740993', '1'], 'str'),
+    (['123456789012345678901', '1.5'], 'str'),
+    (['1', 'a'], 'str'),
+])
+def test_infer_dtypes(values, expected):
+    frame = DataFrame({'x': values}, dtype=object)
+
+    assert infer_dtypes(frame) == SortedDict({'x': expected})
+
+
+def test_infer_dtypes_empty_column():
+    frame = DataFrame({'x': [nan, nan], 'y': ['a', nan]}, dtype=object)
+
+    assert infer_dtypes(frame) == SortedDict({'y': 'str'})
+
+
+def test_widen_dtypes():
+    dtypes = {'a': 'int64', 'b': 'float64', 'c': 'str', 'd': 'int64'}
+    other = {'a': 'float64', 'b': 'int64', 'c': 'int64', 'e': 'float64'}
+
+    assert widen_dtypes(dtypes, other) == SortedDict({
+        'a': 'float64',
+        'b': 'float64',
+        'c': 'str',
+        'd': 'int64',
+        'e': 'float64',
+    })
+
+
+def test_save_load_dtypes(tmpdir):
+    filepath = tmpdir.join('.dtypes.json')
+    filepath.write('content')
+    dtypes = SortedDict({'b': 'str', 'a': 'int64'})
+
+    save_dtypes(dtypes, str(filepath))
+
+    assert loads(filepath.read()) == dict(dtypes)
+    assert load_dtypes(str(filepath)) == dtypes
+    assert tmpdir.listdir() == [filepath]
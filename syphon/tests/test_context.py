@@ -7,6 +7,10 @@
 from syphon import Context
 
 
+def test_context_agg_property_default():
+    assert Context().agg is None
+
+
 def test_context_archive_property_default():
     assert Context().archive is None
 
@@ -15,10 +19,90 @@ def test_context_cache_property_default():
     assert Context().cache is None
 
 
+def test_context_catalog_file_property_default():
+    assert Context().catalog_file is Context()._catalog_file
+    assert isinstance(Context().catalog_file, str)
+
+
+def test_context_check_catalog_property_default():
+    assert Context().check_catalog is False
+    assert isinstance(Context().check_catalog, bool)
+
+
+def test_context_chunksize_property_default():
+    assert Context().chunksize is None
+
+
+def test_context_columns_property_default():
+    assert Context().columns is None
+
+
+def test_context_combine_property_default():
+    assert Context().combine is None
+
+
 def test_context_data_property_default():
     assert Context().data is None
 
 
+def test_context_distinct_property_default():
+    assert Context().distinct is False
+    assert isinstance(Context().distinct, bool)
+
+
+def test_context_distinct_buffer_property_default():
+    assert Context().distinct_buffer == 1000000
+    assert isinstance(Context().distinct_buffer, int)
+
+
+def test_context_distinct_key_property_default():
+    assert Context().distinct_key is None
+
+
+def test_context_dtypes_property_default():
+    assert Context().dtypes is None
+
+
+def test_context_dtypes_file_property_default():
+    assert Context().dtypes_file is Context()._dtypes_file
+    assert isinstance(Context().dtypes_file, str)
+
+
+def test_context_engine_property_default():
+    assert Context().engine == 'pandas'
+    assert isinstance(Context().engine, str)
+
+
+def test_context_filter_property_default():
+    assert Context().filter is None
+
+
+def test_context_format_property_default():
+    assert Context().format is None
+
+
+def test_context_group_by_property_default():
+    assert Context().group_by is None
+
+
+def test_context_incremental_property_default():
+    assert Context().incremental is False
+    assert isinstance(Context().incremental, bool)
+
+
+def test_context_jobs_property_default():
+    assert Context().jobs == 1
+    assert isinstance(Context().jobs, int)
+
+
+def test_context_limit_property_default():
+    assert Context().limit is None
+
+
+def test_context_max_rows_property_default():
+    assert Context().max_rows is None
+
+
 def test_context_meta_property_default():
     assert Context().meta is None
 
@@ -28,6 +112,24 @@ def test_context_overwrite_property_default():
     assert isinstance(Context().overwrite, bool)
 
 
+def test_context_provenance_property_default():
+    assert Context().provenance is None
+
+
+def test_context_queue_depth_property_default():
+    assert Context().queue_depth == 2
+    assert isinstance(Context().queue_depth, int)
+
+
+def test_context_raw_property_default():
+    assert Context().raw is False
+    assert isinstance(Context().raw, bool)
+
+
+def test_context_sample_property_default():
+    assert Context().sample is None
+
+
 def test_context_schema_property_default():
     assert Context().schema is None
 
@@ -37,6 +139,41 @@ def test_context_schema_file_property_default():
     assert isinstance(Context().schema_file, str)
 
 
+def test_context_seed_property_default():
+    assert Context().seed is None
+
+
+def test_context_shards_property_default():
+    assert Context().shards is None
+
+
+def test_context_sort_buffer_property_default():
+    assert Context().sort_buffer == 1000000
+    assert isinstance(Context().sort_buffer, int)
+
+
+def test_context_sort_by_property_default():
+    assert Context().sort_by is None
+
+
+def test_context_split_by_property_default():
+    assert Context().split_by is None
+
+
+def test_context_typed_property_default():
+    assert Context().typed is False
+    assert isinstance(Context().typed, bool)
+
+
+def test_context_update_property_default():
+    assert Context().update is False
+    assert isinstance(Context().update, bool)
+
+
 def test_context_verbose_property_default():
     assert Context().verbose is False
     assert isinstance(Context().verbose, bool)
+
+
+def test_context_where_property_default():
+    assert Context().where is None
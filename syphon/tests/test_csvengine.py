@@ -0,0 +1,175 @@
+"""syphon.tests.test_csvengine.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from numpy import nan
+from pandas import concat, DataFrame, read_csv as pandas_read_csv, Series
+from pandas.errors import EmptyDataError
+from pandas.testing import assert_frame_equal
+from syphon._csvengine import ENGINES, read_csv, read_csv_chunks, write_csv
+
+from . import get_data_path
+
+
+@pytest.fixture(params=[
+    'auto-mpg.csv',
+    'iris.csv',
+    'iris_plus.csv',
+    'tic-tac-toe-endgame.csv',
+])
+def data_file(request):
+    return os.path.join(get_data_path(), request.param)
+
+
+@pytest.fixture(params=ENGINES)
+def engine(request):
+    if request.param == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    return request.param
+
+
+def test_read_csv(data_file, engine):
+    expected = DataFrame(pandas_read_csv(data_file, dtype=str))
+
+    actual = read_csv(data_file, engine)
+
+    assert_frame_equal(expected, actual)
+
+
+def test_read_csv_empty(tmpdir, engine):
+    empty_file = tmpdir.join('empty.csv')
+    empty_file.write('')
+
+    with pytest.raises(EmptyDataError):
+        read_csv(str(empty_file), engine)
+
+
+def test_write_csv(data_file, engine, tmpdir):
+    frame = DataFrame(pandas_read_csv(data_file, dtype=str))
+    expected_file = tmpdir.join('expected.csv')
+    actual_file = tmpdir.join('actual.csv')
+
+    frame.to_csv(str(expected_file), index=False)
+    write_csv(frame, str(actual_file), engine)
+
+    assert expected_file.read() == actual_file.read()
+
+
+def test_write_csv_quoted_values(engine, tmpdir):
+    frame = DataFrame({'a b': ['x,y', 'z'], 'c': ['"q"', None]})
+    expected_file = tmpdir.join('expected.csv')
+    actual_file = tmpdir.join('actual.csv')
+
+    frame.to_csv(str(expected_file), index=False)
+    write_csv(frame, str(actual_file), engine)
+
+    assert expected_file.read() == actual_file.read()
+
+
+@pytest.mark.parametrize('columns', [
+    ['Name'],
+    ['PetalWidth', 'Missing', 'Index'],
+    ['Missing'],
+])
+def test_read_csv_columns(engine, columns):
+    data_file = os.path.join(get_data_path(), 'iris.csv')
+    frame = DataFrame(pandas_read_csv(data_file, dtype=str))
+    present = [c for c in frame.columns if c in columns]
+    expected = frame[present]
+    if len(present) == 0:
+        expected = DataFrame()
+
+    actual = read_csv(data_file, engine, columns)
+
+    assert_frame_equal(expected, actual, check_index_type=False)
+
+    chunks = list(read_csv_chunks(data_file, 40, engine, columns))
+    if len(present) == 0:
+        assert all(len(chunk) == 0 for chunk in chunks)
+    else:
+        assert_frame_equal(expected, concat(chunks))
+
+
+def test_read_csv_dtypes(engine, tmpdir):
+    data_file = tmpdir.join('typed.csv')
+    data_file.write('a,b,c,d\n1,2.5,x,007\n,3,,1\n')
+    dtypes = {'a': 'int64', 'b': 'float64', 'c': 'str'}
+
+    expected = DataFrame({
+        'a': Series([1, None], dtype='Int64'),
+        'b': [2.5, 3.0],
+        'c': ['x', nan],
+        'd': ['007', '1'],
+    }, columns=['a', 'b', 'c', 'd'])
+
+    assert_frame_equal(
+        expected, read_csv(str(data_file), engine, dtypes=dtypes))
+    assert_frame_equal(expected, concat(
+        read_csv_chunks(str(data_file), 1, engine, dtypes=dtypes)),
+        check_index_type=False)
+
+
+def test_read_csv_dtypes_valueerror(tmpdir):
+    data_file = tmpdir.join('typed.csv')
+    data_file.write('a\n1\n2.5\n')
+
+    with pytest.raises(ValueError):
+        read_csv(str(data_file), dtypes={'a': 'int64'})
+
+
+def test_write_csv_dtypes(engine, tmpdir):
+    frame = DataFrame({
+        'a': Series([1, None], dtype='Int64'),
+        'b': [3.0, nan],
+        'c': ['x', nan],
+    }, columns=['a', 'b', 'c'])
+    expected_file = tmpdir.join('expected.csv')
+    actual_file = tmpdir.join('actual.csv')
+
+    frame.to_csv(str(expected_file), index=False)
+    write_csv(frame, str(actual_file), engine)
+
+    assert expected_file.read() == 'a,b,c\n1,3.0,x\n,,\n'
+    assert expected_file.read() == actual_file.read()
+
+
+def test_write_csv_old_pyarrow(monkeypatch, tmpdir):
+    pyarrow_csv = pytest.importorskip('pyarrow.csv')
+    WriteOptions = pyarrow_csv.WriteOptions
+
+    def write_options(include_header=True):
+        return WriteOptions(include_header=include_header)
+
+    monkeypatch.setattr(pyarrow_csv, 'WriteOptions', write_options)
+
+    frame = DataFrame({'a': ['x', 'y'], 'b': ['1', None]})
+    expected_file = tmpdir.join('expected.csv')
+    actual_file = tmpdir.join('actual.csv')
+
+    frame.to_csv(str(expected_file), index=False)
+    write_csv(frame, str(actual_file), 'pyarrow')
+
+    assert expected_file.read() == actual_file.read()
+
+
+def test_read_csv_missing_values(engine, tmpdir):
+    data_file = tmpdir.join('missing.csv')
+    data_file.write('a,b\nx,<NA>\nNULL,y\n')
+    expected = DataFrame(pandas_read_csv(str(data_file), dtype=str))
+
+    assert_frame_equal(expected, read_csv(str(data_file), engine))
+
+
+def test_read_csv_short_rows(engine, tmpdir):
+    data_file = tmpdir.join('short.csv')
+    data_file.write('a,b,c\n1,2,3\n4\n5,6\n')
+    expected = DataFrame(pandas_read_csv(str(data_file), dtype=str))
+
+    assert_frame_equal(expected, read_csv(str(data_file), engine))
+    assert_frame_equal(expected, concat(
+        read_csv_chunks(str(data_file), 1, engine)), check_index_type=False)
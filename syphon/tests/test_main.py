@@ -4,6 +4,7 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
+import pytest
 from syphon import __version__
 from syphon.__main__ import _main
 
@@ -13,3 +14,17 @@ def test_main_version(capsys):
     _main(arguments)
     output = capsys.readouterr()
     assert output.out == '{}\n'.format(__version__)
+
+
+@pytest.mark.parametrize('option, value', [
+    ('--where', 'x'),
+    ('--filter', 'x >'),
+])
+def test_main_error_stdout(capsys, tmpdir, option, value):
+    tmpdir.join('data.csv').write('x,y\n1,2\n')
+
+    arguments = ['syphon', 'build', str(tmpdir), '-', option, value]
+    assert _main(arguments) == 1
+    output = capsys.readouterr()
+    assert output.out == ''
+    assert output.err != ''